@@ -0,0 +1,26 @@
+-- 노무사 드롭다운용 DISTINCT 집계 함수
+-- LawyerService가 전체 행을 받아 파이썬에서 중복 제거하는 대신
+-- 서버에서 고유값만 돌려받습니다 (전송량: N행 → |distinct|행).
+-- Supabase SQL 에디터에서 실행해주세요.
+
+CREATE OR REPLACE FUNCTION get_distinct_specialties()
+RETURNS TABLE (specialty text) AS $$
+    SELECT DISTINCT unnest(specialties) AS specialty
+    FROM lawyers
+    WHERE is_active = true
+    ORDER BY specialty;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION get_distinct_locations()
+RETURNS TABLE (city text) AS $$
+    SELECT DISTINCT split_part(office_address, ' ', 1) AS city
+    FROM lawyers
+    WHERE is_active = true
+      AND office_address IS NOT NULL
+      AND office_address <> ''
+    ORDER BY city;
+$$ LANGUAGE sql STABLE;
+
+-- specialties 배열 필터링 가속용 GIN 인덱스 (없으면 생성)
+CREATE INDEX IF NOT EXISTS idx_lawyers_specialties_gin
+    ON lawyers USING gin(specialties);
@@ -0,0 +1,9 @@
+-- 판례 content_hash 컬럼 추가
+-- fallback 임베딩은 제목+요약의 순수 함수이므로, 입력 해시를 함께 저장해
+-- 재실행 시 내용이 같은 행의 재계산/재업데이트를 건너뛸 수 있게 합니다.
+-- Supabase SQL 에디터에서 실행해주세요.
+
+ALTER TABLE precedents ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_precedents_content_hash
+    ON precedents(content_hash);
@@ -0,0 +1,53 @@
+-- 판례 임베딩 컬럼/인덱스 설정 (pgvector)
+-- generate_embeddings.py(SBERT all-MiniLM-L6-v2, 384차원)가 쓰는 컬럼을
+-- jsonb가 아닌 vector(384)로 유지하고 HNSW 인덱스를 걸어
+-- 유사도 검색을 클라이언트 O(N·384) 코사인 루프 대신
+-- 서버측 ORDER BY embedding <=> query (sub-linear)로 처리할 수 있게 합니다.
+-- Supabase SQL 에디터에서 실행해주세요.
+
+-- 1. pgvector 확장
+CREATE EXTENSION IF NOT EXISTS vector;
+
+-- 2. embedding 컬럼 (없으면 추가, 있으면 vector(384)로 변환)
+ALTER TABLE precedents ADD COLUMN IF NOT EXISTS embedding vector(384);
+
+-- 기존에 다른 타입(jsonb 등)으로 저장된 경우:
+-- ALTER TABLE precedents ALTER COLUMN embedding TYPE vector(384)
+--     USING embedding::text::vector(384);
+
+-- 3. HNSW 인덱스 (pgvector >= 0.5) - 코사인 거리 기준
+CREATE INDEX IF NOT EXISTS idx_precedents_embedding_hnsw
+    ON precedents USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+-- pgvector < 0.5 환경에서는 대신 ivfflat 사용:
+-- CREATE INDEX IF NOT EXISTS idx_precedents_embedding_ivfflat
+--     ON precedents USING ivfflat (embedding vector_cosine_ops)
+--     WITH (lists = 100);
+
+-- 4. 서버측 유사도 검색용 RPC
+CREATE OR REPLACE FUNCTION match_precedents(
+    query_embedding vector(384),
+    match_count integer DEFAULT 10
+)
+RETURNS TABLE (
+    id uuid,
+    title varchar,
+    summary text,
+    similarity float
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT p.id, p.title, p.summary,
+           1 - (p.embedding <=> query_embedding) AS similarity
+    FROM precedents p
+    WHERE p.is_active = true
+      AND p.embedding IS NOT NULL
+    ORDER BY p.embedding <=> query_embedding
+    LIMIT match_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 5. (선택) pgvector >= 0.7이면 halfvec로 저장 용량을 추가로 절반
+-- ALTER TABLE precedents ALTER COLUMN embedding TYPE halfvec(384)
+--     USING embedding::halfvec(384);
@@ -22,13 +22,22 @@ load_dotenv()
 from app.utils.logging_config import setup_logging
 setup_logging(level=os.getenv("LOG_LEVEL", "INFO"))
 
+# orjson 응답 직렬화 - 선택적 (없으면 FastAPI 기본 JSONResponse)
+try:
+    from fastapi.responses import ORJSONResponse
+    import orjson  # noqa: F401 - ORJSONResponse가 요구하는 의존성 확인
+    _default_response_class = ORJSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as _default_response_class
+
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(
     title="SANZERO",
     description="AI 기반 산업재해 보상 서비스 플랫폼",
     version="1.0.0",
     docs_url="/docs" if os.getenv("ENVIRONMENT") == "development" else None,
-    redoc_url="/redoc" if os.getenv("ENVIRONMENT") == "development" else None
+    redoc_url="/redoc" if os.getenv("ENVIRONMENT") == "development" else None,
+    default_response_class=_default_response_class
 )
 
 # 정적 파일 및 템플릿 설정
@@ -148,6 +157,12 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """앱 종료 시 정리 작업"""
+    # Supabase REST용 httpx 커넥션 풀 정리
+    try:
+        from app.utils.database import close_http_client
+        await close_http_client()
+    except Exception as e:
+        print(f"⚠️  HTTP 클라이언트 정리 실패: {e}")
 
     print("🛑 SANZERO 서비스가 종료되었습니다.")
 
@@ -894,7 +894,7 @@ async def get_search_statistics():
 async def get_cache_statistics_api():
     """캐시 통계 및 상태 확인 API"""
     try:
-        stats = get_cache_statistics()
+        stats = await get_cache_statistics()
         return JSONResponse(content={
             "status": "success",
             "cache_stats": stats,
@@ -502,6 +502,19 @@ class LawyerService:
     async def get_unique_specialties() -> List[str]:
         """실제 DB에서 모든 노무사의 전문분야 목록 조회"""
         try:
+            # 서버측 DISTINCT (전송량: 전체 행 → 고유값만)
+            # - add_lawyer_distinct_functions.sql 적용 시
+            try:
+                rpc_result = supabase.rpc("get_distinct_specialties", {}).execute()
+                if rpc_result.data:
+                    specialties = [row["specialty"] for row in rpc_result.data]
+                    LawyerService.logger.info(
+                        f"Found {len(specialties)} unique specialties (server-side)")
+                    return specialties
+            except Exception as rpc_error:
+                LawyerService.logger.debug(
+                    f"DISTINCT RPC unavailable ({rpc_error}), falling back to full scan")
+
             result = supabase.table("lawyers")\
                 .select("specialties")\
                 .eq("is_active", True)\
@@ -536,10 +549,41 @@ class LawyerService:
                 "척추협착증", "퇴행성관절염", "특수 고용직 및 프리렌서"
             ]
 
+    @staticmethod
+    def _normalize_city(city: str) -> str:
+        """주소 첫 토큰을 드롭다운용 시/도 명칭으로 정규화"""
+        if "특별시" in city:
+            city = city.replace("특별시", "")
+        elif "광역시" in city:
+            city = city.replace("광역시", "")
+        elif "도" in city:
+            city = city.replace("도", "")
+
+        return {
+            "충청남": "충남", "충청북": "충북",
+            "전라남": "전남", "전라북": "전북",
+            "경상남": "경남", "경상북": "경북",
+        }.get(city, city)
+
     @staticmethod
     async def get_unique_locations() -> List[str]:
         """실제 DB에서 모든 노무사의 지역 목록 조회"""
         try:
+            # 서버측 DISTINCT로 주소 첫 토큰만 받고, 소규모 결과에만
+            # 파이썬 정규화를 적용 - add_lawyer_distinct_functions.sql 적용 시
+            try:
+                rpc_result = supabase.rpc("get_distinct_locations", {}).execute()
+                if rpc_result.data:
+                    cities = {LawyerService._normalize_city(row["city"])
+                              for row in rpc_result.data if row.get("city")}
+                    unique_locations = sorted(cities)
+                    LawyerService.logger.info(
+                        f"Found {len(unique_locations)} unique locations (server-side)")
+                    return unique_locations
+            except Exception as rpc_error:
+                LawyerService.logger.debug(
+                    f"DISTINCT RPC unavailable ({rpc_error}), falling back to full scan")
+
             result = supabase.table("lawyers")\
                 .select("office_address")\
                 .eq("is_active", True)\
@@ -5,9 +5,11 @@ Test_casePedia.ipynb에서 이식된 산재 판례 검색 시스템
 SANZERO FastAPI 애플리케이션과 통합하기 위해 최적화됨
 """
 
+import os
 import pickle
 import joblib
 import zlib
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -16,7 +18,9 @@ import re
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from sklearn.metrics.pairwise import cosine_similarity
+from functools import lru_cache
+from scipy.sparse import csr_matrix
+from sklearn.preprocessing import normalize
 
 # 한글 처리를 위한 의존성 - 선택적 import
 try:
@@ -27,10 +31,82 @@ except ImportError:
     KOREAN_NLP_AVAILABLE = False
     logging.warning("Korean NLP libraries (konlpy) not available. Using basic tokenization.")
 
+# 키워드 부스팅 가속을 위한 의존성 - 선택적 import
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logging.warning("Numba not available. Using Python keyword boosting loop.")
+
+# ANN 인덱스 (대형 코퍼스용) - 선택적 import
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+# ANN 경로 설정: 이 문서 수 미만이면 정확 전수 matvec이 충분히 빠름
+ANN_MIN_DOCS = 5000
+ANN_COMPONENTS = 256
+ANN_CANDIDATE_FACTOR = 10
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 토크나이징 전처리용 정규식 (호출마다 re 캐시 조회를 피하기 위해 미리 컴파일)
+_RE_NONWORD = re.compile(r'[^\w\s]')
+_RE_WS = re.compile(r'\s+')
+
+# 병렬 토크나이징용 워커 상태 (프로세스당 토크나이저 1회만 초기화)
+_worker_searcher = None
+
+
+def _tokenize_batch(texts: List[str]) -> List[List[str]]:
+    """워커 프로세스에서 문서 청크를 토크나이징"""
+    global _worker_searcher
+    if _worker_searcher is None:
+        _worker_searcher = WorkInjuryCaseSearcher.__new__(WorkInjuryCaseSearcher)
+        _worker_searcher.stopwords = set()
+        _worker_searcher.domain_keywords = []
+        _worker_searcher.tokenizer = None
+        _worker_searcher._init_tokenizer()
+    return [_worker_searcher._tokenize(text) for text in texts]
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _boost_kernel(tok_ids, offsets, query_mask, is_domain, base_sims, match_denom, boost_mult):
+        """
+        문서별 공통/도메인 키워드 집계 및 부스팅 계산 커널
+
+        CSR 형태로 평탄화된 문서 토큰 배열을 prange로 병렬 순회하여
+        Python 루프 없이 부스팅된 유사도를 반환합니다.
+        """
+        boosted = base_sims.copy()
+        n_docs = offsets.shape[0] - 1
+        for i in prange(n_docs):
+            # 기본 유사도가 0이면 부스팅해도 0 - 토큰 순회 자체를 건너뜀
+            if base_sims[i] <= 0.0:
+                continue
+
+            common = 0
+            domain = 0
+            for j in range(offsets[i], offsets[i + 1]):
+                tid = tok_ids[j]
+                if query_mask[tid]:
+                    common += 1
+                    domain += is_domain[tid]
+
+            if common > 0:
+                match_ratio = common / match_denom
+                boost_factor = match_ratio * (1.0 + domain * 0.2) * (boost_mult - 1.0)
+                value = base_sims[i] * (1.0 + boost_factor)
+                boosted[i] = value if value < 1.0 else 1.0
+
+        return boosted
+
+
 @dataclass
 class PrecedentResult:
     """판례 검색 결과 데이터 클래스"""
@@ -73,11 +149,45 @@ class WorkInjuryCaseSearcher:
         self.tokenizer = None
         self.is_loaded = False
 
+        # 행 정규화된 TF-IDF 행렬 (load_model에서 계산)
+        self._tfidf_norm = None
+
+        # ANN 인덱스 (대형 코퍼스에서 load_model이 구축)
+        self._ann_index = None
+        self._svd = None
+
+        # 스키마 플래그 (load_model에서 1회 계산, 쿼리마다 columns 조회 방지)
+        self._has_tokens = False
+        self._has_category = False
+
         # 키워드 부스팅 관련 속성들
         self.domain_keywords = []
         self.boost_multiplier = 2.0
         self.stopwords = set()
 
+        # Numba 부스팅 커널용 토큰 인덱스 (load_model에서 구축)
+        self._token_vocab = {}
+        self._tok_ids = None
+        self._tok_offsets = None
+        self._is_domain = None
+
+        # Python 부스팅 루프용 캐시 (load_model에서 구축)
+        self._tokens_list = None
+        self._tokens_valid = None
+        self._domain_keywords_set = set()
+
+        # 쿼리 캐시: 반복 쿼리에서 형태소 분석/벡터화 전체를 건너뜀
+        self._tokenize_cached = lru_cache(maxsize=2048)(
+            lambda text: tuple(self._tokenize(text))
+        )
+        self._vectorize_query = lru_cache(maxsize=2048)(
+            lambda processed: self._build_query_vector(processed)
+        )
+
+        # 쿼리 벡터 직접 구성용 어휘/IDF 캐시 (load_model에서 설정)
+        self._vocab = None
+        self._idf = None
+
         # 한글 토크나이저 초기화
         self._init_tokenizer()
 
@@ -106,13 +216,20 @@ class WorkInjuryCaseSearcher:
                 logger.warning(f"Failed to initialize Korean tokenizers: {e}, {e2}")
                 self.tokenizer = None
 
-    def load_model(self) -> bool:
+    def load_model(self, force: bool = False) -> bool:
         """
         searcher_model.pkl 파일을 로드
 
+        Args:
+            force: True면 이미 로드됐어도 다시 로드 (테스트/수동 갱신용)
+
         Returns:
             bool: 로드 성공 여부
         """
+        # 멱등 처리: 다중 호출이 멀티-MB 해제/언피클을 반복하지 않음
+        if self.is_loaded and not force:
+            return True
+
         try:
             logger.info(f"Loading model from: {self.model_path}")
 
@@ -139,9 +256,58 @@ class WorkInjuryCaseSearcher:
                 logger.error("Required model components missing")
                 return False
 
+            # 쿼리 벡터 직접 구성용 어휘/IDF 캐시
+            # (유니그램 모델일 때만 analyzer 우회 경로 사용 가능)
+            self._vocab = None
+            self._idf = None
+            if getattr(self.vectorizer, 'ngram_range', (1, 1)) == (1, 1):
+                self._vocab = getattr(self.vectorizer, 'vocabulary_', None)
+                self._idf = getattr(self.vectorizer, 'idf_', None)
+
+            # 텍스트 컬럼은 결과 조립(top_k행)에서만 쓰이므로 pyarrow 문자열로
+            # 변환해 RSS를 줄임 (pyarrow 미설치 시 기존 object dtype 유지)
+            try:
+                text_cols = [col for col in ('title', 'noncontent', 'courtname', 'kinda')
+                             if col in self.df.columns]
+                if text_cols:
+                    self.df[text_cols] = self.df[text_cols].astype('string[pyarrow]')
+                    logger.info(f"Text columns converted to pyarrow strings: {text_cols}")
+            except Exception as e:
+                logger.debug(f"pyarrow string conversion skipped: {e}")
+
+            # float64로 저장된 행렬은 float32로 변환해 쿼리당 메모리 대역폭을 절반으로
+            if self.tfidf_matrix.dtype == np.float64:
+                self.tfidf_matrix.data = self.tfidf_matrix.data.astype(np.float32)
+                logger.info("TF-IDF matrix data converted to float32")
+
+            # 행 정규화된 행렬을 미리 계산해 쿼리마다 전체 문서 재정규화를 제거
+            try:
+                self._tfidf_norm = normalize(self.tfidf_matrix, norm='l2', copy=True)
+            except Exception as e:
+                logger.warning(f"TF-IDF matrix normalization failed: {e}")
+                self._tfidf_norm = None
+
+            # 모델이 바뀌면 이전 쿼리 캐시는 무효
+            self._tokenize_cached.cache_clear()
+            self._vectorize_query.cache_clear()
+
+            # tokens 컬럼이 없으면 문서 본문을 병렬로 토크나이징해 백필
+            if 'tokens' not in self.df.columns:
+                self._backfill_tokens_parallel()
+
             # 키워드 부스팅 설정 로드
             self._load_keyword_boosting_config()
 
+            # 부스팅 커널용 토큰 인덱스 구축
+            self._build_token_index()
+
+            # 스키마 플래그 캐시
+            self._has_tokens = 'tokens' in self.df.columns
+            self._has_category = 'category' in self.df.columns
+
+            # 대형 코퍼스용 ANN 인덱스 (hnswlib 설치 시)
+            self._build_ann_index()
+
             self.is_loaded = True
             logger.info(f"Model loaded successfully: {len(self.df)} cases, "
                        f"vocabulary: {len(self.vectorizer.vocabulary_):,}")
@@ -191,6 +357,229 @@ class WorkInjuryCaseSearcher:
             self.boost_multiplier = 2.0
             self.stopwords = {'이', '그', '저', '것', '는', '은'}
 
+    def _build_ann_index(self):
+        """
+        ANN 후보 인덱스 구축 (TruncatedSVD 축소 + HNSW)
+
+        전수 matvec은 코퍼스 크기에 선형이므로, 문서가 많을 때는
+        LSA로 축소한 벡터 위의 HNSW 탐색으로 후보를 추린 뒤 원공간에서
+        정확 재랭킹합니다. hnswlib이 없거나 코퍼스가 작으면 비활성.
+        """
+        self._ann_index = None
+        self._svd = None
+
+        if not HNSWLIB_AVAILABLE or self._tfidf_norm is None:
+            return
+
+        n_docs, n_features = self._tfidf_norm.shape
+        if n_docs < ANN_MIN_DOCS:
+            return
+
+        try:
+            from sklearn.decomposition import TruncatedSVD
+
+            components = min(ANN_COMPONENTS, n_features - 1, n_docs - 1)
+            svd = TruncatedSVD(n_components=components, random_state=0)
+            reduced = svd.fit_transform(self._tfidf_norm)
+            reduced = normalize(reduced).astype(np.float32)
+
+            index = hnswlib.Index(space='cosine', dim=components)
+            index.init_index(max_elements=n_docs, M=32, ef_construction=200)
+            index.add_items(reduced, np.arange(n_docs))
+            index.set_ef(128)
+
+            self._svd = svd
+            self._ann_index = index
+            logger.info(f"ANN index built: {n_docs:,} docs → {components} dims (HNSW)")
+
+        except Exception as e:
+            logger.warning(f"ANN index build failed: {e}, using exact search")
+            self._ann_index = None
+            self._svd = None
+
+    def _ann_base_similarities(self, query_norm, top_k: int) -> Optional[np.ndarray]:
+        """
+        ANN 후보 추출 + 원공간 정확 재랭킹
+
+        후보 행의 유사도만 채운 전체 길이 배열을 반환합니다 (나머지는 0 -
+        부스팅/선택 단계는 0 유사도 행을 이미 건너뜀). 실패 시 None.
+        """
+        if self._ann_index is None or self._svd is None:
+            return None
+
+        try:
+            n_docs = self._tfidf_norm.shape[0]
+            candidate_count = min(top_k * ANN_CANDIDATE_FACTOR, n_docs)
+
+            reduced_query = normalize(
+                self._svd.transform(query_norm)).astype(np.float32)
+            labels, _ = self._ann_index.knn_query(reduced_query, k=candidate_count)
+            candidates = labels[0]
+
+            base_similarities = np.zeros(n_docs, dtype=self._tfidf_norm.dtype)
+            exact = (self._tfidf_norm[candidates] @ query_norm.T)
+            base_similarities[candidates] = np.asarray(exact.todense()).ravel()
+            return base_similarities
+
+        except Exception as e:
+            logger.warning(f"ANN query failed: {e}, using exact search")
+            return None
+
+    def _build_query_vector(self, processed: str):
+        """
+        전처리된 쿼리 문자열에서 TF-IDF 벡터 직접 구성
+
+        이미 토크나이징된 입력이므로 vectorizer.transform의 analyzer
+        체인(정규식 토크나이저 재진입)을 건너뛰고 어휘/IDF 캐시로
+        쿼리 벡터를 만듭니다. 캐시가 없거나 실패하면 transform 폴백.
+        """
+        if self._vocab is None or self._idf is None:
+            return self.vectorizer.transform([processed])
+
+        try:
+            from collections import Counter
+
+            vocab = self._vocab
+            counts = Counter(vocab[token] for token in processed.split()
+                             if token in vocab)
+            if not counts:
+                return csr_matrix((1, len(vocab)), dtype=np.float32)
+
+            cols = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+            tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+            if getattr(self.vectorizer, 'sublinear_tf', False):
+                tf = 1.0 + np.log(tf)
+
+            data = tf * self._idf[cols]
+            return csr_matrix(
+                (data, (np.zeros_like(cols), cols)),
+                shape=(1, len(vocab))
+            )
+
+        except Exception as e:
+            logger.warning(f"Manual query vectorization failed: {e}, using transform")
+            return self.vectorizer.transform([processed])
+
+    def _backfill_tokens_parallel(self):
+        """
+        tokens 컬럼 백필 (문서 본문 기반)
+
+        피클에 tokens가 없는 경우에만 실행되는 1회성 비용이지만
+        27k 문서의 형태소 분석이 startup을 막지 않도록 문서를 청크로
+        나눠 프로세스 풀에서 병렬로 토크나이징합니다.
+        """
+        text_col = next(
+            (col for col in ('noncontent', 'content', 'title') if col in self.df.columns),
+            None
+        )
+        if text_col is None:
+            logger.warning("No text column found, cannot backfill tokens")
+            return
+
+        texts = self.df[text_col].astype(str).tolist()
+        workers = os.cpu_count() or 1
+
+        try:
+            if workers > 1 and len(texts) > 1000:
+                chunk_size = (len(texts) + workers - 1) // workers
+                chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(_tokenize_batch, chunks))
+
+                tokens = [doc_tokens for batch in results for doc_tokens in batch]
+            else:
+                tokens = [self._tokenize(text) for text in texts]
+
+            self.df['tokens'] = tokens
+            logger.info(f"Backfilled tokens for {len(tokens):,} documents "
+                       f"from '{text_col}' ({workers} workers)")
+
+        except Exception as e:
+            logger.warning(f"Parallel token backfill failed: {e}")
+
+    def _build_token_index(self):
+        """
+        tokens 컬럼을 CSR 형태의 int32 배열로 평탄화
+
+        문서별 고유 토큰을 정수 ID로 매핑하여 Numba 부스팅 커널이
+        Python 객체 없이 공통/도메인 키워드를 집계할 수 있게 합니다.
+        """
+        self._token_vocab = {}
+        self._tok_ids = None
+        self._tok_offsets = None
+        self._is_domain = None
+
+        self._tokens_list = None
+        self._tokens_valid = None
+        self._domain_keywords_set = set(self.domain_keywords)
+
+        if self.df is None or 'tokens' not in self.df.columns:
+            return
+
+        # pandas 행 접근 없이 순회할 수 있도록 문서 토큰을 set 리스트로 캐시
+        self._tokens_list = [
+            set(t) if isinstance(t, (list, tuple, set)) and len(t) > 0 else set()
+            for t in self.df['tokens']
+        ]
+
+        # 유효 문서 마스크: 루프에서 pd.isna 류의 per-row 검사를 제거
+        self._tokens_valid = np.fromiter(
+            (len(tokens) > 0 for tokens in self._tokens_list),
+            dtype=bool, count=len(self._tokens_list)
+        )
+
+        if not NUMBA_AVAILABLE:
+            return
+
+        try:
+            vocab = self._token_vocab
+            ids_per_doc = []
+            lengths = []
+
+            for tokens_data in self.df['tokens']:
+                # tokens가 None이거나 빈 값인 문서는 빈 행으로 처리
+                if tokens_data is None or not isinstance(tokens_data, (list, tuple, set)) or len(tokens_data) == 0:
+                    ids_per_doc.append(np.empty(0, dtype=np.int32))
+                    lengths.append(0)
+                    continue
+
+                doc_ids = set()
+                for token in set(tokens_data):
+                    token_id = vocab.get(token)
+                    if token_id is None:
+                        token_id = len(vocab)
+                        vocab[token] = token_id
+                    doc_ids.add(token_id)
+
+                id_array = np.fromiter(doc_ids, dtype=np.int32, count=len(doc_ids))
+                ids_per_doc.append(id_array)
+                lengths.append(id_array.size)
+
+            self._tok_ids = (np.concatenate(ids_per_doc)
+                             if ids_per_doc else np.empty(0, dtype=np.int32))
+            self._tok_offsets = np.concatenate(
+                ([0], np.cumsum(lengths, dtype=np.int64))
+            )
+
+            # 도메인 키워드 마스크
+            is_domain = np.zeros(max(len(vocab), 1), dtype=np.uint8)
+            for keyword in self.domain_keywords:
+                token_id = vocab.get(keyword)
+                if token_id is not None:
+                    is_domain[token_id] = 1
+            self._is_domain = is_domain
+
+            logger.info(f"Token index built for boosting kernel: "
+                       f"{len(vocab):,} unique tokens, {self._tok_ids.size:,} entries")
+
+        except Exception as e:
+            logger.warning(f"Failed to build token index: {e}, using Python boosting loop")
+            self._token_vocab = {}
+            self._tok_ids = None
+            self._tok_offsets = None
+            self._is_domain = None
+
     def _tokenize(self, text: str) -> List[str]:
         """
         텍스트 토크나이징
@@ -205,8 +594,8 @@ class WorkInjuryCaseSearcher:
             return []
 
         # 기본 전처리
-        text = re.sub(r'[^\w\s]', ' ', text)  # 특수문자 제거
-        text = re.sub(r'\s+', ' ', text)      # 여러 공백을 하나로
+        text = _RE_NONWORD.sub(' ', text)  # 특수문자 제거
+        text = _RE_WS.sub(' ', text)       # 여러 공백을 하나로
         text = text.strip().lower()
 
         if self.tokenizer and KOREAN_NLP_AVAILABLE:
@@ -218,28 +607,17 @@ class WorkInjuryCaseSearcher:
                     tokens = self.tokenizer.nouns(text)
 
                 # 길이 2 이상의 토큰만 유지하고 불용어 제거
-                tokens = [token for token in tokens
-                         if len(token) >= 2 and token not in self.stopwords]
-
-                # 도메인 키워드 중복 추가 (Test_casePedia 방식)
-                domain_words = [token for token in tokens if token in self.domain_keywords]
-                final_tokens = list(set(tokens + domain_words))  # 중복 제거
-
-                return final_tokens
+                # (도메인 키워드 가중치는 _apply_keyword_boosting에서 처리하므로
+                #  여기서 중복 추가 후 set으로 되돌리는 과정은 불필요)
+                return [token for token in tokens
+                        if len(token) >= 2 and token not in self.stopwords]
 
             except Exception as e:
                 logger.warning(f"Korean tokenization failed: {e}, using basic split")
 
         # 기본 토크나이징 (fallback)
-        tokens = text.split()
-        tokens = [token for token in tokens
-                 if len(token) >= 2 and token not in self.stopwords]
-
-        # 기본 토큰화에도 도메인 키워드 중복 추가 적용
-        domain_words = [token for token in tokens if token in self.domain_keywords]
-        final_tokens = list(set(tokens + domain_words))  # 중복 제거
-
-        return final_tokens
+        return [token for token in text.split()
+                if len(token) >= 2 and token not in self.stopwords]
 
     def search(self, query: str, top_k: int = 10, category_filter: Optional[str] = None) -> List[PrecedentResult]:
         """
@@ -258,8 +636,8 @@ class WorkInjuryCaseSearcher:
             return []
 
         try:
-            # 쿼리 전처리
-            query_tokens = self._tokenize(query)
+            # 쿼리 전처리 (반복 쿼리는 LRU 캐시에서 바로 반환)
+            query_tokens = self._tokenize_cached(query)
             if not query_tokens:
                 logger.warning("No valid tokens found in query")
                 return []
@@ -268,51 +646,148 @@ class WorkInjuryCaseSearcher:
             query_set = set(query_tokens)
             logger.info(f"Processed query: '{processed_query}' (from: '{query}')")
 
-            # TF-IDF 벡터화
-            query_vector = self.vectorizer.transform([processed_query])
+            # TF-IDF 벡터화 (캐시 적용)
+            query_vector = self._vectorize_query(processed_query)
+
+            # 코사인 유사도 계산: 양쪽 입력을 직접 통제하므로 sklearn
+            # cosine_similarity의 검증/디스패치 없이 희소 행렬 곱으로 계산.
+            # 대형 코퍼스에서는 ANN 후보 추출 + 정확 재랭킹으로 sub-linear화
+            query_norm = normalize(query_vector, norm='l2')
 
-            # 코사인 유사도 계산 (올바른 방법)
-            base_similarities = cosine_similarity(query_vector, self.tfidf_matrix)[0]
+            # 카테고리 필터가 있으면 ANN을 건너뜀: 전역 후보 상위 top_k*10에
+            # 해당 카테고리 문서가 적으면 결과가 비어 보일 수 있음
+            base_similarities = (None if category_filter
+                                 else self._ann_base_similarities(query_norm, top_k))
+            if base_similarities is None:
+                doc_matrix = (self._tfidf_norm if self._tfidf_norm is not None
+                              else normalize(self.tfidf_matrix, norm='l2'))
+                base_similarities = np.asarray(
+                    (doc_matrix @ query_norm.T).todense()).ravel()
 
             # 키워드 부스팅 적용
             similarities = self._apply_keyword_boosting(base_similarities, query_set, query_tokens)
 
-            # 카테고리 필터링
-            df_filtered = self.df.copy()
-            if category_filter and 'category' in df_filtered.columns:
-                df_filtered = df_filtered[df_filtered['category'] == category_filter]
-                # 필터링된 인덱스에 맞춰 유사도 조정
-                filtered_indices = df_filtered.index.tolist()
-                similarities = similarities[filtered_indices]
+            # 카테고리 필터링 (복사 없이 불리언 마스크로 인덱스만 추림)
+            if category_filter and self._has_category:
+                mask = self.df['category'].values == category_filter
+                cat_indices = np.flatnonzero(mask)
+                top_local = self._top_k_indices(similarities[cat_indices], top_k)
+                top_indices = cat_indices[top_local]
+            else:
+                # 상위 결과 선택
+                top_indices = self._top_k_indices(similarities, top_k)
 
-            # 상위 결과 선택
-            top_indices = np.argsort(similarities)[::-1][:top_k]
+            # 유사도 임계값 필터 (Test_casePedia 수준 매칭) - 벡터화
+            top_indices = top_indices[similarities[top_indices] >= 0.001]
+
+            # 쿼리 키워드는 한 번만 추출해 모든 결과에 재사용 (재토크나이징 제거)
+            query_keywords = self._extract_keywords_from_tokens(query_tokens)
 
             # 결과 생성
             results = []
             for idx in top_indices:
-                if float(similarities[idx]) >= 0.001:  # 유사도 임계값 추가 완화 (Test_casePedia 수준 매칭)
-                    original_idx = df_filtered.iloc[idx].name if category_filter else idx
-                    case_data = self.df.iloc[original_idx]
+                case_data = self.df.iloc[idx]
+
+                result = PrecedentResult(
+                    case_id=f"CASE_{idx}",
+                    title=str(case_data.get('title', 'Unknown')),
+                    content=str(case_data.get('noncontent', '')),
+                    court=str(case_data.get('courtname', 'Unknown Court')),
+                    date=str(case_data.get('kinda', 'Unknown Date')),
+                    similarity=float(similarities[idx]),
+                    category=case_data.get('category', 'Unknown'),
+                    keywords=query_keywords
+                )
+                results.append(result)
+
+            logger.info(f"Found {len(results)} relevant cases for query: '{query}'")
+            return results
 
-                    result = PrecedentResult(
-                        case_id=f"CASE_{original_idx}",
+        except Exception as e:
+            logger.error(f"Search failed: {e}")
+            return []
+
+    def search_batch(self, queries: List[str], top_k: int = 10) -> List[List[PrecedentResult]]:
+        """
+        여러 쿼리 일괄 검색
+
+        쿼리들을 하나의 희소 행렬로 벡터화한 뒤 정규화된 문서 행렬과의
+        곱 한 번으로 전체 유사도를 계산합니다. 오프라인 평가처럼 쿼리를
+        반복 호출하는 경우 디스패치 비용을 분할 상환합니다.
+
+        Args:
+            queries: 검색 쿼리 리스트
+            top_k: 쿼리당 반환할 결과 수
+
+        Returns:
+            List[List[PrecedentResult]]: 쿼리별 검색 결과 리스트
+        """
+        if not self.is_loaded:
+            logger.error("Model not loaded. Call load_model() first.")
+            return [[] for _ in queries]
+
+        try:
+            tokenized = [self._tokenize_cached(query) for query in queries]
+            processed = [' '.join(tokens) for tokens in tokenized]
+
+            # 쿼리 벡터화 + 정규화 후 단일 희소 행렬 곱 (N x B)
+            query_matrix = normalize(self.vectorizer.transform(processed), norm='l2')
+            doc_matrix = (self._tfidf_norm if self._tfidf_norm is not None
+                          else normalize(self.tfidf_matrix, norm='l2'))
+            all_similarities = np.asarray((doc_matrix @ query_matrix.T).todense())
+
+            results = []
+            for b, query in enumerate(queries):
+                query_tokens = tokenized[b]
+                if not query_tokens:
+                    results.append([])
+                    continue
+
+                similarities = self._apply_keyword_boosting(
+                    np.ascontiguousarray(all_similarities[:, b]),
+                    set(query_tokens), query_tokens
+                )
+
+                top_indices = self._top_k_indices(similarities, top_k)
+                top_indices = top_indices[similarities[top_indices] >= 0.001]
+                query_keywords = self._extract_keywords_from_tokens(query_tokens)
+
+                query_results = []
+                for idx in top_indices:
+                    case_data = self.df.iloc[idx]
+                    query_results.append(PrecedentResult(
+                        case_id=f"CASE_{idx}",
                         title=str(case_data.get('title', 'Unknown')),
                         content=str(case_data.get('noncontent', '')),
                         court=str(case_data.get('courtname', 'Unknown Court')),
                         date=str(case_data.get('kinda', 'Unknown Date')),
                         similarity=float(similarities[idx]),
                         category=case_data.get('category', 'Unknown'),
-                        keywords=self._extract_keywords(processed_query)
-                    )
-                    results.append(result)
+                        keywords=query_keywords
+                    ))
+                results.append(query_results)
 
-            logger.info(f"Found {len(results)} relevant cases for query: '{query}'")
+            logger.info(f"Batch search completed: {len(queries)} queries")
             return results
 
         except Exception as e:
-            logger.error(f"Search failed: {e}")
-            return []
+            logger.error(f"Batch search failed: {e}")
+            return [[] for _ in queries]
+
+    @staticmethod
+    def _top_k_indices(similarities: np.ndarray, top_k: int) -> np.ndarray:
+        """
+        상위 k개 인덱스를 유사도 내림차순으로 반환
+
+        전체 정렬(O(N log N)) 대신 argpartition으로 k개만 고른 뒤
+        그 k개만 정렬합니다 (O(N + k log k)).
+        """
+        k = min(top_k, similarities.size)
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        part = np.argpartition(similarities, -k)[-k:]
+        return part[np.argsort(-similarities[part])]
 
     def _extract_keywords(self, text: str) -> List[str]:
         """텍스트에서 주요 키워드 추출"""
@@ -321,7 +796,10 @@ class WorkInjuryCaseSearcher:
 
         # 기본적인 키워드 추출 (빈도 기반)
         tokens = self._tokenize(text)
+        return self._extract_keywords_from_tokens(tokens)
 
+    def _extract_keywords_from_tokens(self, tokens) -> List[str]:
+        """이미 토크나이징된 토큰에서 주요 키워드 추출 (재토크나이징 없음)"""
         # 불용어 제거 (간단한 버전)
         stopwords = {'이', '그', '저', '것', '는', '은', '이다', '있다', '하다', '되다'}
         keywords = [token for token in tokens if token not in stopwords and len(token) >= 2]
@@ -351,21 +829,72 @@ class WorkInjuryCaseSearcher:
         boosted = base_similarities.copy()
 
         # tokens 컬럼이 없는 경우를 위한 처리
-        if 'tokens' not in self.df.columns:
+        if not self._has_tokens:
             logger.warning("No tokens column found, skipping keyword boosting")
             return boosted
 
+        # Numba 커널 경로: 평탄화된 토큰 인덱스가 준비된 경우 컴파일된 병렬 커널 사용
+        if NUMBA_AVAILABLE and self._tok_ids is not None:
+            try:
+                query_mask = np.zeros(self._is_domain.shape[0], dtype=np.uint8)
+                for token in query_set:
+                    token_id = self._token_vocab.get(token)
+                    if token_id is not None:
+                        query_mask[token_id] = 1
+
+                # 쿼리 토큰이 문서 어휘에 전혀 없으면 부스팅할 것이 없음
+                if not query_mask.any():
+                    return boosted
+
+                boosted = _boost_kernel(
+                    self._tok_ids,
+                    self._tok_offsets,
+                    query_mask,
+                    self._is_domain,
+                    base_similarities,
+                    float(max(len(query_tokens), 1)),
+                    float(self.boost_multiplier)
+                )
+
+                boosted_count = int(np.count_nonzero(
+                    np.abs(boosted - base_similarities) > 0.001))
+                if boosted_count > 0:
+                    logger.info(f"Keyword boosting applied to "
+                               f"{boosted_count}/{len(base_similarities)} documents (kernel)")
+
+                return boosted
+
+            except Exception as e:
+                logger.warning(f"Boosting kernel failed: {e}, using Python loop")
+                boosted = base_similarities.copy()
+
         try:
-            for i, similarity in enumerate(base_similarities):
+            # load_model에서 캐시한 set 리스트 사용 (pandas 행 접근 제거)
+            tokens_list = self._tokens_list
+            domain_set = self._domain_keywords_set or set(self.domain_keywords)
+
+            # 유효 문서 중 기본 유사도가 0보다 큰 문서만 순회
+            # (희소 TF-IDF에서 쿼리와 겹치는 문서는 전체의 일부에 불과)
+            if tokens_list is not None and self._tokens_valid is not None:
+                candidate_indices = np.flatnonzero(
+                    self._tokens_valid & (base_similarities > 0))
+            else:
+                candidate_indices = np.flatnonzero(base_similarities > 0)
+
+            for i in candidate_indices:
+                similarity = base_similarities[i]
                 try:
-                    # 문서의 토큰 가져오기 (Jupyter 노트북 방식: 단순하고 확실함)
-                    tokens_data = self.df.iloc[i]['tokens']
+                    # 문서의 토큰 가져오기 (캐시 우선, 없으면 노트북 방식 폴백)
+                    if tokens_list is not None:
+                        doc_tokens = tokens_list[i]
+                    else:
+                        tokens_data = self.df.iloc[i]['tokens']
 
-                    # tokens가 None이거나 빈 값인 경우 건너뛰기
-                    if pd.isna(tokens_data) or not tokens_data:
-                        continue
+                        # tokens가 None이거나 빈 값인 경우 건너뛰기
+                        if tokens_data is None or len(tokens_data) == 0:
+                            continue
 
-                    doc_tokens = set(tokens_data)
+                        doc_tokens = set(tokens_data)
 
                     # 공통 키워드 찾기
                     common_keywords = query_set & doc_tokens
@@ -373,7 +902,7 @@ class WorkInjuryCaseSearcher:
                     if common_keywords:
                         # 도메인 키워드 가중치 계산
                         domain_count = sum(1 for kw in common_keywords
-                                         if kw in self.domain_keywords)
+                                         if kw in domain_set)
 
                         # 매칭 비율 계산
                         match_ratio = len(common_keywords) / max(len(query_tokens), 1)
@@ -435,19 +964,21 @@ class WorkInjuryCaseSearcher:
             # 상위 결과 분석
             top_results = search_results[:top_n]
 
+            from collections import Counter
+
             # 카테고리 분석
-            categories = {}
-            for result in search_results:
-                if result.category:
-                    categories[result.category] = categories.get(result.category, 0) + 1
+            categories = dict(Counter(
+                r.category for r in search_results if r.category))
 
-            # 평균 유사도 계산
-            avg_similarity = np.mean([r.similarity for r in top_results])
+            # 평균 유사도 계산 (리스트 중간 생성 없이 numpy 배열로)
+            sims_arr = np.fromiter(
+                (r.similarity for r in top_results),
+                dtype=np.float32, count=len(top_results)
+            )
+            avg_similarity = float(sims_arr.mean())
 
             # 법원별 분포
-            courts = {}
-            for result in top_results:
-                courts[result.court] = courts.get(result.court, 0) + 1
+            courts = dict(Counter(r.court for r in top_results))
 
             # 키워드 통계
             all_keywords = []
@@ -455,7 +986,6 @@ class WorkInjuryCaseSearcher:
                 if result.keywords:
                     all_keywords.extend(result.keywords)
 
-            from collections import Counter
             keyword_stats = Counter(all_keywords).most_common(10)
 
             report = {
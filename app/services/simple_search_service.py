@@ -9,20 +9,170 @@ import pandas as pd
 import numpy as np
 import re
 import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
+from sklearn.utils.extmath import safe_sparse_dot
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# 다중 패턴 문자열 매칭 가속을 위한 의존성 - 선택적 import
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 카테고리 분류 키워드 (우선순위 순 - 기존 if/elif 체인과 동일)
+_CATEGORY_KEYWORDS = [
+    ("추락사고", ["추락", "낙상", "떨어", "비계", "사다리", "고소", "높이", "옥상", "아래로"]),
+    ("기계사고", ["끼임", "절단", "프레스", "기계", "크레인", "컨베이어", "끼여", "절단기", "압착"]),
+    ("화재사고", ["화상", "화재", "폭발", "용접", "고온", "증기", "화염", "열상"]),
+    ("교통사고", ["교통", "차량", "충돌", "지게차", "화물차", "트럭", "버스", "승용차"]),
+    ("중독사고", ["중독", "질식", "화학", "가스", "약품", "독성", "중독성", "흡입"]),
+    ("감전사고", ["감전", "전기", "전선", "누전", "전류", "전압", "전기적"]),
+]
+
+# 판례 내용 키워드 추출용 주요 용어
+_IMPORTANT_TERMS = [
+    '산업재해', '업무상', '재해', '부상', '사망', '질병',
+    '안전보건', '작업', '근로자', '사업주', '보상금',
+    '치료비', '휴업급여', '장해급여', '유족급여', '장해등급',
+    '의료비', '간병비', '추락', '절단', '감전', '화상',
+    '중독', '골절', '염좌', '타박상'
+]
+
+
+def _build_automaton(entries):
+    """(값, 단어) 쌍들로 Aho-Corasick 오토마톤 구성 (중복 단어는 첫 등록 유지)"""
+    automaton = ahocorasick.Automaton()
+    for value, word in entries:
+        if not automaton.exists(word):
+            automaton.add_word(word, value)
+    automaton.make_automaton()
+    return automaton
+
+
+if AHOCORASICK_AVAILABLE:
+    # 한 번의 선형 스캔으로 모든 카테고리/용어 매칭을 끝내는 오토마톤
+    _CATEGORY_AC = _build_automaton(
+        ((priority, category), word)
+        for priority, (category, words) in enumerate(_CATEGORY_KEYWORDS)
+        for word in words
+    )
+    _TERMS_AC = _build_automaton((term, term) for term in _IMPORTANT_TERMS)
+else:
+    _CATEGORY_AC = None
+    _TERMS_AC = None
+
+# 병렬 희소 matvec 가속을 위한 의존성 - 선택적 import
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _csr_matvec_kernel(indptr, indices, data, query_dense, out):
+        """CSR 행 블록을 prange로 병렬 순회하는 matvec (scipy 단일 스레드 대체)"""
+        n_rows = indptr.shape[0] - 1
+        for i in prange(n_rows):
+            acc = np.float32(0.0)
+            for j in range(indptr[i], indptr[i + 1]):
+                acc += data[j] * query_dense[indices[j]]
+            out[i] = acc
+
+# 쿼리 전처리용 정규식 (미리 컴파일)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# 연도 추출 패턴 (우선순위 순, 모듈 로드 시 1회 컴파일)
+_YEAR_PATTERNS = [re.compile(p) for p in (
+    # 1순위: 한국 법원 사건번호 패턴 (가장 확실한 연도 정보)
+    r'(\d{4})고합\d*',     # 2018고합123
+    r'(\d{4})고단\d*',     # 2019고단456
+    r'(\d{4})나\d*',       # 2020나789
+    r'(\d{4})다\d*',       # 2021다123
+    r'(\d{4})누\d*',       # 행정소송
+    r'(\d{4})아\d*',       # 특별법
+    r'(\d{4})노\d*',       # 형사소송
+    r'(\d{4})구\d*',       # 구단
+    r'(\d{4})초\d*',       # 초기결정
+    r'(\d{4})재\d*',       # 재심
+
+    # 2순위: 판결/선고 관련 패턴
+    r'(\d{4})년.*?선고',     # 2022년 3월 15일 선고
+    r'(\d{4})년.*?판결',     # 2021년 판결
+    r'선고.*?(\d{4})년',     # 선고 2020년
+    r'판결.*?(\d{4})년',     # 판결 2019년
+
+    # 3순위: 일반적인 날짜 패턴
+    r'(\d{4})[년]',         # 2022년
+    r'(\d{4})\.\s*\d',      # 2023. 1
+    r'(\d{4})-\d',          # 2024-01
+    r'(\d{4})/\d',          # 2024/01
+
+    # 4순위: 사건 관련 패턴
+    r'사건.*?(\d{4})',      # 사건 2020
+    r'신청.*?(\d{4})',      # 신청 2021
+    r'처분.*?(\d{4})',      # 처분 2019
+
+    # 5순위: 기타 패턴 (덜 확실함)
+    r'(\d{4})\s+\d',        # 2025 01
+    r'[^\d](\d{4})[^\d]',   # 양쪽이 숫자가 아닌 4자리
+    r'^(\d{4})',            # 문자열 시작의 4자리
+    r'(\d{4})'              # 마지막 후보: 일반적인 4자리 숫자
+)]
+
+# 반복 쿼리에서 캐시로 돌려줄 최대 결과 수 (top_k는 이 안에서 슬라이스)
+_MAX_TOP_K = 100
+
 # 전역 변수 (모델 캐싱용)
 _model_loaded = False
 _df = None
+_df_fast = None
 _vectorizer = None
 _tfidf_matrix = None
 _config = None
 
+# 쿼리 벡터 직접 구성용 어휘/IDF 캐시 (_post_load_setup에서 설정)
+_vocab = None
+_idf = None
+
+# 품질 필터용 사전 계산 마스크 (_post_load_setup에서 설정)
+_court_unknown_mask = None
+_title_rejection_mask = None
+
+# 열 → 행 역색인용 CSC 뷰 (_post_load_setup에서 설정)
+# 짧은 쿼리는 어휘 중 몇 개 열만 건드리므로, 그 열에 0이 아닌 값을 가진
+# 행만 모으면 대부분의 문서를 산술 없이 걸러낼 수 있음
+_tfidf_csc = None
+
+# matvec용 스레드별 재사용 버퍼 (쿼리마다 4·N + 4·V 바이트 할당/zero-fill 방지)
+_thread_bufs = threading.local()
+
+
+def _get_matvec_buffers():
+    """현재 스레드의 (query_dense, out) 버퍼 반환 (크기/dtype 불일치 시 재생성)"""
+    n_rows, n_cols = _tfidf_matrix.shape
+    dtype = _tfidf_matrix.dtype
+
+    bufs = getattr(_thread_bufs, 'bufs', None)
+    if (bufs is None or bufs[0].shape[0] != n_cols
+            or bufs[1].shape[0] != n_rows or bufs[0].dtype != dtype):
+        bufs = (np.zeros(n_cols, dtype=dtype), np.empty(n_rows, dtype=dtype))
+        _thread_bufs.bufs = bufs
+    return bufs
+
+# 검색 결과 구성에 실제로 쓰이는 컬럼 (행 일괄 변환용 슬라이스 대상)
+_RESULT_COLUMNS = ('title', 'courtname', 'noncontent', 'kinda', 'kindb', 'kindc')
+
+# 로드 시 문자열로 정리해 두는 텍스트 컬럼 (per-row str() 변환 제거용)
+_TEXT_COLUMNS = _RESULT_COLUMNS + ('caseno', 'plaintiff', 'defendant')
+
 def load_searcher_model_direct() -> bool:
     """
     Test_casePedia 방식으로 searcher_model.pkl 직접 로드
@@ -44,7 +194,13 @@ def load_searcher_model_direct() -> bool:
         logger.info(f"Loading model directly from: {model_path}")
 
         # joblib으로 직접 로드 (Test_casePedia 방식)
-        model_data = joblib.load(model_path)
+        # mmap_mode='r'은 비압축 덤프의 numpy 배열을 OS 페이지 캐시에
+        # 맡겨 cold-start와 RSS를 줄임. 압축 피클이면 예외로 폴백.
+        try:
+            model_data = joblib.load(model_path, mmap_mode='r')
+        except Exception as mmap_error:
+            logger.info(f"mmap load not possible ({mmap_error}), loading eagerly")
+            model_data = joblib.load(model_path)
 
         # 전역 변수에 할당
         _df = model_data['df']
@@ -52,6 +208,10 @@ def load_searcher_model_direct() -> bool:
         _tfidf_matrix = model_data['tfidf_matrix']
         _config = model_data.get('config', {})
 
+        # 로드 직후 1회성 변환 (정규화 등), 이전 모델 기준 쿼리 캐시 무효화
+        _post_load_setup()
+        _search_core.cache_clear()
+
         # 로드 성공 플래그
         _model_loaded = True
 
@@ -65,6 +225,252 @@ def load_searcher_model_direct() -> bool:
         return False
 
 
+def _post_load_setup():
+    """
+    모델 로드 직후 1회성 변환
+
+    쿼리마다 반복되는 비용을 로드 시점으로 옮깁니다. 문서 행렬을 미리
+    L2 정규화해 두면 검색 시 코사인 유사도가 희소 행렬 곱 한 번으로
+    끝납니다 (TfidfVectorizer의 쿼리 벡터는 기본 norm='l2'로 이미 정규화됨).
+    """
+    global _tfidf_matrix, _df_fast, _vocab, _idf
+
+    # 유니그램 모델이면 transform의 analyzer 체인을 우회할 수 있도록
+    # 어휘와 IDF 배열을 캐시
+    _vocab = None
+    _idf = None
+    if getattr(_vectorizer, 'ngram_range', (1, 1)) == (1, 1):
+        _vocab = getattr(_vectorizer, 'vocabulary_', None)
+        _idf = getattr(_vectorizer, 'idf_', None)
+
+    # 텍스트 컬럼을 한 번에 문자열로 정리: 결과 루프의 per-row str() 호출과
+    # NaN → 'nan' 문자열 누출을 모두 제거 (StringDtype이 저장도 더 컴팩트)
+    for col in _TEXT_COLUMNS:
+        if col in _df.columns:
+            try:
+                _df[col] = _df[col].fillna('').astype('string')
+            except Exception as e:
+                logger.warning(f"Text column stringify failed ({col}): {e}")
+
+    # 저카디널리티 컬럼은 category dtype으로 (메모리 절감 + 벡터화 비교)
+    for col in ('courtname', 'kindb', 'kindc'):
+        if col in _df.columns:
+            try:
+                _df[col] = _df[col].astype('category')
+            except Exception as e:
+                logger.warning(f"Category dtype conversion failed ({col}): {e}")
+
+    # 품질 필터 마스크를 전체 컬럼에 대해 한 번만 계산
+    # (_build_results가 행마다 문자열 비교를 반복하지 않도록)
+    global _court_unknown_mask, _title_rejection_mask
+    _court_unknown_mask = None
+    _title_rejection_mask = None
+    try:
+        if 'courtname' in _df.columns:
+            _court_unknown_mask = (_df['courtname'] == 'Unknown Court').to_numpy()
+        if 'title' in _df.columns:
+            _title_rejection_mask = _df['title'].str.contains(
+                '기각', na=False).to_numpy()
+    except Exception as e:
+        logger.warning(f"Filter mask precomputation failed: {e}")
+        _court_unknown_mask = None
+        _title_rejection_mask = None
+
+    # 결과 구성용 경량 프레임: 필요한 컬럼만 잘라 행 일괄 변환 비용을 줄임
+    # (상세 조회는 _df 전체를 계속 사용)
+    try:
+        fast_cols = [col for col in _RESULT_COLUMNS if col in _df.columns]
+        _df_fast = _df[fast_cols].reset_index(drop=True) if fast_cols else None
+    except Exception as e:
+        logger.warning(f"Fast-column frame setup failed: {e}")
+        _df_fast = None
+
+    try:
+        # mmap 로드된 배열은 읽기 전용이므로 in-place 변환 전에 복사
+        if hasattr(_tfidf_matrix, 'data') and not _tfidf_matrix.data.flags.writeable:
+            _tfidf_matrix = _tfidf_matrix.copy()
+
+        # float64 CSR → float32: TF-IDF 값에 FP64 정밀도는 불필요하고
+        # 희소 matvec은 메모리 대역폭에 묶이므로 바이트 수가 곧 속도
+        _tfidf_matrix = _tfidf_matrix.astype(np.float32, copy=False)
+        _tfidf_matrix.sort_indices()
+        _tfidf_matrix = normalize(_tfidf_matrix, norm='l2', copy=False)
+    except Exception as e:
+        logger.warning(f"TF-IDF matrix normalization failed: {e}")
+
+    # 역색인(CSC 뷰) 구축: 메모리를 한 벌 더 쓰는 대신 쿼리와 겹치는
+    # 행만 골라 matvec 대상 자체를 줄임
+    global _tfidf_csc
+    try:
+        _tfidf_csc = _tfidf_matrix.tocsc()
+    except Exception as e:
+        logger.warning(f"CSC inverted index build failed: {e}")
+        _tfidf_csc = None
+
+
+@lru_cache(maxsize=1024)
+def _search_core(query_clean: str):
+    """
+    전처리된 쿼리에 대한 벡터화 + 유사도 + 상위 선택
+
+    결과 포매팅과 분리해 쿼리 문자열 기준으로 메모이즈합니다.
+    top_k와 무관하게 상위 _MAX_TOP_K개를 캐시하고 호출부에서
+    슬라이스하므로 같은 쿼리의 어떤 top_k 요청도 캐시를 공유합니다.
+
+    Returns:
+        tuple: (top_indices, top_similarities) - 호출부에서 수정 금지
+    """
+    query_vector = _fast_query_vector(query_clean)
+
+    logger.debug("Query vectorized: shape=%s", query_vector.shape)
+
+    # 역색인 프루닝: 쿼리 열과 겹치는 후보 행에서만 유사도 계산
+    pruned = _pruned_similarities(query_vector)
+    if pruned is not None:
+        candidate_rows, candidate_sims = pruned
+        top_local = _top_k_indices(candidate_sims, _MAX_TOP_K)
+        return candidate_rows[top_local], candidate_sims[top_local]
+
+    similarities = _compute_similarities(query_vector)
+
+    # 유사도 통계 로깅 (전체 배열 3회 순회라 DEBUG에서만 계산)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Similarities calculated: max=%.4f, mean=%.4f, nonzero_count=%d",
+                     similarities.max(), similarities.mean(),
+                     int(np.count_nonzero(similarities > 0.001)))
+
+    top_indices = _top_k_indices(similarities, _MAX_TOP_K)
+    return top_indices, similarities[top_indices]
+
+
+def _fast_query_vector(query_clean: str):
+    """
+    짧은 단일 쿼리의 TF-IDF 벡터를 어휘/IDF 캐시로 직접 구성
+
+    sklearn transform은 쿼리 하나에도 analyzer 전체 파이프라인
+    (소문자화, 정규식 토크나이징, 어휘 재구성)을 태우므로, O(10)개
+    토큰짜리 쿼리는 Counter + dict 조회로 CSR 행을 직접 만드는 편이
+    훨씬 쌉니다. 캐시가 없거나 실패하면 transform으로 폴백합니다.
+    """
+    if _vocab is None or _idf is None:
+        return _vectorizer.transform([query_clean])
+
+    try:
+        from collections import Counter
+        from scipy.sparse import csr_matrix
+
+        counts = Counter(_vocab[token] for token in query_clean.lower().split()
+                         if token in _vocab)
+        if not counts:
+            return csr_matrix((1, len(_vocab)), dtype=np.float32)
+
+        cols = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+        tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        if getattr(_vectorizer, 'sublinear_tf', False):
+            tf = 1.0 + np.log(tf)
+
+        data = tf * _idf[cols].astype(np.float32)
+
+        # transform과 동일하게 L2 정규화
+        norm = np.sqrt(np.dot(data, data))
+        if norm > 0:
+            data /= norm
+
+        return csr_matrix((data, (np.zeros_like(cols), cols)),
+                          shape=(1, len(_vocab)))
+
+    except Exception as e:
+        logger.warning(f"Fast query vectorization failed: {e}, using transform")
+        return _vectorizer.transform([query_clean])
+
+
+def _pruned_similarities(query_vector):
+    """
+    역색인 기반 후보 행 프루닝
+
+    쿼리가 건드리는 열에 0이 아닌 값을 가진 행만 모아 그 부분 행렬에
+    대해서만 matvec을 수행합니다. 후보가 전체의 절반을 넘으면 프루닝
+    이득이 없으므로 None을 돌려 전체 matvec 경로를 타게 합니다.
+
+    Returns:
+        Optional[tuple]: (candidate_rows, similarities) 또는 None
+    """
+    if _tfidf_csc is None or query_vector.nnz == 0:
+        return None
+
+    try:
+        indptr = _tfidf_csc.indptr
+        row_indices = _tfidf_csc.indices
+
+        parts = [row_indices[indptr[j]:indptr[j + 1]]
+                 for j in query_vector.indices]
+        candidate_rows = np.unique(np.concatenate(parts)) if parts else \
+            np.empty(0, dtype=np.intp)
+
+        if candidate_rows.size == 0:
+            return candidate_rows, np.empty(0, dtype=_tfidf_matrix.dtype)
+
+        # 후보가 너무 많으면 부분 행렬 추출 비용이 프루닝 이득을 상쇄
+        if candidate_rows.size > _tfidf_matrix.shape[0] // 2:
+            return None
+
+        if query_vector.dtype != _tfidf_matrix.dtype:
+            query_vector = query_vector.astype(_tfidf_matrix.dtype)
+
+        sub_matrix = _tfidf_matrix[candidate_rows]
+        similarities = safe_sparse_dot(
+            query_vector, sub_matrix.T, dense_output=True).ravel()
+        return candidate_rows, similarities
+
+    except Exception as e:
+        logger.warning(f"Inverted-index pruning failed: {e}")
+        return None
+
+
+def _compute_similarities(query_vector) -> np.ndarray:
+    """
+    쿼리 벡터와 전체 문서의 코사인 유사도 계산
+
+    Numba가 있으면 CSR 행을 코어별로 나눠 도는 병렬 커널을 사용하고,
+    없으면 scipy의 단일 스레드 희소 matvec으로 폴백합니다.
+    """
+    # transform은 float64를 내므로 float32 문서 행렬과 dtype을 맞춤
+    # (업캐스트 방지 + safe_sparse_dot의 동일 dtype 요구 충족)
+    if query_vector.dtype != _tfidf_matrix.dtype:
+        query_vector = query_vector.astype(_tfidf_matrix.dtype)
+
+    if NUMBA_AVAILABLE:
+        try:
+            # 스레드별 버퍼 재사용: query_dense는 쓴 자리만 되돌려 0 유지
+            query_dense, out = _get_matvec_buffers()
+            query_dense[query_vector.indices] = query_vector.data
+
+            try:
+                _csr_matvec_kernel(
+                    _tfidf_matrix.indptr, _tfidf_matrix.indices,
+                    _tfidf_matrix.data, query_dense, out
+                )
+            finally:
+                query_dense[query_vector.indices] = 0
+
+            return out
+        except Exception as e:
+            logger.warning(f"Numba matvec failed: {e}, using scipy")
+
+    # dense_output=True로 (1, N) 희소 중간 결과 없이 바로 dense 배열 획득
+    return safe_sparse_dot(query_vector, _tfidf_matrix.T, dense_output=True).ravel()
+
+
+def _top_k_indices(similarities: np.ndarray, top_k: int) -> np.ndarray:
+    """argpartition으로 상위 k개 인덱스를 유사도 내림차순 반환 (전체 정렬 회피)"""
+    k = min(top_k, similarities.size)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    part = np.argpartition(similarities, -k)[-k:]
+    return part[np.argsort(-similarities[part])]
+
+
 def search_precedents_simple(query: str, top_k: int = 10) -> List[Dict[str, Any]]:
     """
     Test_casePedia.ipynb의 정확한 검색 방식
@@ -79,124 +485,189 @@ def search_precedents_simple(query: str, top_k: int = 10) -> List[Dict[str, Any]
         logger.info(f"Simple search started: query='{query}', top_k={top_k}")
 
         # 1. 최소한의 전처리 (Test_casePedia 방식)
-        query_clean = re.sub(r'[^\w\s]', ' ', query)  # 특수문자 제거
-        query_clean = ' '.join(query_clean.split())    # 공백 정규화
+        query_clean = _PUNCT_RE.sub(' ', query)      # 특수문자 제거
+        query_clean = ' '.join(query_clean.split())  # 공백 정규화
 
         logger.info(f"Query preprocessed: '{query}' → '{query_clean}'")
 
-        # 2. 벡터화 (직접적으로)
-        query_vector = _vectorizer.transform([query_clean])
+        # 2-4. 벡터화 + 유사도 + 상위 선택 (반복 쿼리는 LRU 캐시 히트)
+        # 품질 필터로 탈락하는 행을 감안해 후보군을 top_k의 4배로 넉넉히 확보
+        # (대부분의 경우 폴백 메커니즘 없이 top_k개를 채울 수 있음)
+        fetch_k = min(top_k * 4, _MAX_TOP_K)
+        top_indices_full, top_sims_full = _search_core(query_clean)
+        top_indices = top_indices_full[:fetch_k]
+        top_sims = top_sims_full[:fetch_k]
 
-        logger.info(f"Query vectorized: shape={query_vector.shape}")
+        # 5. 결과 구성 (필터링 + 포매팅)
+        results = _build_results(top_indices, top_sims, top_k)
 
-        # 3. 유사도 계산 (Test_casePedia 정확한 방식)
-        similarities = cosine_similarity(query_vector, _tfidf_matrix)[0]
+        # 첫 번째 결과 상세 로깅
+        if results:
+            top_result = results[0]
+            logger.info(f"Top result: similarity={top_result['similarity']:.4f} "
+                       f"({top_result['similarity_pct']:.2f}%), "
+                       f"title='{top_result['title'][:50]}...', court='{top_result['court']}'")
 
-        # 유사도 통계 로깅
-        max_sim = np.max(similarities)
-        mean_sim = np.mean(similarities)
-        nonzero_count = np.count_nonzero(similarities > 0.001)
+        logger.info(f"✅ Simple search completed: found {len(results)} relevant results")
+        return results
+
+    except Exception as e:
+        logger.error(f"❌ Simple search failed: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return []
 
-        logger.info(f"Similarities calculated: max={max_sim:.4f}, mean={mean_sim:.4f}, "
-                   f"nonzero_count={nonzero_count}")
 
-        # 4. 상위 결과 선택
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+def search_precedents_batch(queries: List[str], top_k: int = 10) -> List[List[Dict[str, Any]]]:
+    """
+    여러 쿼리 일괄 검색
 
-        # 5. 결과 구성 (단계적 필터링 적용)
+    쿼리들을 한 번의 transform으로 벡터화하고 문서 행렬과의 곱을
+    단일 SpGEMM으로 계산해, 쿼리별 호출 대비 문서 행렬 로드 비용을
+    쿼리 수만큼 분할 상환합니다. (보고서/평가처럼 쿼리가 여럿일 때 사용)
+    """
+    # 모델 로드 확인
+    if not _model_loaded and not load_searcher_model_direct():
+        logger.error("❌ Model could not be loaded")
+        return [[] for _ in queries]
+
+    try:
+        cleaned = [' '.join(_PUNCT_RE.sub(' ', query).split()) for query in queries]
+
+        # 쿼리 B개를 한 번에 벡터화 후 (B, N) 유사도를 단일 곱으로 계산
+        query_matrix = _vectorizer.transform(cleaned)
+        if query_matrix.dtype != _tfidf_matrix.dtype:
+            query_matrix = query_matrix.astype(_tfidf_matrix.dtype)
+
+        all_similarities = safe_sparse_dot(
+            query_matrix, _tfidf_matrix.T, dense_output=True)
+
+        fetch_k = min(top_k * 4, _MAX_TOP_K)
         results = []
-        raw_results = []
-
-        # 먼저 모든 의미있는 결과 수집
-        for i, idx in enumerate(top_indices):
-            row = _df.iloc[idx]
-            similarity = similarities[idx]
-
-            # Test_casePedia 방식: 낮은 임계값 (0.1%)
-            if similarity >= 0.001:
-                title = str(row.get('title', 'Unknown Title'))
-                court = str(row.get('courtname', 'Unknown Court'))
-
-                # 내용 요약 (가독성 개선)
-                content = str(row.get('noncontent', ''))
-                content_summary = _create_readable_summary(content)
-
-                # 사용자 친화적인 카테고리 적용
-                friendly_category = get_friendly_category(title, content)
-
-                # 실제 컬럼 구조 기반 수정
-                # kinda를 날짜로 사용 (실제 데이터에서 kinda가 날짜 정보)
-                raw_date = str(row.get('kinda', 'Unknown Date'))
-                formatted_date = format_court_date(raw_date)
-
-                # 제목 요약
-                summarized_title = summarize_case_title(title)
-
-                # 추가 필드들 (실제 컬럼 구조에 맞게 수정)
-                kinda = str(row.get('kinda', ''))    # 실제 판결결과 (기각, 인용, 취하 등)
-                kindb = str(row.get('kindb', ''))    # 사건 분야 1 (요양, 장해 등)
-                kindc = str(row.get('kindc', ''))    # 사건 분야 2 (업무상사고, 업무상질병 등)
-
-                # 연도 추출을 content(noncontent), title에서 시도 (kinda는 판결결과이므로 제외)
-                year_info = extract_year_from_text(content, title)
-
-                # 디버깅용 로그
-                logger.info(f"데이터 확인 - kinda(판결결과): {kinda}, kindb: {kindb}, kindc: {kindc}, 연도: {year_info}")
-
-                result = {
-                    'rank': i + 1,
-                    'case_id': f"CASE_{idx}",
-                    'title': summarized_title,
-                    'court': court,
-                    'date': formatted_date,
-                    'similarity': round(float(similarity), 4),
-                    'similarity_pct': round(float(similarity) * 100, 2),
-                    'content': content_summary,
-                    'category': friendly_category,
-                    'accnum': year_info,  # 연도 정보
-                    'kinda': kinda,  # 실제 판결결과 (기각, 인용, 취하 등)
-                    'case_type': f"{kindb} {kindc}".strip() if kindb and kindc else kindb or kindc or ''  # 사건분야
-                }
-                raw_results.append(result)
-
-        logger.info(f"Raw results found: {len(raw_results)}")
-
-        # 단계적 품질 필터링
-        for result in raw_results:
+        for b in range(len(queries)):
+            similarities = np.ascontiguousarray(all_similarities[b])
+            top_indices = _top_k_indices(similarities, fetch_k)
+            results.append(
+                _build_results(top_indices, similarities[top_indices], top_k))
+
+        logger.info(f"✅ Batch search completed: {len(queries)} queries")
+        return results
+
+    except Exception as e:
+        logger.error(f"❌ Batch search failed: {e}")
+        return [[] for _ in queries]
+
+
+def _build_results(top_indices: np.ndarray, top_sims: np.ndarray, top_k: int) -> List[Dict[str, Any]]:
+    """
+    상위 후보 인덱스/유사도에서 최종 결과 리스트 구성
+    필터를 먼저 적용하고 통과한 행만 포매팅
+    (연도 추출/요약 같은 비싼 작업을 탈락 행에 낭비하지 않음)
+    """
+    candidates = []
+
+    # Test_casePedia 방식: 낮은 임계값 (0.1%) - 벡터화 적용
+    threshold_mask = top_sims >= 0.001
+    kept_indices = top_indices[threshold_mask]
+    kept_sims = top_sims[threshold_mask]
+
+    # 행을 per-idx iloc 대신 한 번에 dict 리스트로 변환 (pandas 행 생성 비용 1회)
+    if _df_fast is not None:
+        rows = _df_fast.iloc[kept_indices].to_dict('records')
+    else:
+        rows = [_df.iloc[idx] for idx in kept_indices]
+
+    # 먼저 모든 의미있는 결과 수집 (가벼운 필드만 조회)
+    for idx, similarity, row in zip(kept_indices, kept_sims, rows):
+        title = row.get('title') or 'Unknown Title'
+        court = row.get('courtname') or 'Unknown Court'
+        candidates.append((idx, similarity, row, title, court))
+
+    logger.info(f"Raw results found: {len(candidates)}")
+
+    # 단계적 품질 필터링 (로드 시 계산한 마스크 우선 사용)
+    use_masks = (_court_unknown_mask is not None
+                 and _title_rejection_mask is not None)
+    survivors = []
+    for candidate in candidates:
+        idx, _, _, title, court = candidate
+
+        if use_masks:
+            # 1차: Unknown 법원 / 2차: 기각 판례 제외 - O(1) 마스크 조회
+            if _court_unknown_mask[idx] or _title_rejection_mask[idx]:
+                continue
+        else:
             # 1차 필터링: Unknown 데이터 제외 (선택적)
-            if result['court'] == 'Unknown Court':
+            if court == 'Unknown Court':
                 continue
 
             # 2차 필터링: 기각 판례 제외 (선택적)
-            if "기각" in result['title'].lower():
+            if "기각" in title.lower():
                 continue
 
-            # 필터링 통과한 결과 추가
-            result['rank'] = len(results) + 1  # 필터링 후 순위 재조정
-            results.append(result)
+        survivors.append(candidate)
 
-        logger.info(f"Filtered results: {len(results)}")
+        # 요청한 개수를 채우면 더 볼 필요 없음
+        if len(survivors) >= top_k:
+            break
 
-        # 폴백 메커니즘: 필터링 결과가 너무 적으면 완화
-        if len(results) < 3 and len(raw_results) >= 3:
-            logger.info("Applying fallback mechanism due to insufficient filtered results")
-            results = raw_results[:top_k]  # 상위 결과 그대로 사용
+    logger.info(f"Filtered results: {len(survivors)}")
 
-        # 첫 번째 결과 상세 로깅
-        if results:
-            top_result = results[0]
-            logger.info(f"Top result: similarity={top_result['similarity']:.4f} "
-                       f"({top_result['similarity_pct']:.2f}%), "
-                       f"title='{top_result['title'][:50]}...', court='{top_result['court']}'")
+    # 폴백 메커니즘: 필터링 결과가 너무 적으면 완화
+    if len(survivors) < 3 and len(candidates) >= 3:
+        logger.info("Applying fallback mechanism due to insufficient filtered results")
+        survivors = candidates[:top_k]  # 상위 결과 그대로 사용
 
-        logger.info(f"✅ Simple search completed: found {len(results)} relevant results")
-        return results
+    # 생존한 행만 포매팅
+    results = []
+    for rank, (idx, similarity, row, title, court) in enumerate(survivors, 1):
+        # 내용 요약 (가독성 개선)
+        content = row.get('noncontent') or ''
+        content_summary = _create_readable_summary(content)
 
-    except Exception as e:
-        logger.error(f"❌ Simple search failed: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return []
+        # 사용자 친화적인 카테고리 적용
+        friendly_category = get_friendly_category(title, content)
+
+        # 실제 컬럼 구조 기반 수정
+        # kinda를 날짜로 사용 (실제 데이터에서 kinda가 날짜 정보)
+        raw_date = row.get('kinda') or 'Unknown Date'
+        formatted_date = format_court_date(raw_date)
+
+        # 추가 필드들 (실제 컬럼 구조에 맞게 수정)
+        kinda = row.get('kinda') or ''    # 실제 판결결과 (기각, 인용, 취하 등)
+        kindb = row.get('kindb') or ''    # 사건 분야 1 (요양, 장해 등)
+        kindc = row.get('kindc') or ''    # 사건 분야 2 (업무상사고, 업무상질병 등)
+
+        # 연도 추출을 content(noncontent), title에서 시도 (kinda는 판결결과이므로 제외)
+        year_info = extract_year_from_text(content, title)
+
+        # 디버깅용 로그 (지연 포매팅 - DEBUG가 꺼져 있으면 문자열을 만들지 않음)
+        logger.debug("데이터 확인 - kinda(판결결과): %s, kindb: %s, kindc: %s, 연도: %s",
+                     kinda, kindb, kindc, year_info)
+
+        results.append({
+            'rank': rank,
+            'case_id': f"CASE_{idx}",
+            'title': summarize_case_title(title),
+            'court': court,
+            'date': formatted_date,
+            'similarity': round(float(similarity), 4),
+            'similarity_pct': round(float(similarity) * 100, 2),
+            'content': content_summary,
+            'category': friendly_category,
+            'accnum': year_info,  # 연도 정보
+            'kinda': kinda,  # 실제 판결결과 (기각, 인용, 취하 등)
+            'case_type': f"{kindb} {kindc}".strip() if kindb and kindc else kindb or kindc or ''  # 사건분야
+        })
+
+    # 행별 INFO 대신 쿼리당 1줄 요약
+    if results:
+        from collections import Counter
+        kinda_counts = Counter(r['kinda'] for r in results)
+        logger.info("Result summary: %d rows, kinda=%s",
+                    len(results), kinda_counts.most_common(3))
+
+    return results
 
 def get_simple_search_stats() -> Dict[str, Any]:
     """모델 상태 및 통계 정보 반환"""
@@ -224,111 +695,55 @@ def get_simple_search_stats() -> Dict[str, Any]:
 
 def extract_year_from_text(*texts: str) -> str:
     """텍스트들에서 연도 정보 추출 (강화된 버전)"""
-    import re
-
-    logger.debug(f"연도 추출 시도 - 입력 텍스트 개수: {len(texts)}")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
     for i, text in enumerate(texts):
         if not text or str(text).strip() == '' or str(text) == 'nan':
-            logger.debug(f"텍스트 {i+1}: 빈 문자열 스킵")
             continue
 
         text = str(text).strip()
-        logger.debug(f"텍스트 {i+1} 분석 중: '{text[:50]}...'")
-
-        # 판례 문서에 특화된 확장된 연도 패턴
-        year_patterns = [
-            # 1순위: 한국 법원 사건번호 패턴 (가장 확실한 연도 정보)
-            r'(\d{4})고합\d*',     # 2018고합123
-            r'(\d{4})고단\d*',     # 2019고단456
-            r'(\d{4})나\d*',       # 2020나789
-            r'(\d{4})다\d*',       # 2021다123
-            r'(\d{4})누\d*',       # 행정소송
-            r'(\d{4})아\d*',       # 특별법
-            r'(\d{4})노\d*',       # 형사소송
-            r'(\d{4})구\d*',       # 구단
-            r'(\d{4})초\d*',       # 초기결정
-            r'(\d{4})재\d*',       # 재심
-
-            # 2순위: 판결/선고 관련 패턴
-            r'(\d{4})년.*?선고',     # 2022년 3월 15일 선고
-            r'(\d{4})년.*?판결',     # 2021년 판결
-            r'선고.*?(\d{4})년',     # 선고 2020년
-            r'판결.*?(\d{4})년',     # 판결 2019년
-
-            # 3순위: 일반적인 날짜 패턴
-            r'(\d{4})[년]',         # 2022년
-            r'(\d{4})\.\s*\d',      # 2023. 1
-            r'(\d{4})-\d',          # 2024-01
-            r'(\d{4})/\d',          # 2024/01
-
-            # 4순위: 사건 관련 패턴
-            r'사건.*?(\d{4})',      # 사건 2020
-            r'신청.*?(\d{4})',      # 신청 2021
-            r'처분.*?(\d{4})',      # 처분 2019
-
-            # 5순위: 기타 패턴 (덜 확실함)
-            r'(\d{4})\s+\d',        # 2025 01
-            r'[^\d](\d{4})[^\d]',   # 양쪽이 숫자가 아닌 4자리
-            r'^(\d{4})',            # 문자열 시작의 4자리
-            r'(\d{4})'              # 마지막 후보: 일반적인 4자리 숫자
-        ]
-
-        for pattern in year_patterns:
-            try:
-                matches = re.findall(pattern, text)
-                logger.debug(f"패턴 '{pattern}' 매치 결과: {matches}")
-
-                for match in matches:
-                    try:
-                        year = int(match)
-                        if 1990 <= year <= 2030:  # 범위를 1990-2030으로 조정
-                            logger.debug(f"✅ 연도 추출 성공: {year} (패턴: '{pattern}', 텍스트: '{text[:30]}...')")
-                            return str(year)
-                    except (ValueError, TypeError):
-                        continue
-            except Exception as e:
-                logger.debug(f"패턴 '{pattern}' 처리 중 오류: {e}")
-                continue
-
-    logger.debug("❌ 연도 추출 실패 - 모든 패턴에서 매치되지 않음")
+        if debug_enabled:
+            logger.debug("텍스트 %d 분석 중: '%s...'", i + 1, text[:50])
+
+        # 판례 문서에 특화된 확장된 연도 패턴 (모듈 로드 시 컴파일됨)
+        for pattern in _YEAR_PATTERNS:
+            for match in pattern.findall(text):
+                try:
+                    year = int(match)
+                except (ValueError, TypeError):
+                    continue
+                if 1990 <= year <= 2030:  # 범위를 1990-2030으로 조정
+                    if debug_enabled:
+                        logger.debug("✅ 연도 추출 성공: %d (패턴: '%s')",
+                                     year, pattern.pattern)
+                    return str(year)
+
+    if debug_enabled:
+        logger.debug("❌ 연도 추출 실패 - 모든 패턴에서 매치되지 않음")
     return '미상'
 
 def get_friendly_category(title: str, content: str) -> str:
     """제목과 내용을 기반으로 사용자 친화적인 카테고리 반환"""
-    title_lower = title.lower()
-    content_lower = content.lower()
-
     # 제목과 내용을 모두 검색
-    combined_text = f"{title_lower} {content_lower}"
-
-    # 추락사고
-    if any(word in combined_text for word in ["추락", "낙상", "떨어", "비계", "사다리", "고소", "높이", "옥상", "아래로"]):
-        return "추락사고"
-
-    # 기계사고
-    elif any(word in combined_text for word in ["끼임", "절단", "프레스", "기계", "크레인", "컨베이어", "끼여", "절단기", "압착"]):
-        return "기계사고"
-
-    # 화재사고
-    elif any(word in combined_text for word in ["화상", "화재", "폭발", "용접", "고온", "증기", "화염", "폭발", "열상"]):
-        return "화재사고"
-
-    # 교통사고
-    elif any(word in combined_text for word in ["교통", "차량", "충돌", "지게차", "화물차", "트럭", "버스", "승용차"]):
-        return "교통사고"
-
-    # 중독사고
-    elif any(word in combined_text for word in ["중독", "질식", "화학", "가스", "약품", "독성", "중독성", "흡입"]):
-        return "중독사고"
-
-    # 감전사고
-    elif any(word in combined_text for word in ["감전", "전기", "전선", "누전", "전류", "전압", "전기적"]):
-        return "감전사고"
+    combined_text = f"{title.lower()} {content.lower()}"
+
+    # Aho-Corasick: 한 번의 선형 스캔으로 모든 카테고리 키워드 매칭
+    if _CATEGORY_AC is not None:
+        best = None
+        for _, (priority, category) in _CATEGORY_AC.iter(combined_text):
+            if best is None or priority < best[0]:
+                best = (priority, category)
+                if priority == 0:  # 최우선 카테고리면 더 볼 필요 없음
+                    break
+        return best[1] if best else "산업재해"
+
+    # 폴백: 카테고리별 순차 스캔
+    for category, words in _CATEGORY_KEYWORDS:
+        if any(word in combined_text for word in words):
+            return category
 
     # 기타 산업재해
-    else:
-        return "산업재해"
+    return "산업재해"
 
 def format_court_date(date_str: str) -> str:
     """법원 날짜를 사용자 친화적으로 포맷"""
@@ -360,33 +775,22 @@ def _create_readable_summary(content: str, max_length: int = 500) -> str:
     if len(content) <= max_length:
         return content
 
-    # 문장 단위로 자르기 시도
-    sentences = content.split('. ')
-    result = ""
+    # 문장 단위로 자르기: 제한 내 마지막 문장 경계를 rfind 한 번으로 탐색
+    # (전체 문장 리스트 생성 + 누적 문자열 연결 대신 C 레벨 호출 1회)
+    cut = content.rfind('. ', 100, max_length - 3)
+    if cut != -1:  # 최소한의 의미있는 길이(100자) 이후의 경계만 사용
+        return content[:cut + 1] + "..."
 
-    for sentence in sentences:
-        # 다음 문장을 추가했을 때 길이가 초과되는지 확인
-        test_result = result + sentence + ". " if result else sentence + ". "
+    # 글자 단위로 자르되, 자연스러운 끝맺음 찾기
+    truncated = content[:max_length]
 
-        if len(test_result) <= max_length - 3:  # "..." 공간 확보
-            result = test_result
-        else:
+    # 마지막 공백이나 구두점에서 자르기
+    for i in range(len(truncated) - 1, max(0, len(truncated) - 50), -1):
+        if truncated[i] in (' ', '.', ',', '다', '고', '며', '음', '임'):
+            truncated = truncated[:i + 1]
             break
 
-    # 문장 단위로 잘렸으면 그것을 사용, 그렇지 않으면 글자 단위로 자르기
-    if result and len(result) > 100:  # 최소한의 의미있는 길이
-        return result.rstrip() + "..."
-    else:
-        # 글자 단위로 자르되, 자연스러운 끝맺음 찾기
-        truncated = content[:max_length]
-
-        # 마지막 공백이나 구두점에서 자르기
-        for i in range(len(truncated) - 1, max(0, len(truncated) - 50), -1):
-            if truncated[i] in [' ', '.', ',', '다', '고', '며', '음', '임']:
-                truncated = truncated[:i + 1]
-                break
-
-        return truncated + "..."
+    return truncated + "..."
 
 def debug_model_structure():
     """pkl 파일의 정확한 구조 디버그 (개발용)"""
@@ -505,17 +909,17 @@ def get_precedent_detail(case_id: str) -> Optional[Dict[str, Any]]:
         # 데이터 조회
         row = _df.iloc[idx]
 
-        title = str(row.get('title', 'Unknown Title'))
-        court = str(row.get('courtname', 'Unknown Court'))
-        date = format_court_date(str(row.get('kinda', 'Unknown Date')))
+        title = row.get('title') or 'Unknown Title'
+        court = row.get('courtname') or 'Unknown Court'
+        date = format_court_date(row.get('kinda') or 'Unknown Date')
 
         # 전체 내용 (요약하지 않음)
-        full_content = str(row.get('noncontent', ''))
+        full_content = row.get('noncontent') or ''
 
         # 추가 정보
-        case_number = str(row.get('caseno', '사건번호 미상'))
-        plaintiff = str(row.get('plaintiff', '원고 정보 미상'))
-        defendant = str(row.get('defendant', '피고 정보 미상'))
+        case_number = row.get('caseno') or '사건번호 미상'
+        plaintiff = row.get('plaintiff') or '원고 정보 미상'
+        defendant = row.get('defendant') or '피고 정보 미상'
 
         # 카테고리
         category = get_friendly_category(title, full_content)
@@ -551,19 +955,13 @@ def extract_keywords_from_content(content: str, max_keywords: int = 10) -> List[
     if not content:
         return []
 
-    # 산재 관련 주요 키워드들
-    important_terms = [
-        '산업재해', '업무상', '재해', '부상', '사망', '질병',
-        '안전보건', '작업', '근로자', '사업주', '보상금',
-        '치료비', '휴업급여', '장해급여', '유족급여', '장해등급',
-        '의료비', '간병비', '추락', '절단', '감전', '화상',
-        '중독', '골절', '염좌', '타박상'
-    ]
+    # Aho-Corasick: 26개 substring 검색 대신 본문 1회 스캔
+    if _TERMS_AC is not None:
+        found = {term for _, term in _TERMS_AC.iter(content)}
+        return [term for term in _IMPORTANT_TERMS if term in found][:max_keywords]
 
     found_keywords = []
-    content_lower = content.lower()
-
-    for term in important_terms:
+    for term in _IMPORTANT_TERMS:
         if term in content:
             found_keywords.append(term)
             if len(found_keywords) >= max_keywords:
@@ -3,20 +3,115 @@ SANZERO Redis 캐싱 시스템
 AI 판례 분석 결과 캐싱을 통한 성능 최적화
 """
 
+import asyncio
+import threading
 import json
 import hashlib
 import time
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 from loguru import logger
 
 try:
-    import redis
+    import redis.asyncio as aioredis
     REDIS_AVAILABLE = True
 except ImportError:
     logger.warning("Redis not available. Caching will be disabled.")
     REDIS_AVAILABLE = False
 
+# orjson 직렬화 - 선택적 import (없으면 stdlib json 유지)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(data: Dict[str, Any]) -> bytes:
+    """dict → JSON 바이트 (orjson 우선)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Dict[str, Any]:
+    """JSON 바이트 → dict (orjson 우선)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# blake3 해시 - 선택적 import (없으면 hashlib.sha256 유지)
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+
+def _hash_key(key_bytes: bytes) -> str:
+    """캐시 키용 16자리 hex 해시 (64비트면 충돌 회피에 충분)"""
+    if BLAKE3_AVAILABLE:
+        return blake3(key_bytes).hexdigest(length=8)
+    return hashlib.sha256(key_bytes).hexdigest()[:16]
+
+
+# 인프로세스 L1 캐시 - 선택적 import (없으면 Redis 단독 운용)
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
+# zstd 압축 - 선택적 import (없으면 gzip+base64 경로 유지)
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# 페이로드가 이보다 작으면 압축하지 않고 원본 JSON 바이트를 저장
+_COMPRESSION_MIN_BYTES = 200
+
+# 저장 포맷 매직 바이트 (첫 바이트로 코덱 판별 - JSON은 '{'/'['로 시작하므로 충돌 없음)
+_MAGIC_RAW = b'\x00'
+_MAGIC_GZIP = b'\x01'
+_MAGIC_ZSTD = b'\x02'
+
+# 값을 바이트로 다루므로 응답 디코딩은 끔 (base64 왕복 제거의 전제)
+_CACHE_DECODE_RESPONSES = False
+
+# 초 단위 해상도로 캐시된 ISO 타임스탬프 (요청마다 syscall + 문자열 생성 방지)
+_iso_cache = ("", float("-inf"))
+
+
+def _now_iso() -> str:
+    """초 해상도 ISO 타임스탬프 (1초 내 재호출은 캐시 반환)"""
+    global _iso_cache
+    mono = time.monotonic()
+    if mono - _iso_cache[1] > 1.0:
+        _iso_cache = (datetime.now().isoformat(), mono)
+    return _iso_cache[0]
+
+@lru_cache(maxsize=4096)
+def _compute_cache_key(key_prefix: str, normalized_query: str, top_k: int,
+                       include_rag: bool, timeout: int, threshold: float) -> str:
+    """정규화된 매개변수 튜플 → 캐시 키 (LRU 메모이즈)"""
+    # 고정 필드 순서의 바이트 연결이면 정렬된 JSON 직렬화와 동일한
+    # 정규형을 공짜로 얻음 (dict 할당 + 인코더 호출 제거)
+    key_bytes = b"%s|%d|%d|%d|%s" % (
+        normalized_query.encode('utf-8'),
+        top_k,
+        int(include_rag),
+        int(timeout),
+        repr(threshold).encode('ascii')
+    )
+
+    # 해시 생성 (blake3 우선, 없으면 SHA-256)
+    return f"{key_prefix}{_hash_key(key_bytes)}"
+
+
 class SearchCache:
     """
     판례 검색 결과 캐싱 클래스
@@ -33,7 +128,8 @@ class SearchCache:
         redis_url: str = "redis://localhost:6379/0",
         default_ttl: int = 3600,  # 1시간
         key_prefix: str = "sanzero:precedent:",
-        enable_compression: bool = True
+        enable_compression: bool = True,
+        max_connections: int = 20
     ):
         self.redis_client = None
         self.default_ttl = default_ttl
@@ -41,17 +137,44 @@ class SearchCache:
         self.enable_compression = enable_compression
         self.stats = {
             "cache_hits": 0,
+            "l1_hits": 0,
             "cache_misses": 0,
             "cache_sets": 0,
             "cache_errors": 0,
             "total_requests": 0
         }
 
+        # L1: 인프로세스 TTL 캐시. 압축된 바이트를 저장해 반환값이
+        # 호출부에서 변형돼도 (request_id 주입 등) 공유 상태가 오염되지 않음
+        self._l1 = (TTLCache(maxsize=1024, ttl=min(300, default_ttl))
+                    if CACHETOOLS_AVAILABLE else None)
+
+        # 비동기 클라이언트는 실제 연결을 첫 명령 시점에 맺으므로
+        # 여기서는 풀만 구성하고 ping은 _ensure_connection에서 1회 수행
+        self._connection_verified = False
+
+        # UNLINK 미지원(Redis < 4) 서버에서 DEL로 폴백하기 위한 플래그
+        self._unlink_supported = True
+
+        # 자동 파이프라이닝: 같은 이벤트 루프 틱에 들어온 GET들을 모아
+        # 파이프라인 한 번으로 flush (동시 검색 요청의 라운드트립 병합)
+        self._pending_gets: List[tuple] = []
+        self._flush_scheduled = False
+
         if REDIS_AVAILABLE:
             try:
-                self.redis_client = redis.from_url(redis_url, decode_responses=True)
-                # 연결 테스트
-                self.redis_client.ping()
+                pool = aioredis.ConnectionPool.from_url(
+                    redis_url,
+                    max_connections=max_connections,
+                    decode_responses=_CACHE_DECODE_RESPONSES
+                )
+                self.redis_client = aioredis.Redis(connection_pool=pool)
+
+                # zstd 컨텍스트는 재사용 가능하므로 1회 생성
+                # (사전 학습은 대표 샘플 수집 체계가 없어 적용하지 않음)
+                if ZSTD_AVAILABLE:
+                    self._zstd_compressor = zstd.ZstdCompressor(level=3)
+                    self._zstd_decompressor = zstd.ZstdDecompressor()
                 logger.info(f"Redis cache initialized: {redis_url}")
             except Exception as e:
                 logger.warning(f"Redis connection failed: {e}. Caching disabled.")
@@ -59,6 +182,69 @@ class SearchCache:
         else:
             logger.warning("Redis not available. Caching disabled.")
 
+    async def _ensure_connection(self) -> bool:
+        """첫 사용 시 연결을 검증 (실패하면 캐시 비활성화)"""
+        if self.redis_client is None:
+            return False
+
+        if not self._connection_verified:
+            try:
+                await self.redis_client.ping()
+                self._connection_verified = True
+            except Exception as e:
+                logger.warning(f"Redis connection failed: {e}. Caching disabled.")
+                self.redis_client = None
+                return False
+
+        return True
+
+    async def _pipelined_get(self, cache_key: str):
+        """
+        이벤트 루프 틱 단위 자동 파이프라이닝 GET
+
+        같은 틱에 큐잉된 GET들을 _flush_gets가 파이프라인 하나로 모아
+        실행합니다. 단건이면 일반 GET과 동일하게 동작합니다.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_gets.append((cache_key, future))
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(lambda: asyncio.ensure_future(self._flush_gets()))
+
+        return await future
+
+    async def _flush_gets(self):
+        """큐잉된 GET들을 파이프라인 한 번으로 실행"""
+        pending, self._pending_gets = self._pending_gets, []
+        self._flush_scheduled = False
+
+        if not pending:
+            return
+
+        try:
+            if len(pending) == 1:
+                cache_key, future = pending[0]
+                value = await self.redis_client.get(cache_key)
+                if not future.done():
+                    future.set_result(value)
+                return
+
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for cache_key, _ in pending:
+                    pipe.get(cache_key)
+                values = await pipe.execute()
+
+            for (_, future), value in zip(pending, values):
+                if not future.done():
+                    future.set_result(value)
+
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+
     def _make_cache_key(self, query: str, params: Dict[str, Any] = None) -> str:
         """
         캐시 키 생성
@@ -70,62 +256,74 @@ class SearchCache:
         Returns:
             str: 해시된 캐시 키
         """
-        # 쿼리 정규화
-        normalized_query = query.strip().lower()
-
         # 매개변수 정규화
         if params is None:
             params = {}
 
-        cache_params = {
-            "query": normalized_query,
-            "top_k": params.get("top_k", 10),
-            "include_rag": params.get("include_rag_analysis", False),
-            "timeout": params.get("timeout_seconds", 30),
-            "threshold": params.get("threshold", 0.5)
-        }
-
-        # JSON 문자열로 직렬화 (정렬된 키)
-        key_str = json.dumps(cache_params, sort_keys=True, ensure_ascii=False)
-
-        # SHA-256 해시 생성
-        hash_obj = hashlib.sha256(key_str.encode('utf-8'))
-        cache_key = f"{self.key_prefix}{hash_obj.hexdigest()[:16]}"
-
-        return cache_key
-
-    def _compress_data(self, data: Dict[str, Any]) -> str:
-        """데이터 압축 (간단한 JSON 압축)"""
-        if not self.enable_compression:
-            return json.dumps(data, ensure_ascii=False, default=str)
+        # miss→계산→set 흐름에서 같은 (쿼리, 매개변수) 키를 두 번 해시하지
+        # 않도록 해시 가능한 튜플로 펼쳐 메모이즈된 헬퍼에 위임
+        return _compute_cache_key(
+            self.key_prefix,
+            query.strip().lower(),
+            params.get("top_k", 10),
+            params.get("include_rag_analysis", False),
+            params.get("timeout_seconds", 30),
+            params.get("threshold", 0.5)
+        )
+
+    def _compress_data(self, data: Dict[str, Any]) -> bytes:
+        """데이터 직렬화 + 압축 (매직 바이트 1개 + 바이트 페이로드)"""
+        payload = _json_dumps(data)
+
+        # 작은 페이로드는 압축 오버헤드가 이득보다 큼
+        if not self.enable_compression or len(payload) < _COMPRESSION_MIN_BYTES:
+            return _MAGIC_RAW + payload
 
         try:
-            import gzip
-            import base64
+            if ZSTD_AVAILABLE:
+                return _MAGIC_ZSTD + self._zstd_compressor.compress(payload)
 
-            json_str = json.dumps(data, ensure_ascii=False, default=str)
-            compressed = gzip.compress(json_str.encode('utf-8'))
-            encoded = base64.b64encode(compressed).decode('ascii')
+            import gzip
+            return _MAGIC_GZIP + gzip.compress(payload)
 
-            return f"gzip:{encoded}"
         except Exception as e:
             logger.warning(f"Compression failed: {e}. Using uncompressed.")
-            return json.dumps(data, ensure_ascii=False, default=str)
+            return _MAGIC_RAW + payload
 
-    def _decompress_data(self, data_str: str) -> Dict[str, Any]:
-        """데이터 압축 해제"""
+    def _decompress_data(self, data: bytes) -> Dict[str, Any]:
+        """데이터 압축 해제 (매직 바이트 디스패치, 구형 포맷 호환)"""
         try:
-            if data_str.startswith("gzip:"):
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            if not data:
+                return {}
+
+            # 신형 포맷: 첫 바이트가 코덱을 지정 (branch 1회)
+            magic = data[:1]
+            if magic == _MAGIC_RAW:
+                return _json_loads(data[1:])
+            if magic == _MAGIC_ZSTD:
+                if not ZSTD_AVAILABLE:
+                    logger.error("zstd entry found but zstandard not installed")
+                    return {}
+                return _json_loads(self._zstd_decompressor.decompress(data[1:]))
+            if magic == _MAGIC_GZIP:
                 import gzip
-                import base64
+                return _json_loads(gzip.decompress(data[1:]))
 
-                encoded_data = data_str[5:]  # "gzip:" 제거
-                compressed = base64.b64decode(encoded_data.encode('ascii'))
-                json_str = gzip.decompress(compressed).decode('utf-8')
+            # 구형 포맷: 문자열 프리픽스 또는 순수 JSON
+            if data.startswith(b"zstd:"):
+                if not ZSTD_AVAILABLE:
+                    logger.error("zstd entry found but zstandard not installed")
+                    return {}
+                return _json_loads(self._zstd_decompressor.decompress(data[5:]))
 
-                return json.loads(json_str)
-            else:
-                return json.loads(data_str)
+            if data.startswith(b"gzip:"):
+                import gzip
+                import base64
+                return _json_loads(gzip.decompress(base64.b64decode(data[5:])))
+
+            return _json_loads(data)
         except Exception as e:
             logger.error(f"Decompression failed: {e}")
             return {}
@@ -147,25 +345,36 @@ class SearchCache:
         """
         self.stats["total_requests"] += 1
 
-        if not self.redis_client:
+        if not await self._ensure_connection():
             self.stats["cache_misses"] += 1
             return None
 
         try:
             cache_key = self._make_cache_key(query, params)
-            cached_data = self.redis_client.get(cache_key)
+
+            # L1 히트: 네트워크 왕복 없이 로컬 바이트에서 복원
+            cached_data = self._l1.get(cache_key) if self._l1 is not None else None
+            if cached_data is not None:
+                self.stats["l1_hits"] += 1
+            else:
+                cached_data = await self._pipelined_get(cache_key)
+                if cached_data and self._l1 is not None:
+                    self._l1[cache_key] = cached_data
 
             if cached_data:
-                result = self._decompress_data(cached_data)
-                if result:
+                envelope = self._decompress_data(cached_data)
+                if envelope:
                     self.stats["cache_hits"] += 1
 
+                    # 봉투 해제 (구형 항목은 결과 자체가 최상위에 있음)
+                    result = envelope.get("payload", envelope)
+
                     # 캐시 메타데이터 추가
                     result["cache_info"] = {
                         "cache_hit": True,
-                        "cached_at": result.get("cached_at", "unknown"),
+                        "cached_at": envelope.get("cached_at", "unknown"),
                         "cache_key": cache_key[:8] + "...",  # 보안상 일부만 표시
-                        "retrieval_time": datetime.now().isoformat()
+                        "retrieval_time": _now_iso()
                     }
 
                     logger.info(f"Cache HIT for query: {query[:50]}...")
@@ -199,23 +408,27 @@ class SearchCache:
         Returns:
             bool: 캐싱 성공 여부
         """
-        if not self.redis_client:
+        if not await self._ensure_connection():
             return False
 
         try:
             cache_key = self._make_cache_key(query, params)
             ttl = ttl or self.default_ttl
 
-            # 캐시 메타데이터 추가
-            cache_data = result.copy()
-            cache_data["cached_at"] = datetime.now().isoformat()
-            cache_data["cache_ttl"] = ttl
-            cache_data["query_hash"] = cache_key
+            # 캐시 메타데이터는 결과를 복사하지 않고 봉투로 감싸 참조로 중첩
+            # (cache_ttl은 Redis TTL로, query_hash는 호출부가 이미 아는 키라
+            #  페이로드에 중복 저장하지 않음)
+            cache_data = {
+                "cached_at": _now_iso(),
+                "payload": result
+            }
 
-            # 데이터 압축 및 저장
+            # 데이터 압축 및 저장 (L1에도 동일 바이트 기록)
             compressed_data = self._compress_data(cache_data)
+            if self._l1 is not None:
+                self._l1[cache_key] = compressed_data
 
-            success = self.redis_client.setex(
+            success = await self.redis_client.setex(
                 cache_key,
                 ttl,
                 compressed_data
@@ -233,14 +446,16 @@ class SearchCache:
             logger.error(f"Cache storage error: {e}")
             return False
 
-    def invalidate_cache(self, query: str, params: Dict[str, Any] = None) -> bool:
+    async def invalidate_cache(self, query: str, params: Dict[str, Any] = None) -> bool:
         """특정 쿼리의 캐시 무효화"""
-        if not self.redis_client:
+        if not await self._ensure_connection():
             return False
 
         try:
             cache_key = self._make_cache_key(query, params)
-            result = self.redis_client.delete(cache_key)
+            if self._l1 is not None:
+                self._l1.pop(cache_key, None)
+            result = await self._unlink_keys([cache_key])
 
             if result:
                 logger.info(f"Cache invalidated for query: {query[:50]}...")
@@ -252,27 +467,60 @@ class SearchCache:
             logger.error(f"Cache invalidation error: {e}")
             return False
 
-    def clear_all_cache(self) -> int:
+    async def clear_all_cache(self) -> int:
         """모든 SANZERO 캐시 삭제"""
-        if not self.redis_client:
+        if not await self._ensure_connection():
             return 0
 
         try:
+            if self._l1 is not None:
+                self._l1.clear()
+
             pattern = f"{self.key_prefix}*"
-            keys = self.redis_client.keys(pattern)
 
-            if keys:
-                deleted = self.redis_client.delete(*keys)
-                logger.info(f"Cleared {deleted} cache entries")
-                return deleted
+            # KEYS는 서버 전체 키스페이스를 블로킹 스캔하므로 SCAN으로 대체하고,
+            # 삭제는 500개 단위 파이프라인으로 묶어 라운드트립을 줄임
+            deleted = 0
+            batch = []
+            async for key in self.redis_client.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += await self._delete_batch(batch)
+                    batch = []
 
-            return 0
+            if batch:
+                deleted += await self._delete_batch(batch)
+
+            if deleted:
+                logger.info(f"Cleared {deleted} cache entries")
+            return deleted
 
         except Exception as e:
             logger.error(f"Cache clear error: {e}")
             return 0
 
-    def get_cache_stats(self) -> Dict[str, Any]:
+    async def _delete_batch(self, keys: List[str]) -> int:
+        """키 배치를 파이프라인 하나로 삭제"""
+        return await self._unlink_keys(keys)
+
+    async def _unlink_keys(self, keys: List[str]) -> int:
+        """
+        키 삭제 (UNLINK 우선)
+
+        UNLINK는 메모리 해제를 백그라운드 스레드로 미뤄 큰 압축 페이로드를
+        지울 때 Redis 메인 스레드를 블로킹하지 않습니다. 미지원 서버는
+        첫 실패 후 DEL로 폴백합니다.
+        """
+        if self._unlink_supported:
+            try:
+                return int(await self.redis_client.unlink(*keys))
+            except Exception as e:
+                logger.info(f"UNLINK not supported ({e}), falling back to DEL")
+                self._unlink_supported = False
+
+        return int(await self.redis_client.delete(*keys))
+
+    async def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 조회"""
         hit_rate = 0
         if self.stats["total_requests"] > 0:
@@ -286,10 +534,10 @@ class SearchCache:
             "default_ttl": self.default_ttl
         })
 
-        if self.redis_client:
+        if await self._ensure_connection():
             try:
                 # Redis 서버 정보
-                info = self.redis_client.info()
+                info = await self.redis_client.info()
                 stats["redis_info"] = {
                     "used_memory": info.get("used_memory_human", "N/A"),
                     "connected_clients": info.get("connected_clients", 0),
@@ -300,7 +548,7 @@ class SearchCache:
 
         return stats
 
-    def health_check(self) -> Dict[str, Any]:
+    async def health_check(self) -> Dict[str, Any]:
         """캐시 시스템 헬스체크"""
         health = {
             "status": "healthy",
@@ -325,16 +573,19 @@ class SearchCache:
 
         try:
             # 연결 테스트
-            self.redis_client.ping()
+            await self.redis_client.ping()
             health["redis_available"] = True
             health["connection_test"] = True
 
-            # 간단한 쓰기/읽기 테스트
+            # 간단한 쓰기/읽기/정리 테스트 - 파이프라인 하나로 왕복 1회
             test_key = f"{self.key_prefix}health_test"
-            test_value = f"test_{int(time.time())}"
+            test_value = f"test_{int(time.time())}".encode('ascii')
 
-            self.redis_client.setex(test_key, 10, test_value)
-            retrieved = self.redis_client.get(test_key)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.setex(test_key, 10, test_value)
+                pipe.get(test_key)
+                pipe.delete(test_key)
+                _, retrieved, _ = await pipe.execute()
 
             if retrieved == test_value:
                 health["status"] = "healthy"
@@ -342,9 +593,6 @@ class SearchCache:
                 health["status"] = "degraded"
                 health["error"] = "Read/write test failed"
 
-            # 테스트 키 정리
-            self.redis_client.delete(test_key)
-
         except Exception as e:
             health.update({
                 "status": "unhealthy",
@@ -355,25 +603,32 @@ class SearchCache:
 
 # 전역 캐시 인스턴스
 _cache_instance: Optional[SearchCache] = None
+_instance_lock = threading.Lock()
 
 def get_cache_instance(
     redis_url: str = "redis://localhost:6379/0",
     **kwargs
 ) -> SearchCache:
-    """전역 캐시 인스턴스 반환"""
+    """전역 캐시 인스턴스 반환 (이중 검사 잠금, 생성 후에는 잠금 없는 경로)"""
     global _cache_instance
 
-    if _cache_instance is None:
-        _cache_instance = SearchCache(redis_url=redis_url, **kwargs)
+    # 빠른 경로: 이미 생성됐으면 잠금 없이 반환
+    instance = _cache_instance
+    if instance is not None:
+        return instance
 
-    return _cache_instance
+    with _instance_lock:
+        if _cache_instance is None:
+            # 동시 호출이 커넥션 풀을 두 벌 만들지 않도록 잠금 안에서 생성
+            _cache_instance = SearchCache(redis_url=redis_url, **kwargs)
+        return _cache_instance
 
-def init_cache(redis_url: str = "redis://localhost:6379/0", **kwargs):
+async def init_cache(redis_url: str = "redis://localhost:6379/0", **kwargs):
     """캐시 초기화 (앱 시작 시 호출)"""
     global _cache_instance
     _cache_instance = SearchCache(redis_url=redis_url, **kwargs)
 
-    health = _cache_instance.health_check()
+    health = await _cache_instance.health_check()
     if health["status"] == "healthy":
         logger.info("Cache system initialized successfully")
     else:
@@ -400,12 +655,12 @@ async def get_cached_search_result(
     cache = get_cache_instance()
     return await cache.get_cached_result(query, params or {})
 
-def get_cache_statistics() -> Dict[str, Any]:
+async def get_cache_statistics() -> Dict[str, Any]:
     """캐시 통계 조회"""
     cache = get_cache_instance()
-    return cache.get_cache_stats()
+    return await cache.get_cache_stats()
 
-def clear_cache() -> int:
+async def clear_cache() -> int:
     """모든 캐시 삭제"""
     cache = get_cache_instance()
-    return cache.clear_all_cache()
\ No newline at end of file
+    return await cache.clear_all_cache()
\ No newline at end of file
@@ -4,11 +4,9 @@ SANZERO 설정 관리
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from dotenv import load_dotenv
-
-load_dotenv()
 
 class Settings(BaseSettings):
     """앱 설정 클래스"""
@@ -49,8 +47,10 @@ class Settings(BaseSettings):
     ]
 
     # 파일 업로드 설정
+    # 확장자 검사(`ext in ...`)가 O(1)이 되도록 frozenset 사용 (소문자 기준)
     max_file_size: int = 10 * 1024 * 1024  # 10MB
-    allowed_file_types: list = [".pdf", ".jpg", ".jpeg", ".png", ".doc", ".docx"]
+    allowed_file_types: frozenset = frozenset(
+        {".pdf", ".jpg", ".jpeg", ".png", ".doc", ".docx"})
 
     # AI 설정
     openai_api_key: Optional[str] = None
@@ -71,8 +71,21 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     log_format: str = "<green>{time}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
 
-# 설정 인스턴스 생성
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """설정 인스턴스 반환 (1회 생성 후 캐시, 테스트에서 cache_clear로 교체 가능)"""
+    return Settings()
+
+
+# 설정 인스턴스 생성 (기존 import 경로 호환용)
+settings = get_settings()
+
+# 요청 경로에서 반복해 읽는 값은 pydantic 디스크립터를 거치지 않도록
+# import 시점에 일반 파이썬 값으로 스냅샷 (설정은 기동 후 불변)
+_ENVIRONMENT = settings.environment
+_SUPABASE_URL = settings.supabase_url
+_CORS_DEV = tuple(settings.allowed_origins) + ("http://localhost:3000",)
+_CORS_PROD = tuple(settings.allowed_origins)
 
 # 설정 검증
 def validate_settings():
@@ -100,18 +113,18 @@ def validate_settings():
 # 환경별 설정
 def get_database_url() -> str:
     """데이터베이스 URL 반환"""
-    return settings.supabase_url
+    return _SUPABASE_URL
 
 def get_cors_origins() -> list:
     """CORS 허용 도메인 반환"""
-    if settings.environment == "development":
-        return settings.allowed_origins + ["http://localhost:3000"]
-    return settings.allowed_origins
+    if _ENVIRONMENT == "development":
+        return list(_CORS_DEV)
+    return list(_CORS_PROD)
 
 def is_development() -> bool:
     """개발 환경 여부 확인"""
-    return settings.environment == "development"
+    return _ENVIRONMENT == "development"
 
 def is_production() -> bool:
     """프로덕션 환경 여부 확인"""
-    return settings.environment == "production"
\ No newline at end of file
+    return _ENVIRONMENT == "production"
\ No newline at end of file
@@ -6,6 +6,7 @@ Supabase REST API 직접 사용 (Python 클라이언트 401 에러 우회)
 from supabase import create_client, Client
 from app.utils.config import settings, validate_settings
 import asyncio
+import time
 from typing import Optional, Dict, Any, List
 import json
 import httpx
@@ -14,13 +15,82 @@ from loguru import logger
 # 설정 검증
 validate_settings()
 
+# orjson - 선택적 import (REST 응답 디코딩 가속, 없으면 httpx 기본 json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads_response(response: httpx.Response):
+    """REST 응답 본문을 JSON으로 디코딩 (orjson 우선)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+# 사용자 조회 캐시 - 선택적 import (인증 미들웨어가 요청마다 조회하는 행)
+try:
+    from cachetools import TTLCache
+    _user_cache_by_id: Optional[Dict] = TTLCache(maxsize=10_000, ttl=60)
+    _user_cache_by_email: Optional[Dict] = TTLCache(maxsize=10_000, ttl=60)
+except ImportError:
+    _user_cache_by_id = None
+    _user_cache_by_email = None
+
+
+def _cache_user_row(user: Dict[str, Any]):
+    """사용자 행을 양쪽 캐시에 기록"""
+    if _user_cache_by_id is not None and user.get("id"):
+        _user_cache_by_id[user["id"]] = user
+    if _user_cache_by_email is not None and user.get("email"):
+        _user_cache_by_email[user["email"]] = user
+
+
+def _invalidate_user_cache(user_id: Optional[str] = None, email: Optional[str] = None):
+    """사용자 캐시 무효화 (쓰기 경로에서 호출)"""
+    if _user_cache_by_id is not None and user_id:
+        _user_cache_by_id.pop(user_id, None)
+    if _user_cache_by_email is not None and email:
+        _user_cache_by_email.pop(email, None)
+
+
+def clear_user_cache():
+    """사용자 캐시 전체 비우기 (관리자 훅)"""
+    if _user_cache_by_id is not None:
+        _user_cache_by_id.clear()
+    if _user_cache_by_email is not None:
+        _user_cache_by_email.clear()
+
 # REST API 직접 호출을 위한 httpx 클라이언트
-async_http_client = httpx.AsyncClient(timeout=30.0)
+# - keepalive 풀을 명시해 핫패스의 TLS 핸드셰이크 재수행을 방지
+# - h2 패키지가 있으면 HTTP/2 멀티플렉싱 사용 (동시 호출이 한 연결 공유)
+# - 연결 단계 오류는 transport 레벨에서 2회 재시도
+def _build_http_client() -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=20,
+        max_keepalive_connections=10,
+        keepalive_expiry=30.0
+    )
+    timeout = httpx.Timeout(30.0, connect=5.0)
 
-# Supabase REST API 헤더
-def get_rest_headers(use_service_role=True):
-    """REST API 헤더 생성"""
-    key = settings.supabase_service_role_key if use_service_role else settings.supabase_anon_key
+    try:
+        transport = httpx.AsyncHTTPTransport(retries=2, limits=limits, http2=True)
+    except ImportError:
+        transport = httpx.AsyncHTTPTransport(retries=2, limits=limits)
+
+    return httpx.AsyncClient(timeout=timeout, transport=transport)
+
+
+async_http_client = _build_http_client()
+
+
+async def close_http_client():
+    """앱 종료 시 커넥션 풀 정리 (main.py shutdown 이벤트에서 호출)"""
+    await async_http_client.aclose()
+
+# Supabase REST API 헤더 (키는 기동 후 불변이므로 두 변형을 import 시 1회 구성)
+def _make_rest_headers(key: str) -> Dict[str, str]:
     return {
         "apikey": key,
         "Authorization": f"Bearer {key}",
@@ -28,6 +98,15 @@ def get_rest_headers(use_service_role=True):
         "Prefer": "return=representation"
     }
 
+
+_HEADERS_SERVICE = _make_rest_headers(settings.supabase_service_role_key)
+_HEADERS_ANON = _make_rest_headers(settings.supabase_anon_key)
+
+
+def get_rest_headers(use_service_role=True):
+    """REST API 헤더 반환 (변형이 필요하면 dict(...)로 복사 후 수정할 것)"""
+    return _HEADERS_SERVICE if use_service_role else _HEADERS_ANON
+
 # Supabase 클라이언트 인스턴스 (Auth 용도로만 사용)
 try:
     from supabase.client import ClientOptions
@@ -61,45 +140,104 @@ class DatabaseManager:
         self.base_url = settings.supabase_url
         self.anon_client = anon_supabase
 
+    # (결과, monotonic 시각) - 프로브 폭주 흡수용
+    _conn_check_cache = (None, 0.0)
+
     async def test_connection(self) -> bool:
-        """데이터베이스 연결 테스트"""
+        """데이터베이스 연결 테스트
+
+        liveness 프로브가 수 초 간격으로 호출하므로 count() 집계 대신
+        HEAD + Prefer: count=estimated로 메타데이터만 확인하고,
+        결과를 5초간 캐시해 프로브 폭주를 흡수합니다.
+        """
+        cached_result, cached_at = DatabaseManager._conn_check_cache
+        if cached_result is not None and time.monotonic() - cached_at < 5.0:
+            return cached_result
+
         try:
-            url = f"{self.base_url}/rest/v1/users?select=count"
-            response = await async_http_client.get(url, headers=get_rest_headers())
+            response = await async_http_client.head(
+                f"{self.base_url}/rest/v1/users",
+                headers={**get_rest_headers(),
+                         "Prefer": "count=estimated", "Range": "0-0"})
 
-            if response.status_code == 200:
+            ok = response.status_code in (200, 206)
+            if ok:
                 logger.info(f"데이터베이스 연결 성공")
-                return True
             else:
                 logger.error(f"데이터베이스 연결 실패: {response.status_code} - {response.text}")
-                return False
+
+            DatabaseManager._conn_check_cache = (ok, time.monotonic())
+            return ok
         except Exception as e:
             logger.error(f"데이터베이스 연결 실패: {str(e)}")
+            DatabaseManager._conn_check_cache = (False, time.monotonic())
             return False
 
     async def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
-        """이메일로 사용자 조회"""
+        """이메일로 사용자 조회 (60초 TTL 캐시)"""
+        if _user_cache_by_email is not None:
+            cached = _user_cache_by_email.get(email)
+            if cached is not None:
+                return cached
+
         try:
-            url = f"{self.base_url}/rest/v1/users?email=eq.{email}&is_active=eq.true&limit=1"
-            response = await async_http_client.get(url, headers=get_rest_headers())
+            # httpx params= 인코딩으로 '+', '&', 비ASCII 주소를 안전하게 전달
+            response = await async_http_client.get(
+                f"{self.base_url}/rest/v1/users",
+                params={"email": f"eq.{email}", "is_active": "eq.true",
+                        "limit": 1, "select": "*"},
+                headers=get_rest_headers())
 
             if response.status_code == 200:
-                data = response.json()
-                return data[0] if data else None
+                data = _loads_response(response)
+                if data:
+                    _cache_user_row(data[0])
+                    return data[0]
+                return None
             return None
         except Exception as e:
             logger.warning(f"사용자 조회 실패 (email: {email}): {str(e)}")
             return None
 
-    async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """ID로 사용자 조회"""
+    async def get_users_by_emails(self, emails: List[str]) -> Dict[str, Dict[str, Any]]:
+        """이메일 목록으로 사용자 일괄 조회 (REST 호출 1회, N+1 제거)"""
+        if not emails:
+            return {}
+
         try:
-            url = f"{self.base_url}/rest/v1/users?id=eq.{user_id}&is_active=eq.true&limit=1"
+            from urllib.parse import quote
+            quoted_csv = ','.join(quote(email, safe='') for email in emails)
+            url = (f"{self.base_url}/rest/v1/users"
+                   f"?email=in.({quoted_csv})&is_active=eq.true&select=*")
             response = await async_http_client.get(url, headers=get_rest_headers())
 
             if response.status_code == 200:
-                data = response.json()
-                return data[0] if data else None
+                return {row["email"]: row for row in _loads_response(response)}
+            return {}
+        except Exception as e:
+            logger.warning(f"사용자 일괄 조회 실패 ({len(emails)}건): {str(e)}")
+            return {}
+
+    async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """ID로 사용자 조회 (60초 TTL 캐시 - 인증 경로의 반복 조회 흡수)"""
+        if _user_cache_by_id is not None:
+            cached = _user_cache_by_id.get(user_id)
+            if cached is not None:
+                return cached
+
+        try:
+            response = await async_http_client.get(
+                f"{self.base_url}/rest/v1/users",
+                params={"id": f"eq.{user_id}", "is_active": "eq.true",
+                        "limit": 1, "select": "*"},
+                headers=get_rest_headers())
+
+            if response.status_code == 200:
+                data = _loads_response(response)
+                if data:
+                    _cache_user_row(data[0])
+                    return data[0]
+                return None
             return None
         except Exception as e:
             logger.warning(f"사용자 조회 실패 (id: {user_id}): {str(e)}")
@@ -112,8 +250,9 @@ class DatabaseManager:
             response = await async_http_client.post(url, headers=get_rest_headers(), json=user_data)
 
             if response.status_code in [200, 201]:
-                data = response.json()
+                data = _loads_response(response)
                 logger.info(f"새 사용자 생성 성공: {user_data.get('email')}")
+                _invalidate_user_cache(user_data.get("id"), user_data.get("email"))
                 return data[0] if isinstance(data, list) else data
             else:
                 logger.error(f"사용자 생성 실패: {response.status_code} - {response.text}")
@@ -122,16 +261,44 @@ class DatabaseManager:
             logger.error(f"사용자 생성 실패: {str(e)}")
             return None
 
+    async def bulk_create_users(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """사용자 여러 명 일괄 생성 (PostgREST 벌크 insert - POST 1회)"""
+        if not rows:
+            return []
+
+        try:
+            url = f"{self.base_url}/rest/v1/users"
+            response = await async_http_client.post(
+                url, headers=get_rest_headers(), json=rows)
+
+            if response.status_code in [200, 201]:
+                data = _loads_response(response)
+                created = data if isinstance(data, list) else [data]
+                logger.info(f"사용자 일괄 생성 성공: {len(created)}건")
+                for row in rows:
+                    _invalidate_user_cache(row.get("id"), row.get("email"))
+                return created
+
+            logger.error(f"사용자 일괄 생성 실패: {response.status_code} - {response.text}")
+            return []
+        except Exception as e:
+            logger.error(f"사용자 일괄 생성 실패: {str(e)}")
+            return []
+
     async def update_user(self, user_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """사용자 정보 업데이트"""
         try:
-            url = f"{self.base_url}/rest/v1/users?id=eq.{user_id}"
-            response = await async_http_client.patch(url, headers=get_rest_headers(), json=update_data)
+            response = await async_http_client.patch(
+                f"{self.base_url}/rest/v1/users",
+                params={"id": f"eq.{user_id}"},
+                headers=get_rest_headers(), json=update_data)
 
             if response.status_code == 200:
-                data = response.json()
+                data = _loads_response(response)
                 logger.info(f"사용자 정보 업데이트 성공: {user_id}")
-                return data[0] if isinstance(data, list) else data
+                updated = data[0] if isinstance(data, list) else data
+                _invalidate_user_cache(user_id, (updated or {}).get("email"))
+                return updated
             else:
                 logger.error(f"사용자 정보 업데이트 실패: {response.status_code} - {response.text}")
                 return None
@@ -146,27 +313,53 @@ class DatabaseManager:
         limit: int = 20,
         offset: int = 0
     ) -> List[Dict[str, Any]]:
-        """보상금 신청 목록 조회"""
+        """보상금 신청 목록 조회 (신청자 정보를 임베디드 리소스로 함께 조회)"""
         try:
-            query = self.client.table("compensation_applications").select("*").eq("is_active", True)
+            # user 행을 임베드해 목록 순회 시 per-row 사용자 조회(N+1)를 제거
+            params = {
+                "select": "*,user:users(*)",
+                "is_active": "eq.true",
+                "order": "created_at.desc",
+                "limit": limit,
+                "offset": offset
+            }
 
             if user_id:
-                query = query.eq("user_id", user_id)
+                params["user_id"] = f"eq.{user_id}"
 
             if status:
-                query = query.eq("status", status)
+                params["status"] = f"eq.{status}"
 
-            result = query.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
-            return result.data
+            response = await async_http_client.get(
+                f"{self.base_url}/rest/v1/compensation_applications",
+                params=params, headers=get_rest_headers())
+
+            if response.status_code == 200:
+                return _loads_response(response)
+
+            logger.error(f"보상금 신청 목록 조회 실패: {response.status_code} - {response.text}")
+            return []
         except Exception as e:
             logger.error(f"보상금 신청 목록 조회 실패: {str(e)}")
             return []
 
     async def get_application_by_id(self, application_id: str) -> Optional[Dict[str, Any]]:
-        """보상금 신청 상세 조회"""
+        """보상금 신청 상세 조회 (신청자 정보 포함)"""
         try:
-            result = self.client.table("compensation_applications").select("*").eq("id", application_id).eq("is_active", True).single().execute()
-            return result.data
+            response = await async_http_client.get(
+                f"{self.base_url}/rest/v1/compensation_applications",
+                params={
+                    "select": "*,user:users(*)",
+                    "id": f"eq.{application_id}",
+                    "is_active": "eq.true",
+                    "limit": 1
+                },
+                headers=get_rest_headers())
+
+            if response.status_code == 200:
+                data = _loads_response(response)
+                return data[0] if data else None
+            return None
         except Exception as e:
             logger.warning(f"보상금 신청 조회 실패 (id: {application_id}): {str(e)}")
             return None
@@ -174,9 +367,17 @@ class DatabaseManager:
     async def create_compensation_application(self, application_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """보상금 신청 생성"""
         try:
-            result = self.client.table("compensation_applications").insert(application_data).execute()
-            logger.info(f"보상금 신청 생성 성공: {application_data.get('user_id')}")
-            return result.data[0] if result.data else None
+            response = await async_http_client.post(
+                f"{self.base_url}/rest/v1/compensation_applications",
+                headers=get_rest_headers(), json=application_data)
+
+            if response.status_code in [200, 201]:
+                data = _loads_response(response)
+                logger.info(f"보상금 신청 생성 성공: {application_data.get('user_id')}")
+                return data[0] if isinstance(data, list) and data else data or None
+
+            logger.error(f"보상금 신청 생성 실패: {response.status_code} - {response.text}")
+            return None
         except Exception as e:
             logger.error(f"보상금 신청 생성 실패: {str(e)}")
             return None
@@ -188,9 +389,18 @@ class DatabaseManager:
     ) -> Optional[Dict[str, Any]]:
         """보상금 신청 업데이트"""
         try:
-            result = self.client.table("compensation_applications").update(update_data).eq("id", application_id).execute()
-            logger.info(f"보상금 신청 업데이트 성공: {application_id}")
-            return result.data[0] if result.data else None
+            response = await async_http_client.patch(
+                f"{self.base_url}/rest/v1/compensation_applications",
+                params={"id": f"eq.{application_id}"},
+                headers=get_rest_headers(), json=update_data)
+
+            if response.status_code == 200:
+                data = _loads_response(response)
+                logger.info(f"보상금 신청 업데이트 성공: {application_id}")
+                return data[0] if isinstance(data, list) and data else data or None
+
+            logger.error(f"보상금 신청 업데이트 실패: {response.status_code} - {response.text}")
+            return None
         except Exception as e:
             logger.error(f"보상금 신청 업데이트 실패: {str(e)}")
             return None
@@ -203,16 +413,28 @@ class DatabaseManager:
     ) -> List[Dict[str, Any]]:
         """노무사 목록 조회"""
         try:
-            query = self.client.table("lawyers").select("*, users(*)").eq("is_active", True)
+            params = {
+                "select": "*,users(*)",
+                "is_active": "eq.true",
+                "order": "rating.desc",
+                "limit": limit
+            }
 
             if verified_only:
-                query = query.eq("is_verified", True)
+                params["is_verified"] = "eq.true"
 
             if specialty:
-                query = query.contains("specialties", [specialty])
+                params["specialties"] = "cs.{%s}" % specialty
 
-            result = query.order("rating", desc=True).limit(limit).execute()
-            return result.data
+            response = await async_http_client.get(
+                f"{self.base_url}/rest/v1/lawyers",
+                params=params, headers=get_rest_headers())
+
+            if response.status_code == 200:
+                return _loads_response(response)
+
+            logger.error(f"노무사 목록 조회 실패: {response.status_code} - {response.text}")
+            return []
         except Exception as e:
             logger.error(f"노무사 목록 조회 실패: {str(e)}")
             return []
@@ -227,18 +449,21 @@ class DatabaseManager:
     ) -> Optional[Dict[str, Any]]:
         """RPC 함수를 사용한 보상금 계산"""
         try:
-            result = self.client.rpc(
-                "calculate_personalized_compensation",
-                {
+            response = await async_http_client.post(
+                f"{self.base_url}/rest/v1/rpc/calculate_personalized_compensation",
+                headers=get_rest_headers(),
+                json={
                     "user_id_param": user_id,
                     "base_salary": base_salary,
                     "injury_severity": injury_severity,
                     "disability_grade": disability_grade,
                     "medical_costs": medical_costs
-                }
-            ).execute()
+                })
 
-            return result.data
+            if response.status_code == 200:
+                return _loads_response(response)
+            logger.error(f"보상금 계산 실패: {response.status_code} - {response.text}")
+            return None
         except Exception as e:
             logger.error(f"보상금 계산 실패: {str(e)}")
             return None
@@ -246,19 +471,59 @@ class DatabaseManager:
     async def find_matching_lawyers(self, application_id: str, max_results: int = 3) -> List[Dict[str, Any]]:
         """AI 기반 노무사 매칭"""
         try:
-            result = self.client.rpc(
-                "find_best_lawyer_match",
-                {
+            response = await async_http_client.post(
+                f"{self.base_url}/rest/v1/rpc/find_best_lawyer_match",
+                headers=get_rest_headers(),
+                json={
                     "application_id_param": application_id,
                     "max_results": max_results
-                }
-            ).execute()
+                })
 
-            return result.data
+            if response.status_code == 200:
+                return _loads_response(response)
+            logger.error(f"노무사 매칭 실패: {response.status_code} - {response.text}")
+            return []
         except Exception as e:
             logger.error(f"노무사 매칭 실패: {str(e)}")
             return []
 
+    async def get_application_full(
+        self,
+        application_id: str,
+        user_id: str,
+        base_salary: int,
+        injury_severity: str,
+        max_lawyer_results: int = 3
+    ) -> tuple:
+        """
+        신청 상세 페이지용 복합 조회
+
+        신청 상세 + 보상금 계산 + 노무사 매칭은 서로 의존성이 없으므로
+        asyncio.gather로 동시에 내보내 페이지 지연을 RTT 합에서 RTT
+        최대값으로 줄입니다. 한 호출이 실패해도 나머지는 유지됩니다.
+
+        Returns:
+            tuple: (application, compensation, matching_lawyers)
+        """
+        application, compensation, lawyers = await asyncio.gather(
+            self.get_application_by_id(application_id),
+            self.calculate_compensation(user_id, base_salary, injury_severity),
+            self.find_matching_lawyers(application_id, max_lawyer_results),
+            return_exceptions=True
+        )
+
+        if isinstance(application, Exception):
+            logger.error(f"신청 조회 실패: {application}")
+            application = None
+        if isinstance(compensation, Exception):
+            logger.error(f"보상금 계산 실패: {compensation}")
+            compensation = None
+        if isinstance(lawyers, Exception):
+            logger.error(f"노무사 매칭 실패: {lawyers}")
+            lawyers = []
+
+        return application, compensation, lawyers
+
 # 데이터베이스 매니저 인스턴스
 db = DatabaseManager()
 
@@ -297,6 +562,55 @@ async def create_analysis_requests_table():
         logger.warning(f"analysis_requests 테이블 확인 중 오류: {e}")
         return False
 
+async def _signup_test_account(account: Dict[str, Any], semaphore: asyncio.Semaphore,
+                               existing_emails: set) -> Optional[Dict[str, Any]]:
+    """테스트 계정 1건 Auth 가입 (세마포어로 동시성 제한)
+
+    users/lawyers 테이블 쓰기는 벌크 insert를 위해 호출부로 넘기고
+    여기서는 Auth 가입까지만 수행해 프로필 행을 돌려줍니다.
+    """
+    async with semaphore:
+        # 기존 사용자 확인 (일괄 조회 결과 재사용)
+        if account["email"] in existing_emails:
+            logger.info(f"테스트 계정이 이미 존재함: {account['email']}")
+            return None
+
+        try:
+            # Supabase Auth에 계정 생성
+            # (동기 클라이언트이므로 스레드로 내려 실제 동시 실행이 되게 함)
+            auth_response = await asyncio.to_thread(
+                anon_supabase.auth.sign_up,
+                {
+                    "email": account["email"],
+                    "password": account["password"],
+                    "options": {
+                        "data": {
+                            "username": account["username"],
+                            "user_type": account["user_type"]
+                        }
+                    }
+                }
+            )
+
+            if not auth_response.user:
+                logger.error(f"Supabase Auth 계정 생성 실패: {account['email']}")
+                return None
+
+            return {
+                "id": auth_response.user.id,
+                "email": account["email"],
+                "username": account["username"],
+                "user_type": account["user_type"],
+                "phone": account["phone"],
+                "address": account["address"],
+                "is_active": True
+            }
+
+        except Exception as e:
+            logger.error(f"테스트 계정 생성 오류 ({account['email']}): {str(e)}")
+            return None
+
+
 async def setup_test_accounts():
     """테스트 계정 및 초기 데이터 설정"""
     try:
@@ -329,73 +643,62 @@ async def setup_test_accounts():
             }
         ]
 
-        created_count = 0
-        for account in test_accounts:
-            # 기존 사용자 확인
-            existing_user = await db.get_user_by_email(account["email"])
-            if existing_user:
-                logger.info(f"테스트 계정이 이미 존재함: {account['email']}")
+        # 기존 사용자 여부는 per-account 조회 대신 in.(...) 일괄 조회 1회로 확인
+        existing_users = await db.get_users_by_emails(
+            [account["email"] for account in test_accounts])
+        existing_emails = set(existing_users)
+
+        # 1단계: Auth 가입을 동시에 실행 (전체 지연 = RTT 합 → RTT 최대값)
+        # Supabase HTTP 한도를 넘지 않도록 동시성은 5로 제한
+        semaphore = asyncio.Semaphore(5)
+        results = await asyncio.gather(
+            *(_signup_test_account(account, semaphore, existing_emails)
+              for account in test_accounts),
+            return_exceptions=True
+        )
+
+        user_rows = []
+        lawyer_accounts = []
+        for account, result in zip(test_accounts, results):
+            if isinstance(result, Exception):
+                logger.error(f"테스트 계정 생성 오류 ({account['email']}): {result}")
                 continue
+            if result:
+                user_rows.append(result)
+                if account["user_type"] == "lawyer":
+                    lawyer_accounts.append(result)
+
+        # 2단계: users 프로필을 POST 1회로 벌크 insert
+        created_users = await db.bulk_create_users(user_rows)
+        created_count = len(created_users)
+
+        # 3단계: 노무사 프로필도 insert 1회로 일괄 생성
+        if lawyer_accounts:
+            lawyer_rows = [
+                {
+                    "user_id": user["id"],
+                    "license_number": "LAW-2024-001",
+                    "office_name": "테스트 노무사 사무소",
+                    "office_address": "서울시 서초구 법조로 123, 7층",
+                    "specialties": ["산업재해", "근로기준법", "산업안전", "노동분쟁"],
+                    "experience_years": 5,
+                    "consultation_fee": 100000,
+                    "success_rate": 94.0,
+                    "rating": 4.8,
+                    "total_reviews": 247,
+                    "case_count": 156,
+                    "is_verified": True,
+                    "is_active": True
+                }
+                for user in lawyer_accounts
+            ]
 
             try:
-                # Supabase Auth에 계정 생성
-                auth_response = anon_supabase.auth.sign_up({
-                    "email": account["email"],
-                    "password": account["password"],
-                    "options": {
-                        "data": {
-                            "username": account["username"],
-                            "user_type": account["user_type"]
-                        }
-                    }
-                })
-
-                if auth_response.user:
-                    # users 테이블에 프로필 생성
-                    user_data = {
-                        "id": auth_response.user.id,
-                        "email": account["email"],
-                        "username": account["username"],
-                        "user_type": account["user_type"],
-                        "phone": account["phone"],
-                        "address": account["address"],
-                        "is_active": True
-                    }
-
-                    user = await db.create_user(user_data)
-                    if user:
-                        created_count += 1
-                        logger.info(f"테스트 계정 생성 성공: {account['email']}")
-
-                        # 노무사 계정인 경우 lawyers 테이블에도 추가
-                        if account["user_type"] == "lawyer":
-                            lawyer_data = {
-                                "user_id": user["id"],
-                                "license_number": "LAW-2024-001",
-                                "office_name": "테스트 노무사 사무소",
-                                "office_address": "서울시 서초구 법조로 123, 7층",
-                                "specialties": ["산업재해", "근로기준법", "산업안전", "노동분쟁"],
-                                "experience_years": 5,
-                                "consultation_fee": 100000,
-                                "success_rate": 94.0,
-                                "rating": 4.8,
-                                "total_reviews": 247,
-                                "case_count": 156,
-                                "is_verified": True,
-                                "is_active": True
-                            }
-
-                            lawyer_result = supabase.table("lawyers").insert(lawyer_data).execute()
-                            if lawyer_result.data:
-                                logger.info(f"노무사 프로필 생성 성공: {account['email']}")
-                    else:
-                        logger.error(f"사용자 프로필 생성 실패: {account['email']}")
-                else:
-                    logger.error(f"Supabase Auth 계정 생성 실패: {account['email']}")
-
+                lawyer_result = supabase.table("lawyers").insert(lawyer_rows).execute()
+                if lawyer_result.data:
+                    logger.info(f"노무사 프로필 일괄 생성 성공: {len(lawyer_result.data)}건")
             except Exception as e:
-                logger.error(f"테스트 계정 생성 오류 ({account['email']}): {str(e)}")
-                continue
+                logger.error(f"노무사 프로필 일괄 생성 실패: {str(e)}")
 
         logger.info(f"테스트 계정 설정 완료: {created_count}개 계정 생성")
         return created_count
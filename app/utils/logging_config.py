@@ -3,12 +3,29 @@ SANZERO 통합 로깅 설정
 표준 Python logging 모듈을 사용한 일관된 로깅 시스템
 """
 
+import atexit
 import logging
+import queue
 import sys
 import os
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from datetime import datetime
 
+# 파일 핸들러로 팬아웃하는 백그라운드 리스너 (setup_logging에서 구성)
+_queue_listener: QueueListener = None
+
+
+def _stop_queue_listener():
+    """리스너 정지 (중복 호출에 안전 - 재초기화와 atexit 양쪽에서 사용)"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging(level: str = "INFO") -> None:
     """
@@ -47,31 +64,44 @@ def setup_logging(level: str = "INFO") -> None:
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    # 콘솔 핸들러
+    # 기존 리스너가 있으면 정리 (재초기화 시 스레드 중복 방지)
+    global _queue_listener
+    _stop_queue_listener()
+
+    # 콘솔 핸들러 (개발 편의를 위해 직접 연결 유지)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(simple_formatter)
     root_logger.addHandler(console_handler)
 
-    # 일반 로그 파일 핸들러
-    file_handler = logging.FileHandler(
+    # 일반 로그 파일 핸들러 (순환 적용으로 무한 증가 방지)
+    file_handler = RotatingFileHandler(
         log_file,
-        mode='a',
+        maxBytes=50_000_000,
+        backupCount=5,
         encoding='utf-8'
     )
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(file_handler)
 
     # 에러 로그 파일 핸들러 (ERROR 이상만)
-    error_handler = logging.FileHandler(
+    error_handler = RotatingFileHandler(
         error_log_file,
-        mode='a',
+        maxBytes=50_000_000,
+        backupCount=5,
         encoding='utf-8'
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(error_handler)
+
+    # 파일 I/O는 요청 스레드/이벤트 루프를 막지 않도록 큐 뒤로 보냄:
+    # 로깅 호출은 queue.put, 실제 디스크 쓰기는 리스너 스레드가 수행
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    _queue_listener = QueueListener(
+        log_queue, file_handler, error_handler, respect_handler_level=True)
+    _queue_listener.start()
 
     # 외부 라이브러리 로그 레벨 조정
     logging.getLogger("httpx").setLevel(logging.WARNING)
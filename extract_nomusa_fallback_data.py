@@ -6,72 +6,108 @@ nomusa 더미 데이터에서 전문분야와 지역 데이터 추출
 import json
 from pathlib import Path
 
+# orjson - 선택적 import (대용량 덤프 직렬화 가속)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps_pretty(data) -> str:
+    """들여쓰기된 JSON 문자열 (orjson 우선)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=4)
+
+# 스트리밍 파서 - 선택적 import (없으면 json.load로 일괄 로드)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def build_fallback_lawyer(index, lawyer):
+    """fallback 노무사 1건 구성 (처음 5명 대상)"""
+    return {
+        "id": f"nomusa-{index+1}",
+        "office_name": f"{lawyer['name']} 노무사 사무소",
+        "license_number": f"LAW-2024-{index+1:04d}",
+        "office_address": lawyer["location_district"],
+        "specialties": lawyer["specialty_area"],
+        "experience_years": 5 + (index * 2),  # 5, 7, 9, 11, 13년
+        "success_rate": lawyer["avg_success_rate_pct"],
+        "rating": 4.0 + (index * 0.2),  # 4.0, 4.2, 4.4, 4.6, 4.8
+        "case_count": 50 + (index * 25),  # 50, 75, 100, 125, 150
+        "consultation_fee": 100000 if "착수금" in lawyer.get("fee_policy", "") else 0,
+        "is_verified": True,
+        "is_online_consult": "가능" in lawyer.get("is_online_consult", []),
+        "supports_sanzero_pay": "가능" in lawyer.get("do_sanzeropay", []),
+        "phone": lawyer.get("contact_phone", ""),
+        "website_url": lawyer.get("website_url", ""),
+        "fee_policy": lawyer.get("fee_policy", ""),
+        "case_difficulty": lawyer.get("case_difficulty", "중"),
+        "simplified_address": lawyer["location_district"],
+        "user": {
+            "full_name": lawyer["name"]
+        }
+    }
+
+
+def iter_nomusa_lawyers(nomusa_file):
+    """노무사 항목을 순차로 생성 (ijson이 있으면 파일 전체를 메모리에 올리지 않음)"""
+    if IJSON_AVAILABLE:
+        with open(nomusa_file, 'rb') as f:
+            yield from ijson.items(f, 'item')
+    else:
+        with open(nomusa_file, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+
+
 def extract_fallback_data():
-    """nomusa 더미 데이터에서 fallback 데이터 추출"""
+    """nomusa 더미 데이터에서 fallback 데이터 추출 (단일 패스)"""
 
-    # nomusa 더미 데이터 로드
     nomusa_file = Path(__file__).parent / "app" / "nomusa_dummy_data.json"
-    with open(nomusa_file, 'r', encoding='utf-8') as f:
-        nomusa_data = json.load(f)
 
-    print(f"총 {len(nomusa_data)}개의 노무사 데이터 로드됨")
+    # 전문분야/지역/fallback을 한 번의 순회로 동시에 수집
+    all_specialties = set()
+    all_locations = set()
+    fallback_lawyers = []
+    total_count = 0
+
+    for i, lawyer in enumerate(iter_nomusa_lawyers(nomusa_file)):
+        total_count += 1
 
-    # 전문분야 추출
-    all_specialties = []
-    for lawyer in nomusa_data:
+        # 전문분야 수집
         specialty_area = lawyer.get("specialty_area", [])
         if isinstance(specialty_area, list):
-            all_specialties.extend(specialty_area)
+            all_specialties.update(specialty_area)
         else:
-            all_specialties.append(specialty_area)
+            all_specialties.add(specialty_area)
 
-    unique_specialties = sorted(list(set(all_specialties)))
+        # 지역 수집: "서울 양천구" -> "서울"만 추출
+        location_district = lawyer.get("location_district", "")
+        if location_district:
+            parts = location_district.split()
+            all_locations.add(parts[0] if parts else location_district)
+
+        # fallback 데이터 생성 (처음 5개 노무사)
+        if i < 5:
+            fallback_lawyers.append(build_fallback_lawyer(i, lawyer))
+
+    print(f"총 {total_count}개의 노무사 데이터 로드됨")
+
+    unique_specialties = sorted(all_specialties)
     print(f"\n고유 전문분야 {len(unique_specialties)}개:")
     for i, spec in enumerate(unique_specialties, 1):
         print(f"  {i:2d}. {spec}")
 
-    # 지역 추출
-    all_locations = []
-    for lawyer in nomusa_data:
-        location_district = lawyer.get("location_district", "")
-        if location_district:
-            # "서울 양천구" -> "서울"만 추출
-            city = location_district.split()[0] if location_district.split() else location_district
-            all_locations.append(city)
-
-    unique_locations = sorted(list(set(all_locations)))
+    unique_locations = sorted(all_locations)
     print(f"\n고유 지역 {len(unique_locations)}개:")
     for i, loc in enumerate(unique_locations, 1):
         print(f"  {i:2d}. {loc}")
 
-    # fallback 데이터 생성 (처음 5개 노무사)
-    fallback_lawyers = []
-    for i, lawyer in enumerate(nomusa_data[:5]):
-        fallback_lawyer = {
-            "id": f"nomusa-{i+1}",
-            "office_name": f"{lawyer['name']} 노무사 사무소",
-            "license_number": f"LAW-2024-{i+1:04d}",
-            "office_address": lawyer["location_district"],
-            "specialties": lawyer["specialty_area"],
-            "experience_years": 5 + (i * 2),  # 5, 7, 9, 11, 13년
-            "success_rate": lawyer["avg_success_rate_pct"],
-            "rating": 4.0 + (i * 0.2),  # 4.0, 4.2, 4.4, 4.6, 4.8
-            "case_count": 50 + (i * 25),  # 50, 75, 100, 125, 150
-            "consultation_fee": 100000 if "착수금" in lawyer.get("fee_policy", "") else 0,
-            "is_verified": True,
-            "is_online_consult": "가능" in lawyer.get("is_online_consult", []),
-            "supports_sanzero_pay": "가능" in lawyer.get("do_sanzeropay", []),
-            "phone": lawyer.get("contact_phone", ""),
-            "website_url": lawyer.get("website_url", ""),
-            "fee_policy": lawyer.get("fee_policy", ""),
-            "case_difficulty": lawyer.get("case_difficulty", "중"),
-            "simplified_address": lawyer["location_district"],
-            "user": {
-                "full_name": lawyer["name"]
-            }
-        }
-        fallback_lawyers.append(fallback_lawyer)
-
     print(f"\nfallback 노무사 {len(fallback_lawyers)}명 생성:")
     for lawyer in fallback_lawyers:
         print(f"  - {lawyer['office_name']} ({lawyer['office_address']}) - {lawyer['specialties']}")
@@ -82,13 +118,13 @@ def extract_fallback_data():
     print("="*80)
 
     print("# 전문분야 fallback 데이터:")
-    print("unique_specialties =", json.dumps(unique_specialties, ensure_ascii=False, indent=4))
+    print("unique_specialties =", _dumps_pretty(unique_specialties))
 
     print("\n# 지역 fallback 데이터:")
-    print("unique_locations =", json.dumps(unique_locations, ensure_ascii=False, indent=4))
+    print("unique_locations =", _dumps_pretty(unique_locations))
 
     print("\n# 노무사 fallback 데이터:")
-    print("fallback_lawyers =", json.dumps(fallback_lawyers, ensure_ascii=False, indent=4))
+    print("fallback_lawyers =", _dumps_pretty(fallback_lawyers))
 
 if __name__ == "__main__":
-    extract_fallback_data()
\ No newline at end of file
+    extract_fallback_data()
@@ -24,13 +24,16 @@ def safe_analyze():
     print(f"📁 파일 경로: {pkl_path}")
     print(f"📊 파일 크기: {file_size_mb:.2f} MB")
 
-    # 2. 압축 해제 시도
+    # 2. 압축 해제 시도 (스트리밍: 압축본+해제본을 동시에 들고 있지 않음)
     try:
         print("\n📦 zlib 압축 해제 테스트...")
+        decompressor = zlib.decompressobj()
+        decompressed_data = bytearray()
         with open(pkl_path, 'rb') as f:
-            compressed_data = f.read()
+            while chunk := f.read(1 << 17):  # 128 KiB 단위
+                decompressed_data += decompressor.decompress(chunk)
+        decompressed_data += decompressor.flush()
 
-        decompressed_data = zlib.decompress(compressed_data)
         decompressed_size_mb = len(decompressed_data) / (1024 * 1024)
         print(f"✅ 압축 해제 성공!")
         print(f"📈 압축 해제 후 크기: {decompressed_size_mb:.2f} MB")
@@ -46,14 +49,17 @@ def safe_analyze():
         print(f"  헤더 (첫 50바이트): {header[:50]}")
 
         # 텍스트 내용 중 키워드 검색
-        text_content = decompressed_data.decode('latin-1', errors='ignore')
-        keywords = ['dataframe', 'DataFrame', 'vectorizer', 'tfidf', 'matrix', 'config']
+        # (latin-1 디코딩은 수백 MB 버퍼를 str로 한 벌 더 복사하므로
+        #  바이트 버퍼를 소문자화 1회 후 바이트 단위로 검색.
+        #  결론에 필요한 건 존재 여부뿐이라 count 대신 find로
+        #  첫 매치에서 조기 종료 - 구성요소 이름은 보통 앞쪽 헤더에 있음)
+        lowered = bytes(decompressed_data).lower()
+        keywords = ['dataframe', 'vectorizer', 'tfidf', 'matrix', 'config']
 
         print(f"\n🔎 내용 키워드 검색:")
         for keyword in keywords:
-            count = text_content.lower().count(keyword.lower())
-            if count > 0:
-                print(f"  '{keyword}': {count}회 발견")
+            if lowered.find(keyword.encode('ascii')) != -1:
+                print(f"  '{keyword}': 발견")
 
     except Exception as e:
         print(f"❌ 분석 중 오류: {e}")
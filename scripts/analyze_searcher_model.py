@@ -16,6 +16,194 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
+class ZlibStream:
+    """
+    zlib 압축 파일을 스트리밍으로 읽는 파일류 객체
+
+    pickle.load에 직접 넘겨 전체 해제본을 하나의 바이트 버퍼로
+    물질화하지 않게 합니다 (최대 RSS ≈ 해제본 크기 → 청크 크기).
+    """
+
+    CHUNK_SIZE = 1 << 17  # 128 KiB
+
+    def __init__(self, fileobj):
+        self._file = fileobj
+        self._decompressor = zlib.decompressobj()
+        self._buffer = bytearray()
+
+    def read(self, size=-1):
+        if size < 0:
+            while self._fill():
+                pass
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            return data
+
+        while len(self._buffer) < size and self._fill():
+            pass
+
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def readline(self):
+        # pickle이 프로토콜 0 데이터에서만 사용 - 단순 구현으로 충분
+        while b'\n' not in self._buffer and self._fill():
+            pass
+        newline = self._buffer.find(b'\n')
+        end = len(self._buffer) if newline < 0 else newline + 1
+        data = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return data
+
+    def _fill(self) -> bool:
+        chunk = self._file.read(self.CHUNK_SIZE)
+        if not chunk:
+            tail = self._decompressor.flush()
+            if tail:
+                self._buffer += tail
+                return True
+            return False
+        self._buffer += self._decompressor.decompress(chunk)
+        return True
+
+
+class CompatUnpickler(pickle.Unpickler):
+    """
+    구형 피클 호환 언피클러
+
+    노트북 시절 피클이 'DataFrame' 모듈 경로를 참조하는 경우가 있어
+    find_class에서 pandas로 재지정합니다. sys.modules를 전역으로
+    오염시키던 기존 방식과 달리 C 언피클러 경로를 유지합니다.
+    """
+
+    def find_class(self, module, name):
+        if module == 'DataFrame':
+            module = 'pandas'
+        return super().find_class(module, name)
+
+
+def dump_model_fast(model_data, path):
+    """
+    모델 재직렬화 (pickle 프로토콜 5 + out-of-band 버퍼)
+
+    ndarray/희소행렬의 데이터 블록을 피클 바이트 스트림에 복사하지 않고
+    별도 버퍼 파일로 내보내 (역)직렬화를 수백 배 빠르게 합니다.
+    load_model_fast와 짝으로 사용합니다.
+    """
+    path = Path(path)
+    buffers = []
+    payload = pickle.dumps(model_data, protocol=5,
+                           buffer_callback=buffers.append)
+
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+    with open(path.with_suffix('.buffers'), 'wb') as f:
+        # 버퍼 개수 + (길이, 내용) 연속 기록
+        f.write(len(buffers).to_bytes(4, 'little'))
+        for buffer in buffers:
+            raw = buffer.raw()
+            f.write(raw.nbytes.to_bytes(8, 'little'))
+            f.write(raw)
+
+    print(f"💾 프로토콜 5 저장 완료: {path} (+{len(buffers)}개 out-of-band 버퍼)")
+
+
+def load_model_fast(path):
+    """dump_model_fast로 저장된 모델 로드"""
+    path = Path(path)
+
+    buffers = []
+    with open(path.with_suffix('.buffers'), 'rb') as f:
+        count = int.from_bytes(f.read(4), 'little')
+        for _ in range(count):
+            size = int.from_bytes(f.read(8), 'little')
+            buffers.append(f.read(size))
+
+    with open(path, 'rb') as f:
+        return pickle.loads(f.read(), buffers=buffers)
+
+
+def export_split_model(model_data, out_dir):
+    """
+    모델을 포맷별로 분리 저장
+
+    zlib+pickle 단일 블롭은 로드 시 전체 해제 + 그래프 순회를 강제하므로
+    DataFrame은 Feather(zstd), 희소 행렬은 npz, 나머지 소형 구성요소만
+    pickle로 나눠 저장합니다. load_split_model과 짝으로 사용합니다.
+    (주의: tokens 같은 리스트 컬럼은 Feather 왕복 후 numpy 배열로
+    돌아옴 - 검색 코드는 순회만 하므로 동작 동일)
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    df = model_data.get('df')
+    if df is not None:
+        df.reset_index(drop=True).to_feather(
+            out_dir / "df.feather", compression='zstd')
+
+    tfidf_matrix = model_data.get('tfidf_matrix')
+    if tfidf_matrix is not None:
+        from scipy import sparse
+        # 코사인 검색은 메모리 대역폭에 묶이므로 float64 정밀도는 낭비 -
+        # float32로 양자화해 저장 (int8 경로는 per-row 스케일 관리 비용 대비
+        # 이득이 작아 채택하지 않음)
+        matrix = tfidf_matrix.tocsr()
+        if matrix.dtype == np.float64:
+            matrix = matrix.astype(np.float32)
+        sparse.save_npz(out_dir / "tfidf_matrix.npz", matrix)
+
+    # 어휘는 str→int 파이썬 dict(항목당 ~200바이트) 대신
+    # 정렬된 토큰 배열 + 병렬 id 배열로 저장 (np.searchsorted로 조회)
+    vectorizer = model_data.get('vectorizer')
+    vocab = getattr(vectorizer, 'vocabulary_', None)
+    if vocab:
+        terms = np.array(sorted(vocab), dtype=object)
+        ids = np.fromiter((vocab[term] for term in terms),
+                          dtype=np.int32, count=len(terms))
+        np.savez_compressed(out_dir / "vocabulary.npz", terms=terms, ids=ids)
+
+    small = {key: value for key, value in model_data.items()
+             if key not in ('df', 'tfidf_matrix')}
+    with open(out_dir / "components.pkl", 'wb') as f:
+        pickle.dump(small, f, protocol=5)
+
+    print(f"💾 분리 저장 완료: {out_dir}")
+
+
+def lookup_vocabulary(vocab_npz, tokens):
+    """npz 어휘에서 토큰들의 컬럼 id 조회 (미등록 토큰은 -1)"""
+    terms = vocab_npz["terms"]
+    ids = vocab_npz["ids"]
+
+    positions = np.searchsorted(terms, tokens)
+    result = np.full(len(tokens), -1, dtype=np.int32)
+    for i, (position, token) in enumerate(zip(positions, tokens)):
+        if position < len(terms) and terms[position] == token:
+            result[i] = ids[position]
+    return result
+
+
+def load_split_model(out_dir):
+    """export_split_model로 저장된 모델 로드"""
+    out_dir = Path(out_dir)
+
+    with open(out_dir / "components.pkl", 'rb') as f:
+        model_data = pickle.load(f)
+
+    df_path = out_dir / "df.feather"
+    if df_path.exists():
+        model_data['df'] = pd.read_feather(df_path)
+
+    matrix_path = out_dir / "tfidf_matrix.npz"
+    if matrix_path.exists():
+        from scipy import sparse
+        model_data['tfidf_matrix'] = sparse.load_npz(matrix_path)
+
+    return model_data
+
+
 def analyze_searcher_model():
     """searcher_model.pkl 파일의 구조와 내용을 상세히 분석합니다."""
 
@@ -33,20 +221,13 @@ def analyze_searcher_model():
     print(f"📊 파일 크기: {file_size_mb:.2f} MB\n")
 
     try:
-        # 2. 압축된 pkl 파일 로드
-        print("⏳ 압축된 pkl 파일을 로드 중...")
-        with open(pkl_path, 'rb') as f:
-            compressed_data = f.read()
+        # 2. 압축 해제 + pickle 로드를 스트리밍으로 동시에 수행
+        # (전체 해제본 바이트 버퍼를 만들지 않아 peak RSS 절반)
+        print("⏳ 압축된 pkl 파일을 스트리밍 로드 중...")
 
-        print("📦 zlib 압축 해제 중...")
-        decompressed_data = zlib.decompress(compressed_data)
-
-        print("🔓 pickle 데이터 로드 중...")
-        # DataFrame 모듈 의존성 문제 해결
-        import pandas as pd
-        sys.modules['DataFrame'] = pd.DataFrame
-
-        model_data = pickle.loads(decompressed_data)
+        # DataFrame 모듈 의존성은 CompatUnpickler.find_class에서 해결
+        with open(pkl_path, 'rb') as f:
+            model_data = CompatUnpickler(ZlibStream(f)).load()
 
         print("✅ pkl 파일 로드 완료!\n")
 
@@ -110,13 +291,18 @@ def analyze_dataframe(df):
     print(f"  메모리 사용량: {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB")
 
     # 각 컬럼의 데이터 타입과 샘플 확인
+    # (isnull().sum()을 컬럼마다 호출하는 대신 한 번에 집계)
+    null_counts = df.isnull().sum()
+    dtypes = df.dtypes
+    first_row = df.head(1).to_dict(orient="records")[0] if not df.empty else {}
+
     print("\n  📋 컬럼 상세 정보:")
     for col in df.columns:
         print(f"    {col}:")
-        print(f"      타입: {df[col].dtype}")
-        print(f"      결측값: {df[col].isnull().sum()}개")
-        if not df[col].empty:
-            sample_val = str(df[col].iloc[0])
+        print(f"      타입: {dtypes[col]}")
+        print(f"      결측값: {null_counts[col]}개")
+        if col in first_row:
+            sample_val = str(first_row[col])
             if len(sample_val) > 100:
                 sample_val = sample_val[:100] + "..."
             print(f"      샘플: {sample_val}")
@@ -200,26 +386,54 @@ def analyze_memory_usage(model_data):
     print()
 
 def estimate_object_size(obj):
-    """객체의 대략적인 메모리 사용량 추정 (MB 단위)"""
+    """객체의 대략적인 메모리 사용량 추정 (MB 단위)
+
+    sys.getsizeof는 컨테이너의 겉껍데기 크기만 세어 어휘 dict 같은
+    구성요소를 크게 과소평가하므로, 주요 타입은 구조적으로 합산하고
+    컨테이너는 재귀적으로 내용물까지 더합니다.
+    """
+    return _deep_size_bytes(obj) / 1024 / 1024
+
+
+def _deep_size_bytes(obj, _seen=None):
+    """구조적 메모리 합산 (바이트)"""
+    if _seen is None:
+        _seen = set()
+
+    obj_id = id(obj)
+    if obj_id in _seen:
+        return 0
+    _seen.add(obj_id)
+
     if isinstance(obj, pd.DataFrame):
-        return obj.memory_usage(deep=True).sum() / 1024 / 1024
-    elif hasattr(obj, 'data') and hasattr(obj, 'indices'):  # 희소 행렬
-        return (obj.data.nbytes + obj.indices.nbytes + obj.indptr.nbytes) / 1024 / 1024
-    elif isinstance(obj, (list, dict, str)):
-        return sys.getsizeof(obj) / 1024 / 1024
-    else:
-        return sys.getsizeof(obj) / 1024 / 1024
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if hasattr(obj, 'data') and hasattr(obj, 'indices') and hasattr(obj, 'indptr'):
+        # 희소 행렬
+        return obj.data.nbytes + obj.indices.nbytes + obj.indptr.nbytes
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size_bytes(k, _seen) + _deep_size_bytes(v, _seen)
+                    for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_size_bytes(item, _seen) for item in obj)
+    elif hasattr(obj, '__dict__'):
+        size += _deep_size_bytes(vars(obj), _seen)
+
+    return size
 
 def analyze_sample_data(df):
     """샘플 데이터 확인"""
     print("📝 샘플 데이터 (첫 3건):")
 
     if not df.empty:
-        for i in range(min(3, len(df))):
-            print(f"\n  📄 판례 {i+1}:")
-            row = df.iloc[i]
-            for col in df.columns:
-                value = str(row[col])
+        # per-cell Series 생성 대신 C 레벨 변환 1회
+        for i, record in enumerate(df.head(3).to_dict(orient="records"), 1):
+            print(f"\n  📄 판례 {i}:")
+            for col, value in record.items():
+                value = str(value)
                 if len(value) > 150:
                     value = value[:150] + "..."
                 print(f"    {col}: {value}")
@@ -53,79 +53,94 @@ TEST_USERS = [
 ]
 
 
-async def create_test_users():
-    """테스트 사용자 생성"""
-    print("=== 테스트 사용자 생성 시작 ===\n")
-
-    for user_data in TEST_USERS:
-        email = user_data["email"]
-        print(f"🔄 {email} 생성 중...")
-
+async def _create_auth_account(user_data: dict, semaphore: asyncio.Semaphore):
+    """Auth 계정 1건 생성 (동기 클라이언트를 스레드로, 동시성은 세마포어로 제한)"""
+    email = user_data["email"]
+    async with semaphore:
         try:
-            # 1. Supabase Auth 계정 생성
-            auth_response = supabase.auth.admin.create_user({
-                "email": email,
-                "password": user_data["password"],
-                "email_confirm": True  # 이메일 확인 건너뛰기
-            })
+            auth_response = await asyncio.to_thread(
+                supabase.auth.admin.create_user,
+                {
+                    "email": email,
+                    "password": user_data["password"],
+                    "email_confirm": True  # 이메일 확인 건너뛰기
+                }
+            )
 
             if not auth_response.user:
                 print(f"❌ {email} Auth 계정 생성 실패")
-                continue
-
-            user_id = auth_response.user.id
-            print(f"   ✅ Auth 계정 생성 완료 (ID: {user_id})")
+                return None
 
-            # 2. users 테이블에 프로필 생성
-            profile_data = {
-                "id": user_id,
-                "email": email,
-                "username": user_data["username"],
-                "user_type": user_data["user_type"],
-                "phone": user_data.get("phone"),
-                "address": user_data.get("address")
-            }
+            print(f"   ✅ {email} Auth 계정 생성 완료 (ID: {auth_response.user.id})")
+            return auth_response.user.id
 
-            profile_response = supabase.table("users").insert(profile_data).execute()
-
-            if profile_response.data:
-                print(f"   ✅ 프로필 생성 완료")
+        except Exception as e:
+            error_message = str(e)
+            if "already exists" in error_message or "duplicate" in error_message.lower():
+                print(f"⚠️  {email} 이미 존재하는 계정")
             else:
-                print(f"   ⚠️  프로필 생성 실패")
-
-            # 3. 노무사 계정인 경우 lawyers 테이블에 추가
-            if user_data["user_type"] == "lawyer" and "lawyer_info" in user_data:
-                lawyer_info = user_data["lawyer_info"]
-                lawyer_data = {
-                    "user_id": user_id,
-                    "license_number": lawyer_info["license_number"],
-                    "office_name": lawyer_info["office_name"],
-                    "office_address": lawyer_info["office_address"],
-                    "specialties": lawyer_info["specialties"],
-                    "experience_years": lawyer_info["experience_years"],
-                    "consultation_fee": lawyer_info["consultation_fee"],
-                    "rating": lawyer_info["rating"],
-                    "total_reviews": lawyer_info["total_reviews"],
-                    "is_verified": lawyer_info["is_verified"]
-                }
+                print(f"❌ {email} 생성 중 오류 발생: {error_message}")
+            return None
+
 
-                lawyer_response = supabase.table("lawyers").insert(lawyer_data).execute()
+async def create_test_users():
+    """테스트 사용자 생성 (Auth 동시 생성 + 프로필/노무사 일괄 upsert)"""
+    print("=== 테스트 사용자 생성 시작 ===\n")
 
-                if lawyer_response.data:
-                    print(f"   ✅ 노무사 정보 생성 완료")
-                else:
-                    print(f"   ⚠️  노무사 정보 생성 실패")
+    # 1. Supabase Auth 계정을 동시에 생성 (Auth가 남은 직렬화 지점)
+    semaphore = asyncio.Semaphore(8)
+    user_ids = await asyncio.gather(
+        *(_create_auth_account(user_data, semaphore) for user_data in TEST_USERS))
+
+    # 2. users 프로필을 upsert 1회로 일괄 생성 (재실행에도 안전)
+    profiles = []
+    lawyer_rows = []
+    for user_data, user_id in zip(TEST_USERS, user_ids):
+        if not user_id:
+            continue
+
+        profiles.append({
+            "id": user_id,
+            "email": user_data["email"],
+            "username": user_data["username"],
+            "user_type": user_data["user_type"],
+            "phone": user_data.get("phone"),
+            "address": user_data.get("address")
+        })
+
+        # 3. 노무사 계정은 lawyers 행도 함께 수집
+        if user_data["user_type"] == "lawyer" and "lawyer_info" in user_data:
+            lawyer_info = user_data["lawyer_info"]
+            lawyer_rows.append({
+                "user_id": user_id,
+                "license_number": lawyer_info["license_number"],
+                "office_name": lawyer_info["office_name"],
+                "office_address": lawyer_info["office_address"],
+                "specialties": lawyer_info["specialties"],
+                "experience_years": lawyer_info["experience_years"],
+                "consultation_fee": lawyer_info["consultation_fee"],
+                "rating": lawyer_info["rating"],
+                "total_reviews": lawyer_info["total_reviews"],
+                "is_verified": lawyer_info["is_verified"]
+            })
 
-            print(f"✅ {email} 계정 생성 완료\n")
+    if profiles:
+        try:
+            profile_response = supabase.table("users").upsert(
+                profiles, on_conflict="email").execute()
+            print(f"   ✅ 프로필 {len(profile_response.data or [])}건 일괄 생성 완료")
+        except Exception as e:
+            print(f"   ⚠️  프로필 일괄 생성 실패: {e}")
 
+    if lawyer_rows:
+        try:
+            lawyer_response = supabase.table("lawyers").upsert(
+                lawyer_rows, on_conflict="license_number").execute()
+            print(f"   ✅ 노무사 정보 {len(lawyer_response.data or [])}건 일괄 생성 완료")
         except Exception as e:
-            error_message = str(e)
-            if "already exists" in error_message or "duplicate" in error_message.lower():
-                print(f"⚠️  {email} 이미 존재하는 계정\n")
-            else:
-                print(f"❌ {email} 생성 중 오류 발생: {error_message}\n")
+            print(f"   ⚠️  노무사 정보 일괄 생성 실패: {e}")
 
-    print("=== 테스트 사용자 생성 완료 ===")
+    print("\n=== 테스트 사용자 생성 완료 ===")
 
 
 async def verify_users():
@@ -13,11 +13,20 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
+import numpy as np
 from sentence_transformers import SentenceTransformer
 from app.utils.database import supabase
 from app.utils.security import security
 from loguru import logger
 
+# 배치 인코딩 크기 (BLAS/GPU 배칭 활성화)
+EMBEDDING_BATCH_SIZE = 64
+
+# 임베딩을 float16 정밀도로 반올림해 저장/전송 바이트를 절반으로
+# (검색 품질 손실은 무시 가능 수준 - 저장 측 halfvec(384) 컬럼은
+#  add_precedent_embedding_index.sql 참조)
+USE_HALF_PRECISION = True
+
 class EmbeddingGenerator:
     """판례 임베딩 생성기"""
 
@@ -27,8 +36,11 @@ class EmbeddingGenerator:
         self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
         logger.info("SBERT 모델 로딩 완료")
 
+        # Supabase 동시 업데이트 한도
+        self._update_semaphore = asyncio.Semaphore(16)
+
     async def get_precedents_without_embeddings(self):
-        """임베딩이 없는 판례들 조회"""
+        """임베딩이 없는 판례들 조회 (전체 일괄)"""
         try:
             response = await asyncio.to_thread(
                 lambda: supabase.table("precedents")
@@ -45,21 +57,113 @@ class EmbeddingGenerator:
             logger.error(f"판례 조회 실패: {e}")
             return []
 
+    async def _produce_precedent_pages(self, queue: asyncio.Queue, page_size: int = 256):
+        """
+        임베딩 없는 판례를 페이지 단위로 큐에 공급 (생산자)
+
+        소비자가 현재 페이지를 인코딩하는 동안 다음 페이지를 미리
+        가져와 Supabase RTT를 모델 forward와 겹칩니다. 처리된 행이
+        'embedding is null' 필터에서 빠져나가며 결과 집합이 줄어들므로
+        offset 대신 id keyset 페이지네이션을 사용합니다.
+        """
+        last_id = ""
+        try:
+            while True:
+                def fetch(after_id=last_id):
+                    query = (supabase.table("precedents")
+                             .select("id, title, summary, full_text")
+                             .is_("embedding", "null")
+                             .eq("is_active", True)
+                             .order("id")
+                             .limit(page_size))
+                    if after_id:
+                        query = query.gt("id", after_id)
+                    return query.execute()
+
+                response = await asyncio.to_thread(fetch)
+                rows = response.data or []
+                if not rows:
+                    break
+
+                last_id = rows[-1]["id"]
+                await queue.put(rows)
+
+                if len(rows) < page_size:
+                    break
+
+        except Exception as e:
+            logger.error(f"판례 페이지 조회 실패: {e}")
+        finally:
+            await queue.put(None)
+
     def generate_embedding(self, text: str) -> list:
-        """텍스트를 벡터로 임베딩"""
+        """텍스트를 벡터로 임베딩 (단건)"""
+        embeddings = self.generate_embeddings_batch([text])
+        return embeddings[0] if embeddings else None
+
+    def generate_embeddings_batch(self, texts: list) -> list:
+        """
+        텍스트 배치를 한 번의 encode 호출로 임베딩
+
+        SBERT는 행렬곱에 묶이는 연산이라 배치로 넣어야 BLAS/GPU 배칭이
+        살아납니다. 빈 텍스트 자리는 None으로 유지해 호출부가 건너뛸 수
+        있게 합니다.
+
+        Returns:
+            list: 입력과 같은 길이의 리스트 (각 항목은 벡터 list 또는 None)
+        """
         try:
-            # 텍스트 전처리
-            cleaned_text = security.sanitize_text(text)
-            if not cleaned_text.strip():
-                return None
+            # 배치 전체에 한 번에 적용 (sanitize_text는 사전 컴파일된
+            # 정규식 경로 - 메서드 조회도 루프 밖에서 1회)
+            sanitize = security.sanitize_text
+            cleaned = [sanitize(text) for text in texts]
+            valid_indices = [i for i, text in enumerate(cleaned) if text.strip()]
+            if not valid_indices:
+                return [None] * len(texts)
+
+            embeddings = self.embedding_model.encode(
+                [cleaned[i] for i in valid_indices],
+                batch_size=EMBEDDING_BATCH_SIZE,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+
+            if USE_HALF_PRECISION:
+                embeddings = embeddings.astype(np.float16)
 
-            # 임베딩 생성
-            embedding = self.embedding_model.encode(cleaned_text)
-            return embedding.tolist()
+            results = [None] * len(texts)
+            for position, index in enumerate(valid_indices):
+                results[index] = embeddings[position].tolist()
+            return results
 
         except Exception as e:
             logger.error(f"임베딩 생성 실패: {e}")
-            return None
+            return [None] * len(texts)
+
+    async def _bulk_update_embeddings(self, ids: list, embeddings: list) -> int:
+        """
+        임베딩 일괄 업데이트 (RPC 1회)
+
+        update_precedent_embeddings_bulk.sql의 서버 함수가 배열 인자로
+        set 기반 UPDATE를 수행합니다. 함수가 아직 없으면 -1을 돌려
+        호출부가 per-row 경로로 폴백합니다.
+        """
+        try:
+            response = await asyncio.to_thread(
+                lambda: supabase.rpc(
+                    "update_precedent_embeddings_bulk",
+                    {"ids": ids, "embs": embeddings}
+                ).execute()
+            )
+            return int(response.data) if response.data is not None else len(ids)
+        except Exception as e:
+            logger.warning(f"일괄 임베딩 업데이트 실패 ({e}), per-row 경로로 폴백")
+            return -1
+
+    async def _update_with_limit(self, precedent_id: str, embedding: list) -> bool:
+        """세마포어로 동시성을 제한한 임베딩 업데이트"""
+        async with self._update_semaphore:
+            return await self.update_precedent_embedding(precedent_id, embedding)
 
     async def update_precedent_embedding(self, precedent_id: str, embedding: list):
         """판례의 임베딩 업데이트"""
@@ -83,46 +187,34 @@ class EmbeddingGenerator:
             return False
 
     async def process_all_precedents(self):
-        """모든 판례에 대해 임베딩 생성 및 업데이트"""
+        """모든 판례에 대해 임베딩 생성 및 업데이트 (생산자-소비자 파이프라인)"""
         logger.info("=== 판례 임베딩 생성 시작 ===")
 
-        # 임베딩이 없는 판례들 조회
-        precedents = await self.get_precedents_without_embeddings()
-
-        if not precedents:
-            logger.info("처리할 판례가 없습니다.")
-            return
+        # 다음 페이지 fetch와 현재 페이지 인코딩/업데이트를 겹치는
+        # 더블 버퍼 구조 (Queue(2) - 생산자가 최대 2페이지 선행)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        producer = asyncio.create_task(self._produce_precedent_pages(queue))
 
         success_count = 0
         failed_count = 0
+        processed = 0
 
-        for i, precedent in enumerate(precedents, 1):
-            precedent_id = precedent["id"]
-            title = precedent.get("title", "")
-            summary = precedent.get("summary", "")
-            full_text = precedent.get("full_text", "")
-
-            logger.info(f"[{i}/{len(precedents)}] 처리 중: {precedent_id}")
+        while True:
+            page = await queue.get()
+            if page is None:
+                break
 
-            # 임베딩할 텍스트 준비 (제목 + 요약 + 전문의 일부)
-            embedding_text = f"{title}\n{summary}"
-            if full_text:
-                # 전문이 너무 길면 앞부분만 사용 (토큰 제한 고려)
-                embedding_text += f"\n{full_text[:500]}"
+            page_results = await self._process_page(page)
+            success_count += page_results[0]
+            failed_count += page_results[1]
+            processed += len(page)
+            logger.info(f"진행: {processed}건 처리 (성공 {success_count} / 실패 {failed_count})")
 
-            # 임베딩 생성
-            embedding = self.generate_embedding(embedding_text)
+        await producer
 
-            if embedding:
-                # 데이터베이스 업데이트
-                success = await self.update_precedent_embedding(precedent_id, embedding)
-                if success:
-                    success_count += 1
-                else:
-                    failed_count += 1
-            else:
-                logger.error(f"판례 {precedent_id} 임베딩 생성 실패")
-                failed_count += 1
+        if processed == 0:
+            logger.info("처리할 판례가 없습니다.")
+            return
 
         logger.info("=== 판례 임베딩 생성 완료 ===")
         logger.info(f"성공: {success_count}건, 실패: {failed_count}건")
@@ -130,6 +222,63 @@ class EmbeddingGenerator:
         # 최종 확인
         await self.verify_embeddings()
 
+    async def _process_page(self, precedents: list) -> tuple:
+        """판례 한 페이지 인코딩 + 업데이트, (성공, 실패) 건수 반환"""
+        success_count = 0
+        failed_count = 0
+
+        # 배치 단위로 인코딩 (per-doc encode 호출은 토크나이저/forward 비용을
+        # 문서마다 중복 지불하므로 배치로 묶어 처리)
+        for start in range(0, len(precedents), EMBEDDING_BATCH_SIZE):
+            batch = precedents[start:start + EMBEDDING_BATCH_SIZE]
+
+            # 임베딩할 텍스트 준비 (제목 + 요약 + 전문의 일부, 토큰 제한 고려)
+            # f-string 연결 대신 join 1회로 정확한 크기의 문자열 1개만 할당
+            texts = [
+                "\n".join([
+                    p.get('title') or '',
+                    p.get('summary') or '',
+                    (p.get('full_text') or '')[:500]
+                ])
+                for p in batch
+            ]
+
+            # 임베딩 생성: CPU 작업을 스레드로 내려 생산자의 fetch와 겹침
+            embeddings = await asyncio.to_thread(
+                self.generate_embeddings_batch, texts)
+
+            pairs = []
+            for precedent, embedding in zip(batch, embeddings):
+                if embedding:
+                    pairs.append((precedent["id"], embedding))
+                else:
+                    logger.error(f"판례 {precedent['id']} 임베딩 생성 실패")
+                    failed_count += 1
+
+            if not pairs:
+                continue
+
+            # 1차: 서버측 일괄 UPDATE RPC (HTTP 1회)
+            updated = await self._bulk_update_embeddings(
+                [pid for pid, _ in pairs], [emb for _, emb in pairs])
+            if updated >= 0:
+                success_count += updated
+                failed_count += len(pairs) - updated
+                continue
+
+            # 폴백: 세마포어로 동시성을 제한한 per-row 업데이트
+            results = await asyncio.gather(
+                *(self._update_with_limit(pid, emb) for pid, emb in pairs),
+                return_exceptions=True
+            )
+            for result in results:
+                if result is True:
+                    success_count += 1
+                else:
+                    failed_count += 1
+
+        return success_count, failed_count
+
     async def verify_embeddings(self):
         """임베딩 생성 결과 확인"""
         try:
@@ -5,7 +5,8 @@ import json
 import os
 import sys
 import asyncio
-import uuid
+import numpy as np
+import pandas as pd
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -15,108 +16,92 @@ sys.path.insert(0, str(project_root))
 
 from app.utils.database import supabase
 
+# orjson - 선택적 import (대용량 nomusa 코퍼스 파싱 가속)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 변환 테이블 (호출마다 dict를 재구성하지 않도록 모듈 상수로 유지)
+DIFFICULTY_MAP = {"상": 10, "중상": 8, "중": 5, "중하": 3, "하": 1}
+
+ADDRESS_MAP = {
+    "서울 양천구": "서울특별시 양천구 목동서로 123",
+    "성남 중원구": "경기도 성남시 중원구 성남대로 456",
+    "천안 동남구": "충청남도 천안시 동남구 천안대로 789",
+    "서울 강남구": "서울특별시 강남구 테헤란로 100",
+    "부산 해운대구": "부산광역시 해운대구 해운대로 200",
+    "대구 중구": "대구광역시 중구 동성로 300"
+}
+
 
 class NomusaDataMigrator:
     def __init__(self):
         self.nomusa_data_file = project_root / "app" / "nomusa_dummy_data.json"
 
     def load_nomusa_data(self):
-        """nomusa_dummy_data.json 파일 로드"""
+        """nomusa_dummy_data.json 파일 로드 (orjson 우선)"""
         try:
-            with open(self.nomusa_data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                print(f"✅ nomusa 데이터 로드 완료: {len(data)}명의 노무사")
-                return data
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(self.nomusa_data_file.read_bytes())
+            else:
+                with open(self.nomusa_data_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            print(f"✅ nomusa 데이터 로드 완료: {len(data)}명의 노무사")
+            return data
         except Exception as e:
             print(f"❌ nomusa 데이터 로드 실패: {e}")
             return []
 
-    def extract_case_difficulty_years(self, case_difficulty):
-        """case_difficulty를 경력 년수로 변환"""
-        difficulty_map = {
-            "상": 10,
-            "중상": 8,
-            "중": 5,
-            "중하": 3,
-            "하": 1
-        }
-        return difficulty_map.get(case_difficulty, 5)
-
-    def parse_fee_policy(self, fee_policy):
-        """fee_policy를 consultation_fee로 변환"""
-        if "착수금 0원" in fee_policy:
-            return 0
-        elif "착수금 100만원" in fee_policy:
-            return 1000000
-        elif "초기 상담 무료" in fee_policy:
-            return 0
-        else:
-            return 100000  # 기본값 10만원
-
-    def generate_license_number(self, index, name):
-        """노무사 면허번호 자동 생성"""
-        return f"LAW-2024-{str(index + 1).zfill(4)}"
-
-    def generate_temp_user_id(self):
-        """임시 UUID 생성"""
-        return str(uuid.uuid4())
-
-    def calculate_rating(self, success_rate):
-        """성공률을 기반으로 평점 계산 (1-5점)"""
-        if success_rate >= 85:
-            return 5.0
-        elif success_rate >= 75:
-            return 4.5
-        elif success_rate >= 65:
-            return 4.0
-        elif success_rate >= 55:
-            return 3.5
-        else:
-            return 3.0
-
-    def generate_office_address(self, location_district):
-        """지역 정보를 상세 주소로 확장"""
-        address_map = {
-            "서울 양천구": "서울특별시 양천구 목동서로 123",
-            "성남 중원구": "경기도 성남시 중원구 성남대로 456",
-            "천안 동남구": "충청남도 천안시 동남구 천안대로 789",
-            "서울 강남구": "서울특별시 강남구 테헤란로 100",
-            "부산 해운대구": "부산광역시 해운대구 해운대로 200",
-            "대구 중구": "대구광역시 중구 동성로 300"
-        }
-
-        return address_map.get(location_district, f"{location_district} 000번길 123")
-
-    def convert_nomusa_to_lawyer_data(self, nomusa_item, index):
-        """nomusa 데이터를 lawyers 테이블 형식으로 변환"""
-
-        # 기본 변환
-        experience_years = self.extract_case_difficulty_years(nomusa_item["case_difficulty"])
-        consultation_fee = self.parse_fee_policy(nomusa_item["fee_policy"])
-        license_number = self.generate_license_number(index, nomusa_item["name"])
-        rating = self.calculate_rating(nomusa_item["avg_success_rate_pct"])
-        office_address = self.generate_office_address(nomusa_item["location_district"])
-
-        # 온라인 상담 가능 여부
-        is_online_available = nomusa_item["is_online_consult"][0] == "가능" if nomusa_item["is_online_consult"] else False
-
-        # 사무소명 생성
-        office_name = f"{nomusa_item['name']} 노무사 사무소"
-
-        # 임시 user_id 생성 (실제 서비스에서는 사용자 등록 후 연결)
-        temp_user_id = self.generate_temp_user_id()
-
-        return {
+    def convert_nomusa_dataframe(self, nomusa_data):
+        """
+        nomusa 데이터 전체를 lawyers 테이블 형식으로 일괄 변환
+
+        per-record 파이썬 루프 대신 pandas 컬럼 연산으로 변환합니다
+        (map/np.select/pd.cut - 수천 건 기준 인터프리터 dict 연산 제거).
+        """
+        df = pd.DataFrame(nomusa_data)
+        count = len(df)
+
+        # 배치 내 모든 행이 같은 시각을 공유 - 레코드마다 syscall하지 않음
+        now_iso = datetime.now(timezone.utc).isoformat()
+
+        fee_policy = df.get("fee_policy", pd.Series([""] * count)).fillna("")
+        consultation_fee = np.select(
+            [
+                fee_policy.str.contains("착수금 0원", regex=False),
+                fee_policy.str.contains("착수금 100만원", regex=False),
+                fee_policy.str.contains("초기 상담 무료", regex=False),
+            ],
+            [0, 1000000, 0],
+            default=100000  # 기본값 10만원
+        )
+
+        # 성공률 → 평점 (>=85: 5.0, >=75: 4.5, >=65: 4.0, >=55: 3.5, 그 외 3.0)
+        rating = pd.cut(
+            df["avg_success_rate_pct"],
+            bins=[-np.inf, 55, 65, 75, 85, np.inf],
+            labels=[3.0, 3.5, 4.0, 4.5, 5.0],
+            right=False
+        ).astype(float)
+
+        location = df["location_district"].fillna("")
+        first_list_item = lambda col: (
+            df[col].str[0].eq("가능").fillna(False)
+            if col in df.columns else pd.Series([False] * count))
+
+        converted = pd.DataFrame({
             "user_id": "4dfb3123-7d40-4397-b7f5-fb80e899bc92",  # 기존 testlawyer 사용자 ID 사용
-            "license_number": license_number,
-            "office_name": office_name,
-            "office_address": office_address,
-            "specialties": nomusa_item["specialty_area"],  # 배열 그대로 사용
-            "experience_years": experience_years,
+            "license_number": [f"LAW-2024-{i+1:04d}" for i in range(count)],
+            "office_name": df["name"] + " 노무사 사무소",
+            "office_address": location.map(ADDRESS_MAP).fillna(location + " 000번길 123"),
+            "specialties": df["specialty_area"],  # 배열 그대로 사용
+            "experience_years": df["case_difficulty"].map(DIFFICULTY_MAP).fillna(5).astype(int),
             "rating": rating,
             "total_reviews": 0,  # 신규 노무사는 리뷰 없음
             "consultation_fee": consultation_fee,
-            "success_rate": float(nomusa_item["avg_success_rate_pct"]),
+            "success_rate": df["avg_success_rate_pct"].astype(float),
             "avg_compensation_amount": 0,  # 기본값
             "case_count": 0,  # 기본값
             "response_time_hours": 24,  # 기본값 24시간
@@ -126,26 +111,24 @@ class NomusaDataMigrator:
             "is_verified": True,  # 모든 nomusa 데이터는 인증된 것으로 처리
             "is_active": True,
             # 새로 추가된 nomusa 필드들
-            "phone": nomusa_item.get("contact_phone", ""),
-            "fee_policy": nomusa_item.get("fee_policy", ""),
-            "is_online_consult": is_online_available,
-            "website_url": nomusa_item.get("website_url", ""),
-            "supports_sanzero_pay": nomusa_item.get("do_sanzeropay", [None])[0] == "가능" if nomusa_item.get("do_sanzeropay") else False,
-            "case_difficulty": nomusa_item.get("case_difficulty", "중"),
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
-        }
+            "phone": df.get("contact_phone", pd.Series([""] * count)).fillna(""),
+            "fee_policy": fee_policy,
+            "is_online_consult": first_list_item("is_online_consult"),
+            "website_url": df.get("website_url", pd.Series([""] * count)).fillna(""),
+            "supports_sanzero_pay": first_list_item("do_sanzeropay"),
+            "case_difficulty": df.get("case_difficulty", pd.Series(["중"] * count)).fillna("중"),
+            "created_at": now_iso,
+            "updated_at": now_iso
+        })
+
+        return converted.to_dict(orient="records")
 
     async def migrate_to_supabase(self, nomusa_data):
         """nomusa 데이터를 Supabase로 마이그레이션"""
 
-        # 1. 노무사 프로필 데이터 생성
+        # 1. 노무사 프로필 데이터 생성 (pandas 일괄 변환)
         print("🔄 노무사 프로필 데이터 생성 중...")
-        lawyers_data = []
-
-        for i, nomusa_item in enumerate(nomusa_data):
-            lawyer_data = self.convert_nomusa_to_lawyer_data(nomusa_item, i)
-            lawyers_data.append(lawyer_data)
+        lawyers_data = self.convert_nomusa_dataframe(nomusa_data)
 
         print(f"✅ {len(lawyers_data)}개 노무사 데이터 변환 완료")
 
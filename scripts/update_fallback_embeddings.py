@@ -8,9 +8,11 @@ import sys
 import os
 import asyncio
 import hashlib
-import math
+import re
 from pathlib import Path
 
+import numpy as np
+
 # 프로젝트 루트 경로를 sys.path에 추가
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
@@ -19,119 +21,324 @@ from app.utils.database import supabase
 from app.utils.security import security
 from loguru import logger
 
-def generate_fallback_embedding(text: str) -> list:
-    """Fallback 임베딩 생성 (ML 라이브러리 없이)"""
+# numba - 선택적 import (전체 컬럼 재생성용 배치 커널)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# blake3 해시 - 선택적 import (없으면 md5 유지)
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+
+def _content_digest(data: bytes) -> bytes:
+    """16바이트 내용 다이제스트 (blake3 우선 - SIMD로 md5보다 수 배 빠름)"""
+    if BLAKE3_AVAILABLE:
+        return blake3(data).digest(length=16)
+    return hashlib.md5(data).digest()
+
+
+# 다중 패턴 매칭 가속 - 선택적 import (없으면 정규식 경로 유지)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 일괄 업데이트 배치 크기
+UPDATE_BATCH_SIZE = 500
+
+
+async def _flush_embedding_batch(pairs: list) -> int:
+    """
+    (id, embedding) 배치를 일괄 반영
+
+    update_precedent_embeddings_bulk RPC(HTTP 1회)를 우선 사용하고,
+    함수가 없으면 per-row UPDATE로 폴백해 성공 건수를 반환합니다.
+    (id만 들어간 upsert는 NOT NULL 컬럼 때문에 INSERT 단계에서 실패하므로
+    채택하지 않음 - precedents.title/summary/case_number가 NOT NULL)
+    """
+    if not pairs:
+        return 0
+
+    # 1차: json_to_recordset 기반 단일 set UPDATE
+    # (json 인자는 PostgREST를 통한 vector[] 배열 전달보다 견고)
     try:
-        # 텍스트 전처리
-        cleaned_text = security.sanitize_text(text)
-        if not cleaned_text.strip():
-            return [0.0] * 1536
-
-        # 간단한 특징 벡터 생성 (384차원)
-        features = []
+        payload = [{"id": pid, "emb": emb, "hash": content_hash}
+                   for pid, emb, content_hash in pairs]
+        response = await asyncio.to_thread(
+            lambda body=payload: supabase.rpc(
+                "bulk_update_embeddings", {"payload": body}).execute()
+        )
+        updated = int(response.data) if response.data is not None else len(pairs)
+        logger.info(f"✅ 일괄 업데이트 완료: {updated}건")
+        return updated
+    except Exception as e:
+        logger.warning(f"json 일괄 업데이트 실패 ({e}), 배열 RPC로 폴백")
 
-        # 1. 텍스트 길이 특징
-        features.append(len(cleaned_text) / 1000.0)
+    # 2차: 배열 인자 RPC
+    try:
+        response = await asyncio.to_thread(
+            lambda rows=pairs: supabase.rpc(
+                "update_precedent_embeddings_bulk",
+                {"ids": [pid for pid, _, _ in rows],
+                 "embs": [emb for _, emb, _ in rows],
+                 "hashes": [content_hash for _, _, content_hash in rows]}
+            ).execute()
+        )
+        updated = int(response.data) if response.data is not None else len(pairs)
+        logger.info(f"✅ 일괄 업데이트 완료: {updated}건")
+        return updated
+    except Exception as e:
+        logger.warning(f"일괄 업데이트 실패 ({e}), per-row 경로로 폴백")
+
+    # per-row 폴백도 직렬 대기 대신 세마포어로 묶어 동시 실행
+    semaphore = asyncio.Semaphore(16)
+
+    async def update_one(precedent_id: str, embedding: list, content_hash: str) -> bool:
+        async with semaphore:
+            try:
+                response = await asyncio.to_thread(
+                    _do_update, precedent_id, embedding, content_hash)
+                return bool(response.data)
+            except Exception as e:
+                logger.error(f"❌ 판례 {precedent_id} 업데이트 오류: {e}")
+                return False
+
+    results = await asyncio.gather(
+        *(update_one(pid, emb, content_hash) for pid, emb, content_hash in pairs))
+    return sum(1 for result in results if result)
+
+
+def _do_update(precedent_id: str, embedding: list, content_hash: str):
+    """단건 임베딩 UPDATE (명시적 인자 - 루프 변수 클로저 캡처 방지)"""
+    return (supabase.table("precedents")
+            .update({"embedding": embedding, "content_hash": content_hash})
+            .eq("id", precedent_id)
+            .execute())
+
+# 임베딩 차원 (OpenAI text-embedding-ada-002 호환)
+TARGET_DIM = 1536
+
+# 키워드 기반 특징 (산재 관련)
+KEYWORDS = [
+    '산업재해', '산재', '사고', '부상', '절단', '골절', '화상', '타박상',
+    '제조업', '건설업', '서비스업', '기계', '안전', '보상금', '승인', '거부',
+    '병원', '치료', '수술', '재활', '장해', '등급', '노무사', '상담',
+    '프레스', '추락', '화학', '물류', '식당', '주방', '허리', '디스크'
+]
+
+# 특징 구간: [0] 길이, [1:17] 해시, [17:49] 키워드, [49:] 고정 패딩 패턴
+_HASH_OFFSET = 1
+_KEYWORD_OFFSET = _HASH_OFFSET + 16
+_PAD_OFFSET = _KEYWORD_OFFSET + len(KEYWORDS)
+
+# 패딩 꼬리는 입력과 무관한 상수이므로 모듈 로드 시 한 번만 생성
+_TEMPLATE = np.zeros(TARGET_DIM, dtype=np.float32)
+_TEMPLATE[_PAD_OFFSET:] = 0.1 * (np.arange(TARGET_DIM - _PAD_OFFSET) % 10)
+
+# 키워드 존재 검사를 32회 substring 스캔 대신 단일 정규식 패스로
+# lookahead로 겹치는 매치('골절단'의 골절+절단 등)도 원래의 per-keyword
+# substring 검사와 동일하게 잡음
+_KEYWORD_RE = re.compile("(?=(" + "|".join(map(re.escape, KEYWORDS)) + "))")
+_KEYWORD_INDEX = {keyword: i for i, keyword in enumerate(KEYWORDS)}
+
+# pyahocorasick이 있으면 정규식 대신 DFA 오토마톤으로 스캔 (겹침 포함 선형)
+if AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _i, _keyword in enumerate(KEYWORDS):
+        _KEYWORD_AUTOMATON.add_word(_keyword, _i)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+
+def _keyword_indices(cleaned_text: str):
+    """본문 1회 스캔으로 등장한 키워드 인덱스 집합 반환"""
+    if _KEYWORD_AUTOMATON is not None:
+        return {index for _, index in _KEYWORD_AUTOMATON.iter(cleaned_text)}
+    return {_KEYWORD_INDEX[keyword]
+            for keyword in _KEYWORD_RE.findall(cleaned_text)}
+
+# 해시 바이트 → [0,1] 스케일 상수
+_INV_255 = np.float32(1.0 / 255.0)
 
-        # 2. 해시 기반 특징 (안전한 방식)
-        hash_obj = hashlib.md5(cleaned_text.encode())
-        hash_bytes = hash_obj.digest()
 
-        # 16바이트 해시에서 안전하게 특징 추출
-        for i in range(min(16, len(hash_bytes))):
-            features.append((hash_bytes[i] % 256) / 255.0)
+def generate_fallback_embedding(text: str) -> list:
+    """Fallback 임베딩 생성 (ML 라이브러리 없이)
 
-        # 3. 키워드 기반 특징 (산재 관련)
-        keywords = [
-            '산업재해', '산재', '사고', '부상', '절단', '골절', '화상', '타박상',
-            '제조업', '건설업', '서비스업', '기계', '안전', '보상금', '승인', '거부',
-            '병원', '치료', '수술', '재활', '장해', '등급', '노무사', '상담',
-            '프레스', '추락', '화학', '물류', '식당', '주방', '허리', '디스크'
-        ]
+    특징 벡터를 파이썬 append 1500여 번으로 쌓는 대신, 상수 패딩이
+    미리 채워진 템플릿을 복사해 길이/해시/키워드 구간만 덮어씁니다.
+    """
+    try:
+        # 텍스트 전처리
+        cleaned_text = security.sanitize_text(text)
+        if not cleaned_text.strip():
+            return [0.0] * TARGET_DIM
 
-        for keyword in keywords:
-            features.append(1.0 if keyword in cleaned_text else 0.0)
+        vector = _TEMPLATE.copy()
 
-        # 4. 나머지 차원을 0으로 안전하게 패딩
-        target_dim = 1536  # OpenAI text-embedding-ada-002 차원
-        current_len = len(features)
+        # UTF-8 인코딩은 한 번만 수행해 해시 경로에 재사용
+        encoded = cleaned_text.encode('utf-8')
 
-        # 간단한 패딩
-        for i in range(target_dim - current_len):
-            features.append(0.1 * (i % 10))  # 간단한 패턴
+        # 1. 텍스트 길이 특징 (문자 수 기준 - 바이트 길이로 바꾸면
+        #    기존에 저장된 모든 벡터와 어긋나므로 유지)
+        vector[0] = len(cleaned_text) / 1000.0
 
-        # 정확히 1536차원으로 자르기
-        result = features[:target_dim]
+        # 2. 해시 기반 특징 (16바이트를 벡터화 연산 한 번으로)
+        hash_bytes = _content_digest(encoded)
+        vector[_HASH_OFFSET:_KEYWORD_OFFSET] = (
+            np.frombuffer(hash_bytes, dtype=np.uint8) * _INV_255)
 
-        # 차원 확인
-        if len(result) != target_dim:
-            logger.error(f"임베딩 차원 오류: {len(result)} != {target_dim}")
-            return [0.0] * target_dim
+        # 3. 키워드 기반 특징 (산재 관련) - 본문 1회 스캔
+        for index in _keyword_indices(cleaned_text):
+            vector[_KEYWORD_OFFSET + index] = 1.0
 
-        return result
+        return vector.tolist()
 
     except Exception as e:
         logger.error(f"임베딩 생성 오류: {e}")
-        return [0.0] * 1536
+        return [0.0] * TARGET_DIM
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _build_batch_kernel(digests, masks, lens, template, out):
+        """배치 전체를 병렬로 채우는 커널 (행당 파이썬 프레임 제거)"""
+        n_rows = out.shape[0]
+        for i in prange(n_rows):
+            out[i, :] = template
+            out[i, 0] = lens[i] / 1000.0
+            for j in range(digests.shape[1]):
+                out[i, 1 + j] = digests[i, j] / 255.0
+            for j in range(masks.shape[1]):
+                out[i, _KEYWORD_OFFSET + j] = masks[i, j]
+
+
+def generate_fallback_embeddings_batch(texts: list) -> list:
+    """텍스트 배치의 fallback 임베딩 일괄 생성
+
+    파이썬 전처리(정제/해시/키워드 스캔)로 (N,16) 다이제스트,
+    (N,32) 키워드 마스크, (N,) 길이 배열을 만든 뒤, numba가 있으면
+    병렬 커널로, 없으면 numpy 브로드캐스트로 (N,1536)을 한 번에 채웁니다.
+    """
+    count = len(texts)
+    if count == 0:
+        return []
+
+    digests = np.zeros((count, 16), dtype=np.uint8)
+    masks = np.zeros((count, len(KEYWORDS)), dtype=np.float32)
+    lens = np.zeros(count, dtype=np.float32)
+    valid = np.zeros(count, dtype=bool)
+
+    for i, text in enumerate(texts):
+        cleaned = security.sanitize_text(text)
+        if not cleaned.strip():
+            continue
+        valid[i] = True
+        lens[i] = len(cleaned)
+        digests[i] = np.frombuffer(
+            _content_digest(cleaned.encode('utf-8')), dtype=np.uint8)
+        for index in _keyword_indices(cleaned):
+            masks[i, index] = 1.0
+
+    out = np.empty((count, TARGET_DIM), dtype=np.float32)
+    if NUMBA_AVAILABLE:
+        _build_batch_kernel(digests, masks, lens, _TEMPLATE, out)
+    else:
+        out[:] = _TEMPLATE
+        out[:, 0] = lens / 1000.0
+        out[:, _HASH_OFFSET:_KEYWORD_OFFSET] = digests * _INV_255
+        out[:, _KEYWORD_OFFSET:_PAD_OFFSET] = masks
+
+    out[~valid] = 0.0
+    return out.tolist()
+
 
 async def update_precedent_embeddings():
     """모든 판례에 대해 fallback 임베딩 생성 및 업데이트"""
     logger.info("=== 판례 Fallback 임베딩 업데이트 시작 ===")
 
     try:
-        # 임베딩이 없는 판례들 조회
-        response = await asyncio.to_thread(
-            lambda: supabase.table("precedents")
-            .select("id, title, summary")
-            .is_("embedding", "null")
-            .eq("is_active", True)
-            .execute()
-        )
-
-        precedents = response.data
-        if not precedents:
+        # 임베딩이 없는 판례들을 페이지 단위로 조회
+        # (전체를 한 응답으로 받으면 큰 테이블에서 peak 메모리가 무제한.
+        #  처리된 행이 is null 필터에서 빠져나가므로 offset 대신 id keyset)
+        success_count = 0
+        skipped_count = 0
+        total_count = 0
+        batch = []
+        last_id = ""
+
+        while True:
+            def fetch(after_id=last_id):
+                query = (supabase.table("precedents")
+                         .select("id, title, summary, content_hash")
+                         .is_("embedding", "null")
+                         .eq("is_active", True)
+                         .order("id")
+                         .limit(1000))
+                if after_id:
+                    query = query.gt("id", after_id)
+                return query.execute()
+
+            response = await asyncio.to_thread(fetch)
+            precedents = response.data or []
+            if not precedents:
+                break
+
+            last_id = precedents[-1]["id"]
+
+            # 1단계: 해시 비교로 재생성 대상만 추림
+            pending = []
+            for precedent in precedents:
+                precedent_id = precedent["id"]
+                title = precedent.get("title", "")
+                summary = precedent.get("summary", "")
+                total_count += 1
+
+                logger.info(f"[{total_count}] 처리 중: {title[:50]}...")
+
+                # 임베딩할 텍스트 준비 (제목 + 요약)
+                embedding_text = f"{title}\n{summary}"
+
+                # 내용 해시가 저장값과 같으면 재계산/재업데이트 생략
+                # (fallback 임베딩은 이 텍스트의 순수 함수)
+                content_hash = _content_digest(embedding_text.encode()).hex()
+                if precedent.get("content_hash") == content_hash:
+                    skipped_count += 1
+                    continue
+
+                pending.append((precedent_id, embedding_text, content_hash))
+
+            # 2단계: 페이지 전체를 일괄 생성 (numba/numpy 배치 경로)
+            embeddings = generate_fallback_embeddings_batch(
+                [text for _, text, _ in pending])
+
+            for (precedent_id, _, content_hash), embedding in zip(pending, embeddings):
+                if embedding and len(embedding) == 1536:
+                    # per-row 왕복 대신 배치로 모아 일괄 반영
+                    batch.append((precedent_id, embedding, content_hash))
+                    if len(batch) >= UPDATE_BATCH_SIZE:
+                        success_count += await _flush_embedding_batch(batch)
+                        batch = []
+                else:
+                    logger.error(f"❌ 판례 {precedent_id} 임베딩 생성 실패")
+
+            if len(precedents) < 1000:
+                break
+
+        success_count += await _flush_embedding_batch(batch)
+
+        if total_count == 0:
             logger.info("업데이트할 판례가 없습니다.")
             return
 
-        logger.info(f"총 {len(precedents)}건의 판례를 처리합니다.")
-
-        success_count = 0
-        for i, precedent in enumerate(precedents, 1):
-            precedent_id = precedent["id"]
-            title = precedent.get("title", "")
-            summary = precedent.get("summary", "")
-
-            logger.info(f"[{i}/{len(precedents)}] 처리 중: {title[:50]}...")
-
-            # 임베딩할 텍스트 준비 (제목 + 요약)
-            embedding_text = f"{title}\n{summary}"
-
-            # Fallback 임베딩 생성
-            embedding = generate_fallback_embedding(embedding_text)
-
-            if embedding and len(embedding) == 1536:
-                # 데이터베이스 업데이트
-                try:
-                    update_response = await asyncio.to_thread(
-                        lambda: supabase.table("precedents")
-                        .update({"embedding": embedding})
-                        .eq("id", precedent_id)
-                        .execute()
-                    )
-
-                    if update_response.data:
-                        logger.info(f"✅ 판례 {precedent_id} 임베딩 업데이트 완료")
-                        success_count += 1
-                    else:
-                        logger.error(f"❌ 판례 {precedent_id} 업데이트 실패")
-
-                except Exception as e:
-                    logger.error(f"❌ 판례 {precedent_id} 업데이트 오류: {e}")
-            else:
-                logger.error(f"❌ 판례 {precedent_id} 임베딩 생성 실패")
-
         logger.info("=== 판례 임베딩 업데이트 완료 ===")
-        logger.info(f"성공: {success_count}건 / 전체: {len(precedents)}건")
+        logger.info(f"성공: {success_count}건 / 생략(해시 일치): {skipped_count}건 / 전체: {total_count}건")
 
         # 최종 확인
         await verify_embeddings()
@@ -140,17 +347,28 @@ async def update_precedent_embeddings():
         logger.error(f"스크립트 실행 오류: {e}")
 
 async def verify_embeddings():
-    """임베딩 생성 결과 확인"""
+    """임베딩 생성 결과 확인
+
+    개수만 필요하므로 embedding 벡터(행당 1536 float)를 전송하는 대신
+    서버측 count 집계 두 번(head=True - 본문 없음)으로 확인합니다.
+    """
     try:
-        response = await asyncio.to_thread(
+        total_response = await asyncio.to_thread(
+            lambda: supabase.table("precedents")
+            .select("id", count="exact", head=True)
+            .eq("is_active", True)
+            .execute()
+        )
+        with_response = await asyncio.to_thread(
             lambda: supabase.table("precedents")
-            .select("id, embedding")
+            .select("id", count="exact", head=True)
             .eq("is_active", True)
+            .not_.is_("embedding", "null")
             .execute()
         )
 
-        total_count = len(response.data)
-        with_embeddings = sum(1 for p in response.data if p.get("embedding"))
+        total_count = total_response.count or 0
+        with_embeddings = with_response.count or 0
 
         logger.info(f"📊 임베딩 생성 결과:")
         logger.info(f"  전체 판례: {total_count}건")
@@ -3,6 +3,7 @@
 Searcher 모듈 기능 테스트 스크립트
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -16,9 +17,11 @@ def test_searcher_loading():
     """Searcher 로딩 테스트"""
     print("🔍 Searcher 모듈 로딩 테스트 시작")
 
-    searcher = WorkInjuryCaseSearcher()
+    # 싱글톤 팩토리를 통해 로드 - 이후 테스트들이 같은 인스턴스를 재사용해
+    # 멀티-MB 모델을 두 번 로드하지 않음 (load_model은 멱등)
+    searcher = get_searcher()
 
-    # 모델 로딩
+    # 모델 로딩 (이미 로드됐으면 즉시 True)
     print("⏳ 모델 로딩 중...")
     success = searcher.load_model()
 
@@ -55,20 +58,30 @@ def test_search(searcher):
         "프레스 작업 손목"
     ]
 
-    for query in test_queries:
+    # 검색은 동기 함수지만 희소 행렬 곱이 BLAS에서 GIL을 놓으므로
+    # 스레드로 띄우면 쿼리 4개가 코어를 나눠 실제로 병렬 실행됨
+    async def _run_all():
+        return await asyncio.gather(
+            *(asyncio.to_thread(searcher.search, query, 3)
+              for query in test_queries),
+            return_exceptions=True
+        )
+
+    all_results = asyncio.run(_run_all())
+
+    for query, results in zip(test_queries, all_results):
         print(f"\n🔎 검색 쿼리: '{query}'")
 
-        try:
-            results = searcher.search(query, top_k=3)
-            print(f"   📊 결과 수: {len(results)}개")
+        if isinstance(results, Exception):
+            print(f"   ❌ 검색 오류: {results}")
+            continue
 
-            for i, result in enumerate(results, 1):
-                print(f"   {i}. 유사도: {result.similarity:.3f}")
-                print(f"      제목: {result.title[:50]}...")
-                print(f"      법원: {result.court}")
+        print(f"   📊 결과 수: {len(results)}개")
 
-        except Exception as e:
-            print(f"   ❌ 검색 오류: {e}")
+        for i, result in enumerate(results, 1):
+            print(f"   {i}. 유사도: {result.similarity:.3f}")
+            print(f"      제목: {result.title[:50]}...")
+            print(f"      법원: {result.court}")
 
 def test_report_generation(searcher):
     """보고서 생성 테스트"""
@@ -96,7 +109,7 @@ def test_report_generation(searcher):
     except Exception as e:
         print(f"   ❌ 보고서 생성 오류: {e}")
 
-def test_singleton_pattern():
+def test_singleton_pattern(searcher):
     """싱글톤 패턴 테스트"""
     print("\n🔧 싱글톤 패턴 테스트")
 
@@ -107,6 +120,7 @@ def test_singleton_pattern():
         print(f"   📍 인스턴스 1 ID: {id(searcher1)}")
         print(f"   📍 인스턴스 2 ID: {id(searcher2)}")
         print(f"   ✅ 동일 인스턴스: {searcher1 is searcher2}")
+        print(f"   ✅ 로딩 테스트와 동일 인스턴스: {searcher is searcher1}")
 
         # 로딩 상태 확인
         print(f"   📊 로딩 상태: {searcher1.is_loaded}")
@@ -127,6 +141,6 @@ if __name__ == "__main__":
     test_report_generation(searcher)
 
     # 4. 싱글톤 테스트
-    test_singleton_pattern()
+    test_singleton_pattern(searcher)
 
     print("\n🎉 테스트 완료!")
\ No newline at end of file
@@ -0,0 +1,46 @@
+-- 판례 임베딩 일괄 업데이트 RPC
+-- generate_embeddings.py가 배치당 1회 호출 (per-row PATCH N회 → RPC 1회)
+-- Supabase SQL 에디터에서 실행해주세요.
+
+CREATE OR REPLACE FUNCTION update_precedent_embeddings_bulk(
+    ids uuid[],
+    embs vector[],
+    hashes text[] DEFAULT NULL
+)
+RETURNS integer AS $$
+DECLARE
+    updated_count integer;
+BEGIN
+    UPDATE precedents AS p
+    SET embedding = v.emb,
+        content_hash = COALESCE(v.hash, p.content_hash),
+        updated_at = NOW()
+    FROM unnest(ids, embs,
+                COALESCE(hashes, array_fill(NULL::text, ARRAY[array_length(ids, 1)])))
+         AS v(id, emb, hash)
+    WHERE p.id = v.id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- JSON 페이로드 변형: PostgREST가 커스텀 타입 배열(vector[])보다
+-- json 인자를 안정적으로 전달하므로 스크립트는 이 함수를 우선 호출
+CREATE OR REPLACE FUNCTION bulk_update_embeddings(payload json)
+RETURNS integer AS $$
+    WITH src AS (
+        SELECT * FROM json_to_recordset(payload)
+            AS x(id uuid, emb float4[], hash text)
+    ),
+    updated AS (
+        UPDATE precedents AS p
+        SET embedding = src.emb::vector,
+            content_hash = COALESCE(src.hash, p.content_hash),
+            updated_at = NOW()
+        FROM src
+        WHERE p.id = src.id
+        RETURNING 1
+    )
+    SELECT COUNT(*)::integer FROM updated;
+$$ LANGUAGE sql;